@@ -121,7 +121,7 @@ class ApplicationWindow(Gtk.ApplicationWindow):
         # Add Attributes
         self.viewport = None
         self.viewport_margin = 20
-        self.display_file = DisplayFile()
+        self.display_file = DisplayFile(packed=True)
         # Add Click Support for Canvas
         self.drag_coords = None
         self.widget_canvas.add_events(
@@ -329,7 +329,7 @@ class ApplicationWindow(Gtk.ApplicationWindow):
             return
         # Get Distance
         distance: float = value
-        self.viewport.window.perspective_distance = distance
+        self.viewport.window.set_perspective_distance(distance)
         # Force Redraw
         self.widget_canvas.queue_draw()
     # Zoom Handlers
@@ -539,17 +539,24 @@ class ApplicationWindow(Gtk.ApplicationWindow):
         self.viewport.window.cliping_methods[ObjectType.POINT_2D] = (
             clip_method if clip_method is EClippingMethod.NONE else EClippingMethod.POINT_CLIP
         )
-        # Line
-        self.viewport.window.cliping_methods[ObjectType.LINE_2D] = clip_method
-        self.viewport.window.cliping_methods[ObjectType.BEZIER_2D] = clip_method
-        self.viewport.window.cliping_methods[ObjectType.BEZIER_3D] = clip_method
-        self.viewport.window.cliping_methods[ObjectType.BSPLINE_3D] = clip_method
+        # Line (Sutherland-Hodgman Only Clips Polygons - Lines Use Cohen-Sutherland)
+        line_clip_method = (
+            EClippingMethod.LINE_COHEN_SUTHERLAND
+            if clip_method is EClippingMethod.POLY_SUTHERLAND_HODGMAN
+            else clip_method
+        )
+        self.viewport.window.cliping_methods[ObjectType.LINE_2D] = line_clip_method
+        self.viewport.window.cliping_methods[ObjectType.BEZIER_2D] = line_clip_method
+        self.viewport.window.cliping_methods[ObjectType.BEZIER_3D] = line_clip_method
+        self.viewport.window.cliping_methods[ObjectType.BSPLINE_3D] = line_clip_method
         # Wireframes
         self.viewport.window.cliping_methods[ObjectType.WIREFRAME_2D] = (
             EClippingMethod.POLY_WEILER_ATHERTON_WITH_CS
             if clip_method is EClippingMethod.LINE_COHEN_SUTHERLAND
             else EClippingMethod.POLY_WEILER_ATHERTON_WITH_LB
             if clip_method is EClippingMethod.LINE_LIANG_BARSKY
+            else EClippingMethod.POLY_SUTHERLAND_HODGMAN
+            if clip_method is EClippingMethod.POLY_SUTHERLAND_HODGMAN
             else EClippingMethod.NONE
         )
         self.viewport.window.cliping_methods[ObjectType.OBJECT_2D] = (
@@ -557,6 +564,17 @@ class ApplicationWindow(Gtk.ApplicationWindow):
             if clip_method is EClippingMethod.LINE_COHEN_SUTHERLAND
             else EClippingMethod.POLY_WEILER_ATHERTON_WITH_LB
             if clip_method is EClippingMethod.LINE_LIANG_BARSKY
+            else EClippingMethod.POLY_SUTHERLAND_HODGMAN
+            if clip_method is EClippingMethod.POLY_SUTHERLAND_HODGMAN
+            else EClippingMethod.NONE
+        )
+        self.viewport.window.cliping_methods[ObjectType.MESH_2D] = (
+            EClippingMethod.POLY_WEILER_ATHERTON_WITH_CS
+            if clip_method is EClippingMethod.LINE_COHEN_SUTHERLAND
+            else EClippingMethod.POLY_WEILER_ATHERTON_WITH_LB
+            if clip_method is EClippingMethod.LINE_LIANG_BARSKY
+            else EClippingMethod.POLY_SUTHERLAND_HODGMAN
+            if clip_method is EClippingMethod.POLY_SUTHERLAND_HODGMAN
             else EClippingMethod.NONE
         )
         # Force Redraw
@@ -1,12 +1,14 @@
 from __future__ import annotations
 # from itertools import chain
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING, Tuple
 from math import ceil, comb
-from itertools import chain
-from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_line, liang_barsky_clip_line
+from numpy import arange, array, bool_, empty, float64, linspace
+from numpy.typing import NDArray
+from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_lines, edges_into_breaks, liang_barsky_clip_polyline, polyline_into_edges, runs_into_breaks
+from primitives.curve_tessellation import adaptive_bezier_flatten, bezier_into_cubic_spans, classify_span_hulls, clip_cubic_spans
 from primitives.graphical_object import GraphicalObject
 from objects.object_type import ObjectType
-from primitives.matrix import Vector2, Matrix
+from primitives.matrix import Vector2, Matrix, array_into_vec2_list, transform_points, vec2_list_into_array
 if TYPE_CHECKING:
     from cairo import Context
     from primitives.matrix import Matrix
@@ -15,172 +17,249 @@ def bezier_math_blending_function(step: float, *point_prs: float) -> float:
     n = len(point_prs) - 1
     return sum([pb * (comb(n, i) * (step ** i) * ((1 - step) ** (n - i))) for i, pb in enumerate(point_prs)], 0)
 
+# Define Bernstein Basis Cache ((Degree, Samples) -> (Samples, Degree + 1) Matrix)
+BERNSTEIN_BASIS_CACHE: Dict[Tuple[int, int], NDArray[float64]] = {}
+# Above this Degree the Binomial Coefficients Lose Precision - Use de Casteljau Instead
+BERNSTEIN_MAX_DEGREE = 32
+
+def bernstein_basis(degree: int, samples: int) -> NDArray[float64]:
+    # Build Matrix Only Once per (Degree, Samples) Pair
+    key = (degree, samples)
+    basis = BERNSTEIN_BASIS_CACHE.get(key)
+    if basis is None:
+        steps = linspace(0, 1, samples).reshape((-1, 1))
+        indexes = arange(degree + 1)
+        coefficients = array([comb(degree, i) for i in range(degree + 1)], dtype=float64)
+        basis = coefficients * (steps ** indexes) * ((1 - steps) ** (degree - indexes))
+        BERNSTEIN_BASIS_CACHE[key] = basis
+    return basis
+
+def de_casteljau_evaluate(control_points: NDArray[float64], samples: int) -> NDArray[float64]:
+    # Reduce Control Polygon for All Samples at Once ((Samples, N, D) -> (Samples, D))
+    steps = linspace(0, 1, samples).reshape((-1, 1, 1))
+    points = control_points[None, :, :]
+    while points.shape[1] > 1:
+        points = ((1 - steps) * points[:, :-1]) + (steps * points[:, 1:])
+    return points[:, 0]
+
+def bezier_evaluate(control_points: NDArray[float64], samples: int) -> NDArray[float64]:
+    # Evaluate Curve as a Single (Samples x N) @ (N x D) Product
+    degree = control_points.shape[0] - 1
+    if degree > BERNSTEIN_MAX_DEGREE:
+        return de_casteljau_evaluate(control_points, samples)
+    return bernstein_basis(degree, samples) @ control_points
+
 class Bezier2D(GraphicalObject):
     # Define Constructor
-    def __init__(self, accuracy_step: float, *control_points: Vector2) -> None:
+    def __init__(self, accuracy_step: float, *control_points: Vector2 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
-        # Define Attributes
+        # Define Attributes (Stored as (N, 2) Arrays)
         self.accuracy = accuracy_step
-        self.control_points = list(control_points)
-        self.render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.control_points = vec2_list_into_array(control_points)
+        # Define Tessellation Cache (Polyline of the Persisted Control Points - None When Stale)
+        self.tolerance: float | None = None
+        self.tessellation: NDArray[float64] | None = None
+        self.render_points = self.__get_tessellation()
+        # Define Render Path Breaks (Points Starting a New Path after Clipping - None for a Single Path)
+        self.render_breaks: NDArray[bool_] | None = None
         # Define Pipeline Attributes
         self.pipeline_control_points = self.control_points
+        self.pipeline_tessellation = self.render_points
         self.pipeline_render_points = self.render_points
+        self.pipeline_render_breaks: NDArray[bool_] | None = None
+        # Define Native Rendering (Cubic Spans Drawn with curve_to Instead of the Tessellation)
+        self.native = False
+        self.pipeline_curve_spans: NDArray[float64] | None = None
+        self.pipeline_curve_breaks: NDArray[bool_] | None = None
     # Private Methods
-    def __compute_poly_line_points(self, accuracy: float, control_points: List[Vector2]) -> List[Vector2]:
-        # Compute Number of Polygons 
+    def __compute_poly_line_points(self, accuracy: float, control_points: NDArray[float64]) -> NDArray[float64]:
+        # Adaptive Mode - Subdivide Until Flat Within the Tolerance
+        if self.tolerance is not None:
+            return adaptive_bezier_flatten(control_points, self.tolerance)
+        # Compute Number of Polygons
         required_points_ammount = ceil(accuracy ** -1) - 1
-        # Unzip Control Points List
-        controls_x, controls_y = zip(*[p.as_tuple() for p in control_points])
         # Compute Render Points
-        points = [
-            Vector2(
-                bezier_math_blending_function(it/(required_points_ammount - 1), *controls_x),
-                bezier_math_blending_function(it/(required_points_ammount - 1), *controls_y)
-            )
-            for it in range(0, required_points_ammount)
-        ]
-        # Return Computed Points
-        return points
+        return bezier_evaluate(control_points, required_points_ammount)
     # Type Definition
     @staticmethod
     def get_type() -> ObjectType:
         return ObjectType.BEZIER_2D
     # Define Pipeline Methods
     def pipeline(self):
-        # Reset Pipeline Points
+        # Reset Pipeline Points (Reusing the Cached Tessellation)
         self.pipeline_control_points = self.control_points
-        self.pipeline_render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        # Native Curves Skip the Tessellation (No Spans when the Curve has no Cubic Form)
+        self.pipeline_curve_spans = self.__compute_curve_spans(self.control_points) if self.native else None
+        if self.pipeline_curve_spans is None:
+            self.pipeline_tessellation = self.__get_tessellation()
+        else:
+            self.pipeline_tessellation = empty((0, 2), dtype=float64)
+            self.pipeline_curve_breaks = arange(self.pipeline_curve_spans.shape[0]) == 0
+        self.pipeline_render_points = self.pipeline_tessellation
+        self.pipeline_render_breaks = None
         # Call Super
         super().pipeline()
     def pipeline_apply(self):
         if self.in_pipeline:
             # Persist Pipeline Points
             self.control_points = self.pipeline_control_points
+            self.tessellation = self.pipeline_tessellation if self.pipeline_curve_spans is None else None
             self.render_points = self.pipeline_render_points
+            self.render_breaks = self.pipeline_render_breaks
             # Call Super
             super().pipeline_apply()
+            # Native Curves were not Tessellated - Evaluate Persisted Curve
+            if self.tessellation is None:
+                self.__set_render_points(self.__get_tessellation(), None)
 
-    def __get_controls_points(self) -> List[Vector2]:
+    def __get_controls_points(self) -> NDArray[float64]:
         return self.pipeline_control_points if self.in_pipeline else self.control_points
-    def __get_render_points(self) -> List[Vector2]:
+    def __get_render_points(self) -> NDArray[float64]:
         return self.pipeline_render_points if self.in_pipeline else self.render_points
+    def __get_render_breaks(self) -> NDArray[bool_] | None:
+        return self.pipeline_render_breaks if self.in_pipeline else self.render_breaks
+    def __set_render_points(self, points: NDArray[float64], breaks: NDArray[bool_] | None) -> None:
+        if self.in_pipeline:
+            (self.pipeline_render_points, self.pipeline_render_breaks) = (points, breaks)
+        else:
+            (self.render_points, self.render_breaks) = (points, breaks)
+    def __get_tessellation(self) -> NDArray[float64]:
+        if self.in_pipeline:
+            return self.pipeline_tessellation
+        # Evaluate Curve Only When Control Points or Accuracy Changed
+        if self.tessellation is None:
+            self.tessellation = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        return self.tessellation
+    # Define Accuracy
+    def get_accuracy(self) -> float:
+        return self.accuracy
+    def set_accuracy(self, accuracy_step: float) -> None:
+        # Invalidate Tessellation
+        self.accuracy = accuracy_step
+        self.tessellation = None
+        # Re-Evaluate Persisted Curve
+        self.invalidate_bounding_box()
+        (self.render_points, self.render_breaks) = (self.__get_tessellation(), None)
+    # Define Native Rendering
+    def get_native_rendering(self) -> bool:
+        return self.native
+    def set_native_rendering(self, enabled: bool) -> None:
+        self.native = enabled
+    def __compute_curve_spans(self, control_points: NDArray[float64]) -> NDArray[float64] | None:
+        return bezier_into_cubic_spans(control_points)
+    def __get_curve_spans(self) -> NDArray[float64] | None:
+        return self.pipeline_curve_spans if self.in_pipeline else None
+    # Define Level of Detail
+    def set_tessellation_tolerance(self, tolerance: float | None) -> None:
+        # Invalidate Tessellation Only When the Tolerance Changed
+        if tolerance != self.tolerance:
+            self.tolerance = tolerance
+            self.tessellation = None
+            # Re-Evaluate Persisted Curve
+            (self.render_points, self.render_breaks) = (self.__get_tessellation(), None)
+    # Define Vector View
+    def get_control_points(self) -> List[Vector2]:
+        return array_into_vec2_list(self.__get_controls_points())
     # Define Methods
     def draw(self, cairo: Context):
-        # Get Points
-        points = self.__get_render_points()
-        # Cast points into homogeneus space
-        homo2d_points = [point.as_tuple() for point in points]
+        # Draw Native Cubic Spans
+        curve_spans = self.__get_curve_spans()
+        if curve_spans is not None and self.pipeline_curve_breaks is not None:
+            # Set Color
+            cairo.set_source_rgba(*self.color)
+            for (((x0, y0), (x1, y1), (x2, y2), (x3, y3)), new_path) in zip(curve_spans.tolist(), self.pipeline_curve_breaks.tolist()):
+                if new_path:
+                    cairo.move_to(x0, y0)
+                cairo.curve_to(x1, y1, x2, y2, x3, y3)
+            cairo.stroke()
+            return
+        # Get Points (Clipped Curves Restart the Path at Each Visible Run)
+        render_points = self.__get_render_points()
+        render_breaks = self.__get_render_breaks()
+        new_paths = (arange(render_points.shape[0]) == 0) if render_breaks is None else render_breaks
         # Set Color
         cairo.set_source_rgba(*self.color)
         # Draw line in canvas
-        for idx, (x, y) in  enumerate(homo2d_points):
-            if idx == 0:
+        for ((x, y), new_path) in zip(render_points.tolist(), new_paths.tolist()):
+            if new_path:
                 cairo.move_to(x, y)
             else:
                 cairo.line_to(x, y)
         cairo.stroke()
-    
+
     def transform(self, transformation: Matrix):
         # Transform points
         if self.in_pipeline:
-            # Pipeline
-            self.pipeline_control_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.pipeline_control_points
-            ]
-            self.pipeline_render_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.pipeline_render_points
-            ]
+            # Pipeline (Cached Tessellation Follows the Control Points - Curves are Affine Invariant)
+            shared = self.pipeline_render_points is self.pipeline_tessellation
+            self.pipeline_control_points = transform_points(self.pipeline_control_points, transformation)
+            self.pipeline_tessellation = transform_points(self.pipeline_tessellation, transformation)
+            self.pipeline_render_points = self.pipeline_tessellation if shared else transform_points(self.pipeline_render_points, transformation)
+            if self.pipeline_curve_spans is not None:
+                self.pipeline_curve_spans = transform_points(self.pipeline_curve_spans.reshape((-1, 2)), transformation).reshape((-1, 4, 2))
         else:
-            # Raw Transform
-            self.control_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.control_points
-            ]
-            self.render_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.render_points
-            ]
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            shared = self.render_points is self.tessellation
+            self.control_points = transform_points(self.control_points, transformation)
+            self.tessellation = None if self.tessellation is None else transform_points(self.tessellation, transformation)
+            self.render_points = self.tessellation if shared else transform_points(self.render_points, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Control Points Bound the Curve at Any Tessellation (Convex Hull Property)
+        return self.control_points
+
     def get_center_coords(self) -> Vector2:
-        # Get Points
-        points = self.__get_controls_points()
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector2(0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec2()
+        (x, y) = self.__get_controls_points().mean(axis=0).tolist()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
-        # Get Control Points
-        control_points = self.__get_controls_points()
-        # Compute Dist Between 0 and 1
-        # Get Render Points
-        render_points = self.__compute_poly_line_points(self.accuracy, control_points)
+        # Native Curves - Clip by the Spans Control Polygons
+        curve_spans = self.__get_curve_spans()
+        if curve_spans is not None:
+            if method == EClippingMethod.NONE:
+                return self
+            (self.pipeline_curve_spans, self.pipeline_curve_breaks) = clip_cubic_spans(curve_spans)
+            return self if self.pipeline_curve_spans.shape[0] > 0 else None
+        # Get Render Points (Cached Tessellation)
+        render_points_array = self.__get_tessellation()
+        # Cull by the Control Hull (Only Curves Crossing the Border are Clipped)
+        (inside, crossing) = classify_span_hulls(self.__get_controls_points()[None])
+        if method != EClippingMethod.NONE and not crossing[0]:
+            # Check if needed to render
+            if not inside[0]:
+                return None
+            # Update Internal Data
+            self.__set_render_points(render_points_array, None)
+            return self
         # Switch Method
         if method == EClippingMethod.LINE_COHEN_SUTHERLAND:
-            # Clip Using Cohen Sutherland
-            clipped_points = list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points[0:-1])
-                        if (
-                            clipped_edge := cohen_sutherland_clip_line(
-                                point,
-                                render_points[(idx + 1) % len(render_points)]
-                            )
-                        ) is not None
-                    ]
-                )
-            )
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Cohen Sutherland (All Segments at Once)
+            (clipped_edges, visible) = cohen_sutherland_clip_lines(polyline_into_edges(render_points_array))
             # Check if needed to render
-            if len(clipped_points) == 0:
+            if not visible.any():
                 return None
-            # Update Internal Data
-            if self.in_pipeline:
-                self.pipeline_render_points = clipped_points
-            else:
-                self.render_points = clipped_points
+            # Update Internal Data (Gaps Between Visible Segments Start New Paths)
+            visible_edges = clipped_edges[visible]
+            self.__set_render_points(visible_edges.reshape((-1, 2)), edges_into_breaks(visible_edges))
             # Process First Point
             return self
         elif method == EClippingMethod.LINE_LIANG_BARSKY:
-            # Clip Using Cohen Sutherland
-            clipped_points = list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points[0:-1])
-                        if (
-                            clipped_edge := liang_barsky_clip_line(
-                                point,
-                                render_points[(idx + 1) % len(render_points)]
-                            )
-                        ) is not None
-                    ]
-                )
-            )
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Liang Barsky (Whole Polyline at Once)
+            (clipped_points, runs) = liang_barsky_clip_polyline(render_points_array)
             # Check if needed to render
-            if len(clipped_points) == 0:
+            if runs.shape[0] == 0:
                 return None
-            # Update Internal Data
-            if self.in_pipeline:
-                self.pipeline_render_points = clipped_points
-            else:
-                self.render_points = clipped_points
+            # Update Internal Data (Runs are Stored Sequentially, Each Starting a New Path)
+            self.__set_render_points(clipped_points, runs_into_breaks(runs, clipped_points.shape[0]))
             # Process First Point
             return self
         else:
             # Update Internal Data
-            self.pipeline_render_points = render_points
+            self.__set_render_points(render_points_array, None)
             # Default - Trait as None Clipping
-            return self
\ No newline at end of file
+            return self
@@ -1,16 +1,14 @@
 from __future__ import annotations
 # from itertools import chain
-from typing import List, TYPE_CHECKING, cast
+from typing import List, TYPE_CHECKING
 from math import ceil
-from itertools import chain
 
-from numpy import array, float64
+from numpy import arange, array, bool_, concatenate, cumsum, einsum, float64, linspace, split, vstack, zeros
 from numpy.typing import NDArray
-from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_line, liang_barsky_clip_line
+from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_lines, liang_barsky_clip_polyline, polyline_into_edges
 from primitives.graphical_object import Graphical3DObject, GraphicalObject
 from objects.object_type import ObjectType
-from primitives.matrix import Vector2, Matrix, Vector3, Vector4
-from functools import reduce
+from primitives.matrix import Vector2, Matrix, Vector3, array_into_vec3_list, transform_points, vec3_list_into_array
 if TYPE_CHECKING:
     from cairo import Context
     from primitives.matrix import Matrix
@@ -24,49 +22,50 @@ class Bezier3D(Graphical3DObject):
         super().__init__()
         # Define Attributes
         self.accuracy = accuracy_step
-        self.accuracy_step_snd = self.accuracy if accuracy_step_snd == 0 else self.accuracy_step_snd
-        self.control_points: List[List[Vector3]] = list(control_points)
+        self.accuracy_step_snd = self.accuracy if accuracy_step_snd == 0 else accuracy_step_snd
+        # Patches are Stored as a (P, 4, 4, 3) Array
+        self.control_points: NDArray[float64] = array([vec3_list_into_array(patch) for patch in control_points], dtype=float64).reshape((-1, 4, 4, 3))
+        # Render Points are Stored as a (P, S, T, 3) Grid (Patches are Re-Evaluated Only When Flagged Dirty)
         self.render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.dirty_patches: NDArray[bool_] = zeros(self.control_points.shape[0], dtype=bool_)
         # Define Pipeline Attributes
         self.pipeline_control_points = self.control_points
         self.pipeline_render_points = self.render_points
         # print(len(self.render_points))
-        self.render_points_2d: List[List[Vector2]] = []
+        self.render_points_2d: List[NDArray[float64]] = []
     # Private Methods
-    def __compute_poly_line_points(self, accuracy: float, control_points: List[List[Vector3]]) -> List[List[Vector3]]:
-        def ext(a: List[List[Vector3]], n: List[List[Vector3]]) -> List[List[Vector3]]:
-            a.extend(n)
-            return a
-        return reduce(ext,[self.__compute_poly_line_points_section(accuracy, cpg) for cpg in control_points], cast(List[List[Vector3]],[]))
-    def __compute_poly_line_points_section(self, accuracy: float, control_points: List[Vector3]) -> List[List[Vector3]]:
-        # Compute Number of Polygons 
+    def __compute_poly_line_points(self, accuracy: float, control_points: NDArray[float64]) -> NDArray[float64]:
+        # Compute Number of Polygons
         required_points_ammount = ceil(accuracy ** -1) - 1
-        controls_x, controls_y, controls_z = zip(*[p.as_tuple() for p in control_points])
-        controls_x_e: NDArray[float64] = array(controls_x).reshape((4, 4))
-        controls_y_e: NDArray[float64] = array(controls_y).reshape((4, 4))
-        controls_z_e: NDArray[float64] = array(controls_z).reshape((4, 4))
-        GX = Matrix(controls_x_e)
-        GY = Matrix(controls_y_e)
-        GZ = Matrix(controls_z_e)
-        QM_X = MATRIX_BEZIER * GX * MATRIX_BEZIER
-        QM_Y = MATRIX_BEZIER * GY * MATRIX_BEZIER
-        QM_Z = MATRIX_BEZIER * GZ * MATRIX_BEZIER
-        points: List[List[Vector3]] = []
-        for si in range(required_points_ammount + 1):
-            s = si / required_points_ammount
-            S = Vector4(s**3, s**2, s, 1)
-            points.append([])
-            for ti in range(required_points_ammount + 1):
-                t = ti / required_points_ammount
-                T = Vector4(t**3, t**2, t, 1).as_transposed()
-
-                qst_x = (S * QM_X * T).lines()[0][0]
-                qst_y = (S * QM_Y * T).lines()[0][0]
-                qst_z = (S * QM_Z * T).lines()[0][0]
-
-                points[si].append(Vector3(qst_x, qst_y, qst_z))
+        # Define Power Basis Rows [s^3, s^2, s, 1] for Every Sample
+        steps = linspace(0, 1, required_points_ammount + 1).reshape((-1, 1))
+        basis: NDArray[float64] = steps ** arange(3, -1, -1)
+        # Compute Coefficients M . G . M of Every Patch and Coordinate ((P, 4, 4, 3))
+        coefficients = einsum("ab,pbcd,ce->paed", MATRIX_BEZIER_ARRAY, control_points, MATRIX_BEZIER_ARRAY)
+        # Evaluate S . Q . T over the Whole (S, T) Grid of Every Patch ((P, S, T, 3))
+        points: NDArray[float64] = einsum("sa,pabd,tb->pstd", basis, coefficients, basis)
         return points
 
+    def __update_tessellation(self) -> None:
+        # Re-Evaluate Only Patches whose Control Points Changed
+        if self.dirty_patches.any():
+            self.render_points[self.dirty_patches] = self.__compute_poly_line_points(self.accuracy, self.control_points[self.dirty_patches])
+            self.dirty_patches[:] = False
+            self.invalidate_bounding_box()
+    # Define Editing
+    def set_control_point(self, patch: int, line: int, column: int, point: Vector3) -> None:
+        # Update Persisted Control Point and Flag its Patch
+        self.control_points[patch, line, column] = point.as_tuple()
+        self.dirty_patches[patch] = True
+        self.invalidate_bounding_box()
+    def get_accuracy(self) -> float:
+        return self.accuracy
+    def set_accuracy(self, accuracy_step: float) -> None:
+        # Grid Size Changes - Re-Evaluate All Patches
+        self.accuracy = accuracy_step
+        self.render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.dirty_patches[:] = False
+        self.invalidate_bounding_box()
 
     # Type Definition
     @staticmethod
@@ -74,9 +73,10 @@ class Bezier3D(Graphical3DObject):
         return ObjectType.BEZIER_3D
     # Define Pipeline Methods
     def pipeline(self):
-        # Reset Pipeline Points
+        # Reset Pipeline Points (Cached Patches Follow Affine Transforms)
+        self.__update_tessellation()
         self.pipeline_control_points = self.control_points
-        self.pipeline_render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.pipeline_render_points = self.render_points
         self.render_points_2d = []
         # Call Super
         super().pipeline()
@@ -88,18 +88,27 @@ class Bezier3D(Graphical3DObject):
             # Call Super
             super().pipeline_apply()
 
-    def __get_controls_points(self) -> List[List[Vector3]]:
+    def __get_controls_points(self) -> NDArray[float64]:
         return self.pipeline_control_points if self.in_pipeline else self.control_points
-    def __get_render_points(self) -> List[List[Vector3]]:
+    def __get_render_points(self) -> NDArray[float64]:
         return self.pipeline_render_points if self.in_pipeline else self.render_points
-    def __get_2d_render_points(self) -> List[List[Vector2]]:
+    def __get_2d_render_points(self) -> List[NDArray[float64]]:
         return self.render_points_2d
+    # Define Vector View
+    def get_control_points(self) -> List[List[Vector3]]:
+        return [array_into_vec3_list(patch.reshape((-1, 3))) for patch in self.__get_controls_points()]
     # Define Methods
     def project(self, projection_matrix: Matrix) -> GraphicalObject:
-        # Get Lines
-        lines = self.__get_render_points()
+        # Get Grid
+        grid = self.__get_render_points()
+        (patches_n, lines_n, columns_n, _) = grid.shape
         # Transform Points
-        self.render_points_2d = [[(point.as_vec4(1) * projection_matrix).try_into_vec3_homo().try_into_vec2() for point in line] for line in lines]
+        projected = transform_points(grid.reshape((-1, 3)), projection_matrix)[:, :2].reshape((patches_n, lines_n, columns_n, 2))
+        # Split Grid into Lines and Columns Polylines
+        self.render_points_2d = [
+            *projected.reshape((-1, columns_n, 2)),
+            *projected.transpose((0, 2, 1, 3)).reshape((-1, lines_n, 2))
+        ]
         # Return Chain
         return self
 
@@ -110,7 +119,7 @@ class Bezier3D(Graphical3DObject):
         lines = self.__get_2d_render_points()
         for points in lines:
             # Cast points into homogeneus space
-            homo2d_points = [point.as_tuple() for point in points]
+            homo2d_points = points.tolist()
             # Draw line in canvas
             for idx, (x, y) in  enumerate(homo2d_points):
                 if idx == 0:
@@ -121,81 +130,53 @@ class Bezier3D(Graphical3DObject):
     
     def transform(self, transformation: Matrix):
         # Transform points
-        if isinstance(transformation, Vector4):
+        (lines_n, _) = transformation.dimensions()
+        if lines_n == 4:
             if self.in_pipeline:
                 # Pipeline
-                self.pipeline_control_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.pipeline_control_points
-                ]
-                self.pipeline_render_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.pipeline_render_points
-                ]
+                self.pipeline_control_points = transform_points(self.pipeline_control_points.reshape((-1, 3)), transformation).reshape(self.pipeline_control_points.shape)
+                self.pipeline_render_points = transform_points(self.pipeline_render_points.reshape((-1, 3)), transformation).reshape(self.pipeline_render_points.shape)
             else:
-                # Raw Transform
-                self.control_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.control_points
-                ]
-                self.render_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.render_points
-                ]
+                # Raw Transform (Invalidates Cached Bounds)
+                self.invalidate_bounding_box()
+                self.control_points = transform_points(self.control_points.reshape((-1, 3)), transformation).reshape(self.control_points.shape)
+                self.render_points = transform_points(self.render_points.reshape((-1, 3)), transformation).reshape(self.render_points.shape)
         else:
             self.render_points_2d = [
-                    [(point.as_vec3(1) * transformation).try_into_vec2() for point in line]
-                    for line in self.render_points_2d
-                ]
+                transform_points(line, transformation)
+                for line in self.render_points_2d
+            ]
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        self.__update_tessellation()
+        return self.render_points.reshape((-1, 3))
+
     def get_center_coords3(self) -> Vector3:
-        # Get Points
-        points = list(chain.from_iterable(self.__get_controls_points()))
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector3(0, 0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec3()
+        (x, y, z) = self.__get_controls_points().reshape((-1, 3)).mean(axis=0).tolist()
+        return Vector3(x, y, z)
 
     def get_center_coords(self) -> Vector2:
-        # Get Points
-        points = list(chain.from_iterable(self.__get_2d_render_points()))
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector2(0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec2()
+        (x, y) = vstack(self.__get_2d_render_points()).mean(axis=0).tolist()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
-        # Compute Dist Between 0 and 1
-        # Get Render Points
-        render_points_cols = list(map(lambda x: list(x), zip(*self.render_points_2d)))
-        render_points = self.render_points_2d
-        render_points.extend(render_points_cols)
         # Switch Method
         if method == EClippingMethod.LINE_COHEN_SUTHERLAND:
-            # Clip Using Cohen Sutherland
-            clipped_points = [data for render_points_lines in render_points if len((data := list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points_lines[0:-1])
-                        if (
-                            clipped_edge := cohen_sutherland_clip_line(
-                                point,
-                                render_points_lines[(idx + 1) % len(render_points_lines)]
-                            )
-                        ) is not None
-                    ]
-                )
-            ))) != 0]
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Cohen Sutherland (Edges of Every Line at Once)
+            lines_edges = [polyline_into_edges(line) for line in self.render_points_2d]
+            (clipped_edges, visible) = cohen_sutherland_clip_lines(concatenate(lines_edges))
+            # Split Edges Back into Lines
+            lines_bounds = cumsum([line_edges.shape[0] for line_edges in lines_edges])[:-1]
+            clipped_points = [
+                line_edges[line_visible].reshape((-1, 2))
+                for (line_edges, line_visible) in zip(split(clipped_edges, lines_bounds), split(visible, lines_bounds))
+                if line_visible.any()
+            ]
             # Check if needed to render
             if len(clipped_points) == 0:
                 return None
@@ -204,31 +185,19 @@ class Bezier3D(Graphical3DObject):
             # Process First Point
             return self
         elif method == EClippingMethod.LINE_LIANG_BARSKY:
-            # Clip Using Liang Barsky
-            clipped_points = [data for render_points_lines in render_points if len((data := list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points_lines[0:-1])
-                        if (
-                            clipped_edge := liang_barsky_clip_line(
-                                point,
-                                render_points_lines[(idx + 1) % len(render_points_lines)]
-                            )
-                        ) is not None
-                    ]
-                )
-            ))) != 0]
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Liang Barsky - Each Visible Run Becomes its Own Line
+            clipped_points = [
+                line_points[start:end]
+                for (line_points, runs) in map(liang_barsky_clip_polyline, self.render_points_2d)
+                for (start, end) in runs.tolist()
+            ]
             # Check if needed to render
             if len(clipped_points) == 0:
                 return None
-             # Update Internal Data
+            # Update Internal Data
             self.render_points_2d = clipped_points
             # Process First Point
             return self
         else:
-            # Update Internal Data
-            self.render_points_2d = render_points
             # Default - Trait as None Clipping
-            return self
\ No newline at end of file
+            return self
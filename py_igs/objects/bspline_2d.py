@@ -1,13 +1,14 @@
 from __future__ import annotations
 from math import ceil
+from itertools import groupby
 # from itertools import chain
-from typing import List, TYPE_CHECKING
-from itertools import chain
-from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_line, liang_barsky_clip_line
+from typing import List, TYPE_CHECKING, Tuple
+from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_lines, edges_into_breaks, liang_barsky_clip_polyline, polyline_into_edges, runs_into_breaks
+from primitives.curve_tessellation import adaptive_bspline_flatten, bspline_into_bezier_spans, classify_span_hulls, clip_cubic_spans
 from primitives.graphical_object import GraphicalObject
 from objects.object_type import ObjectType
-from primitives.matrix import Vector2, Matrix
-from numpy import array, float64
+from primitives.matrix import Vector2, Matrix, array_into_vec2_list, transform_points, vec2_list_into_array
+from numpy import arange, array, bool_, concatenate, cumsum, empty, float64, int64, repeat, searchsorted
 from numpy.typing import NDArray
 if TYPE_CHECKING:
     from cairo import Context
@@ -21,20 +22,37 @@ SPLINE_MATRIX = Matrix.from_list([
 ])
 class BSpline2D(GraphicalObject):
     # Define Constructor
-    def __init__(self, accuracy_step: float, *control_points: Vector2) -> None:
+    def __init__(self, accuracy_step: float, *control_points: Vector2 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
-        # Define Attributes
+        # Define Attributes (Stored as (N, 2) Arrays)
         self.accuracy = accuracy_step
-        self.control_points = list(control_points)
-        self.render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.control_points = vec2_list_into_array(control_points)
+        # Define Tessellation Cache (Polyline of the Persisted Control Points - None When Stale)
+        self.tolerance: float | None = None
+        self.tessellation: NDArray[float64] | None = None
+        self.tessellation_spans: NDArray[int64] = empty((0,), dtype=int64)
+        self.render_points = self.__get_tessellation()
+        # Define Render Path Breaks (Points Starting a New Path after Clipping - None for a Single Path)
+        self.render_breaks: NDArray[bool_] | None = None
         # Define Pipeline Attributes
         self.pipeline_control_points = self.control_points
+        self.pipeline_tessellation = self.render_points
         self.pipeline_render_points = self.render_points
+        self.pipeline_render_breaks: NDArray[bool_] | None = None
+        # Define Native Rendering (Cubic Spans Drawn with curve_to Instead of the Tessellation)
+        self.native = False
+        self.pipeline_curve_spans: NDArray[float64] | None = None
+        self.pipeline_curve_breaks: NDArray[bool_] | None = None
     # Private Methods
-    def __compute_poly_line_points(self, accuracy: float, control_points: List[Vector2]) -> List[Vector2]:
+    def __compute_poly_line_points(self, accuracy: float, control_points: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[int64]]:
+        # Returns the Polyline and the Span of each Point
+        # Adaptive Mode - Subdivide Until Flat Within the Tolerance
+        if self.tolerance is not None:
+            return adaptive_bspline_flatten(control_points, self.tolerance)
         # Define Required Amount of Points
         required_points_ammount = ceil(accuracy ** -1) - 1
+        spans_n = max(control_points.shape[0] - 3, 0)
         # Define Step Matrix
         d1 = accuracy
         d2 = d1 * accuracy
@@ -46,64 +64,118 @@ class BSpline2D(GraphicalObject):
             [6*d3,   0,  0, 0],
         ])
         STEP_SPLINE_MATRIX = STEP_MATRIX * SPLINE_MATRIX
-        # Compute Points
-        points: List[Vector2] = []
-        for idx in range(len(control_points) - 3):
-            # Get Points
-            cpoints = control_points[idx:idx + 4]
-            # Compute Component Parts
-            get_x_mat_elements: NDArray[float64] = array([[cp.get_x() for cp in cpoints]], dtype=float64)
-            get_y_mat_elements: NDArray[float64] = array([[cp.get_y() for cp in cpoints]], dtype=float64)
-            geo_x_mat = Matrix(get_x_mat_elements).as_transposed()
-            geo_y_mat = Matrix(get_y_mat_elements).as_transposed()
-            # Define Initial Values
-            x0, x1, x2, x3 = (STEP_SPLINE_MATRIX * geo_x_mat).columns()[0]
-            y0, y1, y2, y3 = (STEP_SPLINE_MATRIX * geo_y_mat).columns()[0]
-            # Define Segment Points
-            points.append(Vector2(x0, y0))
-            # Compute Iteration
-            for _ in range(required_points_ammount):
-                # Update Values
-                x0 += x1; x1 += x2; x2 += x3
-                y0 += y1; y1 += y2; y2 += y3
-                # Append new segment
-                points.append(Vector2(x0, y0))
-        # Return Computed Points
-        return points
+        # Stack Geometry of Every Span ((S, 4, 2)) and Compute Initial Differences
+        geometry = control_points[arange(spans_n).reshape((-1, 1)) + arange(4)]
+        differences = STEP_SPLINE_MATRIX.elements @ geometry
+        # Forward Difference All Spans at Once (Each Order is the Running Sum of the Next)
+        steps = arange(required_points_ammount).reshape((1, -1, 1))
+        second = differences[:, 2:3] + (steps * differences[:, 3:4])
+        first = differences[:, 1:2] + cumsum(second, axis=1) - second
+        points = concatenate((differences[:, 0:1], differences[:, 0:1] + cumsum(first, axis=1)), axis=1)
+        # Return Computed Points (Each Span Holds its Own Points)
+        return (points.reshape((-1, 2)), repeat(arange(spans_n), required_points_ammount + 1))
     # Type Definition
     @staticmethod
     def get_type() -> ObjectType:
         return ObjectType.BSPLINE_2D
     # Define Pipeline Methods
     def pipeline(self):
-        # Reset Pipeline Points
+        # Reset Pipeline Points (Reusing the Cached Tessellation)
         self.pipeline_control_points = self.control_points
-        self.pipeline_render_points = self.render_points
+        # Native Curves Skip the Tessellation (No Spans when the Curve has no Cubic Form)
+        self.pipeline_curve_spans = self.__compute_curve_spans(self.control_points) if self.native else None
+        if self.pipeline_curve_spans is None:
+            self.pipeline_tessellation = self.__get_tessellation()
+        else:
+            self.pipeline_tessellation = empty((0, 2), dtype=float64)
+            self.pipeline_curve_breaks = arange(self.pipeline_curve_spans.shape[0]) == 0
+        self.pipeline_render_points = self.pipeline_tessellation
+        self.pipeline_render_breaks = None
         # Call Super
         super().pipeline()
     def pipeline_apply(self):
         if self.in_pipeline:
             # Persist Pipeline Points
             self.control_points = self.pipeline_control_points
+            self.tessellation = self.pipeline_tessellation if self.pipeline_curve_spans is None else None
             self.render_points = self.pipeline_render_points
+            self.render_breaks = self.pipeline_render_breaks
             # Call Super
             super().pipeline_apply()
+            # Native Curves were not Tessellated - Evaluate Persisted Curve
+            if self.tessellation is None:
+                self.__set_render_points(self.__get_tessellation(), None)
 
-    def __get_controls_points(self) -> List[Vector2]:
+    def __get_controls_points(self) -> NDArray[float64]:
         return self.pipeline_control_points if self.in_pipeline else self.control_points
-    def __get_render_points(self) -> List[Vector2]:
+    def __get_render_points(self) -> NDArray[float64]:
         return self.pipeline_render_points if self.in_pipeline else self.render_points
+    def __get_render_breaks(self) -> NDArray[bool_] | None:
+        return self.pipeline_render_breaks if self.in_pipeline else self.render_breaks
+    def __set_render_points(self, points: NDArray[float64], breaks: NDArray[bool_] | None) -> None:
+        if self.in_pipeline:
+            (self.pipeline_render_points, self.pipeline_render_breaks) = (points, breaks)
+        else:
+            (self.render_points, self.render_breaks) = (points, breaks)
+    def __get_tessellation(self) -> NDArray[float64]:
+        if self.in_pipeline:
+            return self.pipeline_tessellation
+        # Evaluate Curve Only When Control Points or Accuracy Changed
+        if self.tessellation is None:
+            (self.tessellation, self.tessellation_spans) = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        return self.tessellation
+    # Define Accuracy
+    def get_accuracy(self) -> float:
+        return self.accuracy
+    def set_accuracy(self, accuracy_step: float) -> None:
+        # Invalidate Tessellation
+        self.accuracy = accuracy_step
+        self.tessellation = None
+        # Re-Evaluate Persisted Curve
+        self.invalidate_bounding_box()
+        (self.render_points, self.render_breaks) = (self.__get_tessellation(), None)
+    # Define Native Rendering
+    def get_native_rendering(self) -> bool:
+        return self.native
+    def set_native_rendering(self, enabled: bool) -> None:
+        self.native = enabled
+    def __compute_curve_spans(self, control_points: NDArray[float64]) -> NDArray[float64] | None:
+        return bspline_into_bezier_spans(control_points)
+    def __get_curve_spans(self) -> NDArray[float64] | None:
+        return self.pipeline_curve_spans if self.in_pipeline else None
+    # Define Level of Detail
+    def set_tessellation_tolerance(self, tolerance: float | None) -> None:
+        # Invalidate Tessellation Only When the Tolerance Changed
+        if tolerance != self.tolerance:
+            self.tolerance = tolerance
+            self.tessellation = None
+            # Re-Evaluate Persisted Curve
+            (self.render_points, self.render_breaks) = (self.__get_tessellation(), None)
+    # Define Vector View
+    def get_control_points(self) -> List[Vector2]:
+        return array_into_vec2_list(self.__get_controls_points())
     # Define Methods
     def draw(self, cairo: Context):
-        # Get Points
-        points = self.__get_render_points()
-        # Cast points into homogeneus space
-        homo2d_points = [point.as_tuple() for point in points]
+        # Draw Native Cubic Spans
+        curve_spans = self.__get_curve_spans()
+        if curve_spans is not None and self.pipeline_curve_breaks is not None:
+            # Set Color
+            cairo.set_source_rgba(*self.color)
+            for (((x0, y0), (x1, y1), (x2, y2), (x3, y3)), new_path) in zip(curve_spans.tolist(), self.pipeline_curve_breaks.tolist()):
+                if new_path:
+                    cairo.move_to(x0, y0)
+                cairo.curve_to(x1, y1, x2, y2, x3, y3)
+            cairo.stroke()
+            return
+        # Get Points (Clipped Curves Restart the Path at Each Visible Run)
+        render_points = self.__get_render_points()
+        render_breaks = self.__get_render_breaks()
+        new_paths = (arange(render_points.shape[0]) == 0) if render_breaks is None else render_breaks
         # Set Color
         cairo.set_source_rgba(*self.color)
         # Draw line in canvas
-        for idx, (x, y) in  enumerate(homo2d_points):
-            if idx == 0:
+        for ((x, y), new_path) in zip(render_points.tolist(), new_paths.tolist()):
+            if new_path:
                 cairo.move_to(x, y)
             else:
                 cairo.line_to(x, y)
@@ -112,102 +184,99 @@ class BSpline2D(GraphicalObject):
     def transform(self, transformation: Matrix):
         # Transform points
         if self.in_pipeline:
-            # Pipeline
-            self.pipeline_control_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.pipeline_control_points
-            ]
-            self.pipeline_render_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.pipeline_render_points
-            ]
+            # Pipeline (Cached Tessellation Follows the Control Points - Curves are Affine Invariant)
+            shared = self.pipeline_render_points is self.pipeline_tessellation
+            self.pipeline_control_points = transform_points(self.pipeline_control_points, transformation)
+            self.pipeline_tessellation = transform_points(self.pipeline_tessellation, transformation)
+            self.pipeline_render_points = self.pipeline_tessellation if shared else transform_points(self.pipeline_render_points, transformation)
+            if self.pipeline_curve_spans is not None:
+                self.pipeline_curve_spans = transform_points(self.pipeline_curve_spans.reshape((-1, 2)), transformation).reshape((-1, 4, 2))
         else:
-            # Raw Transform
-            self.control_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.control_points
-            ]
-            self.render_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.render_points
-            ]
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            shared = self.render_points is self.tessellation
+            self.control_points = transform_points(self.control_points, transformation)
+            self.tessellation = None if self.tessellation is None else transform_points(self.tessellation, transformation)
+            self.render_points = self.tessellation if shared else transform_points(self.render_points, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Control Points Bound the Curve at Any Tessellation (Convex Hull Property) - Splines without Spans Draw Nothing
+        return self.control_points if self.control_points.shape[0] >= 4 else self.control_points[:0]
+
     def get_center_coords(self) -> Vector2:
-        # Get Points
-        points = self.__get_controls_points()
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector2(0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec2()
+        (x, y) = self.__get_controls_points().mean(axis=0).tolist()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
-        # Get Control Points
-        control_points = self.__get_controls_points()
-        # Compute Dist Between 0 and 1
-        # Get Render Points
-        render_points = self.__compute_poly_line_points(self.accuracy, control_points)
+        # Native Curves - Clip by the Spans Control Polygons
+        curve_spans = self.__get_curve_spans()
+        if curve_spans is not None:
+            if method == EClippingMethod.NONE:
+                return self
+            (self.pipeline_curve_spans, self.pipeline_curve_breaks) = clip_cubic_spans(curve_spans)
+            return self if self.pipeline_curve_spans.shape[0] > 0 else None
+        # Get Render Points (Cached Tessellation)
+        render_points_array = self.__get_tessellation()
+        # Cull Spans by their Control Hulls (Only Spans Crossing the Border are Clipped)
+        (inside, crossing) = classify_span_hulls(bspline_into_bezier_spans(self.__get_controls_points()))
+        if method != EClippingMethod.NONE and not crossing.any():
+            # Check if needed to render
+            if not inside.any():
+                return None
+            # Update Internal Data (Drop Points of Spans Outside the Window - Each Remaining Stretch Starts a New Path)
+            if inside.all():
+                self.__set_render_points(render_points_array, None)
+            else:
+                visible = inside[self.tessellation_spans]
+                stretch_starts = visible & ~concatenate(([False], visible[:-1]))
+                self.__set_render_points(render_points_array[visible], stretch_starts[visible])
+            return self
         # Switch Method
         if method == EClippingMethod.LINE_COHEN_SUTHERLAND:
-            # Clip Using Cohen Sutherland
-            clipped_points = list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points[0:-1])
-                        if (
-                            clipped_edge := cohen_sutherland_clip_line(
-                                point,
-                                render_points[(idx + 1) % len(render_points)]
-                            )
-                        ) is not None
-                    ]
-                )
-            )
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Cohen Sutherland (Segments of Spans Crossing the Border at Once)
+            clipped_edges = polyline_into_edges(render_points_array)
+            edges_spans = self.tessellation_spans[:-1]
+            (visible, clipping) = (inside[edges_spans], crossing[edges_spans])
+            (clipped_edges[clipping], visible[clipping]) = cohen_sutherland_clip_lines(clipped_edges[clipping])
             # Check if needed to render
-            if len(clipped_points) == 0:
+            if not visible.any():
                 return None
-            # Update Internal Data
-            if self.in_pipeline:
-                self.pipeline_render_points = clipped_points
-            else:
-                self.render_points = clipped_points
+            # Update Internal Data (Gaps Between Visible Segments Start New Paths)
+            visible_edges = clipped_edges[visible]
+            self.__set_render_points(visible_edges.reshape((-1, 2)), edges_into_breaks(visible_edges))
             # Process First Point
             return self
         elif method == EClippingMethod.LINE_LIANG_BARSKY:
-            # Clip Using Cohen Sutherland
-            clipped_points = list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points[0:-1])
-                        if (
-                            clipped_edge := liang_barsky_clip_line(
-                                point,
-                                render_points[(idx + 1) % len(render_points)]
-                            )
-                        ) is not None
-                    ]
-                )
-            )
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Liang Barsky (Each Stretch of Consecutive Visible Spans at Once)
+            offsets = searchsorted(self.tessellation_spans, arange(inside.shape[0] + 1))
+            stretches: List[NDArray[float64]] = []
+            stretches_breaks: List[NDArray[bool_]] = []
+            for (is_visible, group) in groupby(range(inside.shape[0]), key=lambda span: bool(inside[span] or crossing[span])):
+                if not is_visible:
+                    continue
+                group_spans = list(group)
+                (first, last) = (group_spans[0], group_spans[-1])
+                # Stretch Points (Plus the Start of the Next Span to Keep the Junction Edge)
+                stretch = render_points_array[offsets[first]:offsets[last + 1] + 1]
+                if inside[first:last + 1].all():
+                    stretches.append(stretch)
+                    stretches_breaks.append(arange(stretch.shape[0]) == 0)
+                else:
+                    (clipped_stretch, runs) = liang_barsky_clip_polyline(stretch)
+                    stretches.append(clipped_stretch)
+                    stretches_breaks.append(runs_into_breaks(runs, clipped_stretch.shape[0]))
             # Check if needed to render
-            if len(clipped_points) == 0:
+            if len(stretches) == 0 or (clipped_points := concatenate(stretches)).shape[0] == 0:
                 return None
-            # Update Internal Data
-            if self.in_pipeline:
-                self.pipeline_render_points = clipped_points
-            else:
-                self.render_points = clipped_points
+            # Update Internal Data (Stretches and their Runs are Stored Sequentially, Each Starting a New Path)
+            self.__set_render_points(clipped_points, concatenate(stretches_breaks))
             # Process First Point
             return self
         else:
             # Update Internal Data
-            self.pipeline_render_points = render_points
+            self.__set_render_points(render_points_array, None)
             # Default - Trait as None Clipping
             return self
\ No newline at end of file
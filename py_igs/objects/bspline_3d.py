@@ -2,14 +2,14 @@ from __future__ import annotations
 # from itertools import chain
 from typing import List, TYPE_CHECKING
 from math import ceil
-from itertools import chain
 
-from numpy import array, float64
+from numba import jit #type: ignore
+from numpy import array, bool_, concatenate, cumsum, einsum, empty, float64, split, vstack, zeros
 from numpy.typing import NDArray
-from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_line, liang_barsky_clip_line
+from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_lines, liang_barsky_clip_polyline, polyline_into_edges
 from primitives.graphical_object import Graphical3DObject, GraphicalObject
 from objects.object_type import ObjectType
-from primitives.matrix import Vector2, Matrix, Vector3, Vector4
+from primitives.matrix import Vector2, Matrix, Vector3, array_into_vec3_list, transform_points, vec3_list_into_array
 if TYPE_CHECKING:
     from cairo import Context
     from primitives.matrix import Matrix
@@ -21,6 +21,37 @@ SPLINE_MATRIX = Matrix.from_list([
     [ 1/6, 4/6, 1/6, 0/6],
 ])
 SPLINE_MATRIX_TRANSPOSED = SPLINE_MATRIX.as_transposed()
+
+def forward_difference_matrix(delta: float) -> NDArray[float64]:
+    # Initial Differences of a Cubic Sampled with a Fixed Step
+    elements: NDArray[float64] = array([
+        [         0,            0,     0, 1],
+        [  delta**3,     delta**2, delta, 0],
+        [6*delta**3, 2 * delta**2,     0, 0],
+        [6*delta**3,            0,     0, 0],
+    ], dtype=float64)
+    return elements
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __forward_difference_surfaces__(differences: NDArray[float64], lines_n: int, columns_n: int) -> NDArray[float64]:
+    # Differences are (P, 4, 4, 3) - Rows Step Along S and Columns Along T
+    patches_n = differences.shape[0]
+    points = empty((patches_n, lines_n, columns_n, 3), dtype=float64)
+    rows = empty((4, 4), dtype=float64)
+    for patch in range(patches_n):
+        for coord in range(3):
+            rows[:, :] = differences[patch, :, :, coord]
+            for line in range(lines_n):
+                # Step Iso-Curve Along T
+                (x, x1, x2, x3) = (rows[0, 0], rows[0, 1], rows[0, 2], rows[0, 3])
+                for column in range(columns_n):
+                    points[patch, line, column, coord] = x
+                    x += x1; x1 += x2; x2 += x3
+                # Step Rows Along S (Third Difference is Constant)
+                for row in range(3):
+                    for column in range(4):
+                        rows[row, column] += rows[row + 1, column]
+    return points
 class BSpline3D(Graphical3DObject):
     # Define Constructor
     def __init__(self, accuracy_step: float, *control_points: List[Vector3], accuracy_step_snd: float = 0) -> None:
@@ -28,102 +59,64 @@ class BSpline3D(Graphical3DObject):
         super().__init__()
         # Define Attributes
         self.accuracy = accuracy_step
-        self.accuracy_step_snd = self.accuracy if accuracy_step_snd == 0 else self.accuracy_step_snd
-        self.control_points: List[List[Vector3]] = list(control_points)
+        self.accuracy_step_snd = self.accuracy if accuracy_step_snd == 0 else accuracy_step_snd
+        # Control Grid is Stored as a (R, C, 3) Array
+        self.control_points: NDArray[float64] = array([vec3_list_into_array(line) for line in control_points], dtype=float64)
+        # Render Points are Stored as a (P, S, T, 3) Grid (Patches are Re-Evaluated Only When Flagged Dirty)
         self.render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.dirty_patches: NDArray[bool_] = zeros(self.render_points.shape[0], dtype=bool_)
         # Define Pipeline Attributes
         self.pipeline_control_points = self.control_points
         self.pipeline_render_points = self.render_points
-        self.render_points_2d: List[List[Vector2]] = []
+        self.render_points_2d: List[NDArray[float64]] = []
     # Private Methods
-    def __compute_poly_line_points(self, accuracy: float, control_points: List[List[Vector3]]) -> List[List[Vector3]]:
-        # Split in 4x4 chunks
-        total_lines = len(control_points)
-        total_columns = len(control_points[0])
-        sub_mats: List[List[List[Vector3]]] = []
-        for i in range(total_lines - 3):
-            for j in range(total_columns - 3):
-                sub_mats.append(
-                    [[control_points[ix][jx] for jx in range(j, j+4)] for ix in range(i, i+4)]
-                )
-        return list(chain.from_iterable([self.__compute_poly_line_points_section(accuracy, sub_mat) for sub_mat in sub_mats]))
-
-    def __compute_fwd_diff_curve(self, n: int, x_l: List[float], y_l: List[float], z_l: List[float]) -> List[Vector3]:
-        x, x1, x2, x3 = x_l
-        y, y1, y2, y3 = y_l
-        z, z1, z2, z3 = z_l
-        line_points = [Vector3(x, y, z)]
-        for _ in range(1, n):
-            # Update Values
-                x += x1; x1 += x2; x2 += x3
-                y += y1; y1 += y2; y2 += y3
-                z += z1; z1 += z2; z2 += z3
-                # Append new segment
-                line_points.append(Vector3(x, y, z))
-        return line_points
-    def __compute_poly_line_points_section(self, accuracy: float, control_points: List[List[Vector3]]) -> List[List[Vector3]]:
-        # Compute Number of Polygons 
+    def __compute_poly_line_points(self, accuracy: float, control_points: NDArray[float64]) -> NDArray[float64]:
+        return self.__compute_patches_points(accuracy, self.__get_sub_patches(control_points))
+    def __get_sub_patches(self, control_points: NDArray[float64]) -> NDArray[float64]:
+        # Split in 4x4 Chunks ((P, 4, 4, 3))
+        (total_lines, total_columns, _) = control_points.shape
+        sub_mats: NDArray[float64] = array([
+            control_points[i:i+4, j:j+4]
+            for i in range(total_lines - 3)
+            for j in range(total_columns - 3)
+        ], dtype=float64).reshape((-1, 4, 4, 3))
+        return sub_mats
+    def __compute_patches_points(self, accuracy: float, sub_mats: NDArray[float64]) -> NDArray[float64]:
+        # Compute Number of Polygons
         required_points_ammount_st = ceil(accuracy ** -1)
         required_points_ammount_nd = ceil(self.accuracy_step_snd ** -1)
-        controls_x_e: NDArray[float64] = array([[cpe.get_x() for cpe in cpl] for cpl in control_points])
-        controls_y_e: NDArray[float64] = array([[cpe.get_y() for cpe in cpl] for cpl in control_points])
-        controls_z_e: NDArray[float64] = array([[cpe.get_z() for cpe in cpl] for cpl in control_points])
-        GX = Matrix(controls_x_e)
-        GY = Matrix(controls_y_e)
-        GZ = Matrix(controls_z_e)
-        # print("GX: ",GX)
-        ES = Matrix.from_list([
-            [0, 0, 0, 1],
-            [accuracy**3, accuracy**2, accuracy, 0],
-            [6*accuracy**3, 2*accuracy**2, 0, 0],
-            [6*accuracy**3, 0, 0, 0],
-        ])
-        # print("ES: ", ES)
-        ET = Matrix.from_list([
-            [0, 0, 0, 1],
-            [self.accuracy_step_snd**3, self.accuracy_step_snd**2, self.accuracy_step_snd, 0],
-            [6*self.accuracy_step_snd**3, 2*self.accuracy_step_snd**2, 0, 0],
-            [6*self.accuracy_step_snd**3, 0, 0, 0],
-        ])
-
-        ddx = ES * SPLINE_MATRIX * GX * SPLINE_MATRIX_TRANSPOSED * (ET.as_transposed())
-        ddy = ES * SPLINE_MATRIX * GY * SPLINE_MATRIX_TRANSPOSED * (ET.as_transposed())
-        ddz = ES * SPLINE_MATRIX * GZ * SPLINE_MATRIX_TRANSPOSED * (ET.as_transposed())
-        # print("ddx: ", ddx)
-
-        points: List[List[Vector3]] = []
-
-        for _ in range(1, required_points_ammount_st):
-            ddxl = ddx.lines()
-            ddyl = ddy.lines()
-            ddzl = ddz.lines()
-            
-            line = self.__compute_fwd_diff_curve(required_points_ammount_st - 1, ddxl[0], ddyl[0], ddzl[0])
-            # print(line)
-            points.append(line)
-
-            ddx = ddx + Matrix.from_list([ddxl[li + 1] if li < 3 else ddxl[li] for li in range(4)])
-            ddy = ddy + Matrix.from_list([ddyl[li + 1] if li < 3 else ddyl[li] for li in range(4)])
-            ddz = ddz + Matrix.from_list([ddzl[li + 1] if li < 3 else ddzl[li] for li in range(4)])
-
-        ddx = (ES * SPLINE_MATRIX * GX * SPLINE_MATRIX_TRANSPOSED * ET.as_transposed()).as_transposed()
-        ddy = (ES * SPLINE_MATRIX * GY * SPLINE_MATRIX_TRANSPOSED * ET.as_transposed()).as_transposed()
-        ddz = (ES * SPLINE_MATRIX * GZ * SPLINE_MATRIX_TRANSPOSED * ET.as_transposed()).as_transposed()
-
-        for _ in range(1, required_points_ammount_nd):
-            ddxl = ddx.lines()
-            ddyl = ddy.lines()
-            ddzl = ddz.lines()
-            
-            line = self.__compute_fwd_diff_curve(required_points_ammount_nd - 1, ddxl[0], ddyl[0], ddzl[0])
-            points.append(line)
-
-            ddx = ddx + Matrix.from_list([ddxl[li + 1] if li < 3 else ddxl[li] for li in range(4)])
-            ddy = ddy + Matrix.from_list([ddyl[li + 1] if li < 3 else ddyl[li] for li in range(4)])
-            ddz = ddz + Matrix.from_list([ddzl[li + 1] if li < 3 else ddzl[li] for li in range(4)])
-
-        return points
-
+        # Compute Initial Differences ES . M . G . M^T . ET^T of Every Patch and Coordinate
+        ES = forward_difference_matrix(accuracy)
+        ET = forward_difference_matrix(self.accuracy_step_snd)
+        differences = einsum("ab,pbcd,ce->paed", ES @ SPLINE_MATRIX.elements, sub_mats, (ET @ SPLINE_MATRIX.elements).T)
+        # Step Differences Over All Patches at Once
+        return __forward_difference_surfaces__(differences, required_points_ammount_st - 1, required_points_ammount_nd - 1)
+
+    def __update_tessellation(self) -> None:
+        # Re-Evaluate Only Patches whose Control Points Changed
+        if self.dirty_patches.any():
+            sub_mats = self.__get_sub_patches(self.control_points)[self.dirty_patches]
+            self.render_points[self.dirty_patches] = self.__compute_patches_points(self.accuracy, sub_mats)
+            self.dirty_patches[:] = False
+            self.invalidate_bounding_box()
+    # Define Editing
+    def set_control_point(self, line: int, column: int, point: Vector3) -> None:
+        # Update Persisted Control Point
+        self.control_points[line, column] = point.as_tuple()
+        # Flag Every Sub-Patch Using It (Up to 4x4)
+        (total_lines, total_columns, _) = self.control_points.shape
+        dirty_grid = self.dirty_patches.reshape((total_lines - 3, total_columns - 3))
+        dirty_grid[max(line - 3, 0):line + 1, max(column - 3, 0):column + 1] = True
+        self.invalidate_bounding_box()
+    def get_accuracy(self) -> float:
+        return self.accuracy
+    def set_accuracy(self, accuracy_step: float, accuracy_step_snd: float = 0) -> None:
+        # Grid Size Changes - Re-Evaluate All Patches
+        self.accuracy = accuracy_step
+        self.accuracy_step_snd = self.accuracy if accuracy_step_snd == 0 else accuracy_step_snd
+        self.render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.dirty_patches[:] = False
+        self.invalidate_bounding_box()
 
     # Type Definition
     @staticmethod
@@ -131,9 +124,10 @@ class BSpline3D(Graphical3DObject):
         return ObjectType.BSPLINE_3D
     # Define Pipeline Methods
     def pipeline(self):
-        # Reset Pipeline Points
+        # Reset Pipeline Points (Cached Patches Follow Affine Transforms)
+        self.__update_tessellation()
         self.pipeline_control_points = self.control_points
-        self.pipeline_render_points = self.__compute_poly_line_points(self.accuracy, self.control_points)
+        self.pipeline_render_points = self.render_points
         self.render_points_2d = []
         # Call Super
         super().pipeline()
@@ -145,18 +139,27 @@ class BSpline3D(Graphical3DObject):
             # Call Super
             super().pipeline_apply()
 
-    def __get_controls_points(self) -> List[List[Vector3]]:
+    def __get_controls_points(self) -> NDArray[float64]:
         return self.pipeline_control_points if self.in_pipeline else self.control_points
-    def __get_render_points(self) -> List[List[Vector3]]:
+    def __get_render_points(self) -> NDArray[float64]:
         return self.pipeline_render_points if self.in_pipeline else self.render_points
-    def __get_2d_render_points(self) -> List[List[Vector2]]:
+    def __get_2d_render_points(self) -> List[NDArray[float64]]:
         return self.render_points_2d
+    # Define Vector View
+    def get_control_points(self) -> List[List[Vector3]]:
+        return [array_into_vec3_list(line) for line in self.__get_controls_points()]
     # Define Methods
     def project(self, projection_matrix: Matrix) -> GraphicalObject:
-        # Get Lines
-        lines = self.__get_render_points()
+        # Get Grid
+        grid = self.__get_render_points()
+        (patches_n, lines_n, columns_n, _) = grid.shape
         # Transform Points
-        self.render_points_2d = [[(point.as_vec4(1) * projection_matrix).try_into_vec3_homo().try_into_vec2() for point in line] for line in lines]
+        projected = transform_points(grid.reshape((-1, 3)), projection_matrix)[:, :2].reshape((patches_n, lines_n, columns_n, 2))
+        # Split Grid into Lines and Columns Polylines
+        self.render_points_2d = [
+            *projected.reshape((-1, columns_n, 2)),
+            *projected.transpose((0, 2, 1, 3)).reshape((-1, lines_n, 2))
+        ]
         # Return Chain
         return self
 
@@ -167,7 +170,7 @@ class BSpline3D(Graphical3DObject):
         lines = self.__get_2d_render_points()
         for points in lines:
             # Cast points into homogeneus space
-            homo2d_points = [point.as_tuple() for point in points]
+            homo2d_points = points.tolist()
             # Draw line in canvas
             for idx, (x, y) in  enumerate(homo2d_points):
                 if idx == 0:
@@ -178,81 +181,53 @@ class BSpline3D(Graphical3DObject):
     
     def transform(self, transformation: Matrix):
         # Transform points
-        if isinstance(transformation, Vector4):
+        (lines_n, _) = transformation.dimensions()
+        if lines_n == 4:
             if self.in_pipeline:
                 # Pipeline
-                self.pipeline_control_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.pipeline_control_points
-                ]
-                self.pipeline_render_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.pipeline_render_points
-                ]
+                self.pipeline_control_points = transform_points(self.pipeline_control_points.reshape((-1, 3)), transformation).reshape(self.pipeline_control_points.shape)
+                self.pipeline_render_points = transform_points(self.pipeline_render_points.reshape((-1, 3)), transformation).reshape(self.pipeline_render_points.shape)
             else:
-                # Raw Transform
-                self.control_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.control_points
-                ]
-                self.render_points = [
-                    [(point.as_vec4(1) * transformation).try_into_vec3() for point in line]
-                    for line in self.render_points
-                ]
+                # Raw Transform (Invalidates Cached Bounds)
+                self.invalidate_bounding_box()
+                self.control_points = transform_points(self.control_points.reshape((-1, 3)), transformation).reshape(self.control_points.shape)
+                self.render_points = transform_points(self.render_points.reshape((-1, 3)), transformation).reshape(self.render_points.shape)
         else:
             self.render_points_2d = [
-                    [(point.as_vec3(1) * transformation).try_into_vec2() for point in line]
-                    for line in self.render_points_2d
-                ]
+                transform_points(line, transformation)
+                for line in self.render_points_2d
+            ]
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        self.__update_tessellation()
+        return self.render_points.reshape((-1, 3))
+
     def get_center_coords3(self) -> Vector3:
-        # Get Points
-        points = list(chain.from_iterable(self.__get_controls_points()))
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector3(0, 0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec3()
+        (x, y, z) = self.__get_controls_points().reshape((-1, 3)).mean(axis=0).tolist()
+        return Vector3(x, y, z)
 
     def get_center_coords(self) -> Vector2:
-        # Get Points
-        points = list(chain.from_iterable(self.__get_2d_render_points()))
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector2(0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec2()
+        (x, y) = vstack(self.__get_2d_render_points()).mean(axis=0).tolist()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
-        # Compute Dist Between 0 and 1
-        # Get Render Points
-        render_points_cols = list(map(lambda x: list(x), zip(*self.render_points_2d)))
-        render_points = self.render_points_2d
-        render_points.extend(render_points_cols)
         # Switch Method
         if method == EClippingMethod.LINE_COHEN_SUTHERLAND:
-            # Clip Using Cohen Sutherland
-            clipped_points = [data for render_points_lines in render_points if len((data := list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points_lines[0:-1])
-                        if (
-                            clipped_edge := cohen_sutherland_clip_line(
-                                point,
-                                render_points_lines[(idx + 1) % len(render_points_lines)]
-                            )
-                        ) is not None
-                    ]
-                )
-            ))) != 0]
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Cohen Sutherland (Edges of Every Line at Once)
+            lines_edges = [polyline_into_edges(line) for line in self.render_points_2d]
+            (clipped_edges, visible) = cohen_sutherland_clip_lines(concatenate(lines_edges))
+            # Split Edges Back into Lines
+            lines_bounds = cumsum([line_edges.shape[0] for line_edges in lines_edges])[:-1]
+            clipped_points = [
+                line_edges[line_visible].reshape((-1, 2))
+                for (line_edges, line_visible) in zip(split(clipped_edges, lines_bounds), split(visible, lines_bounds))
+                if line_visible.any()
+            ]
             # Check if needed to render
             if len(clipped_points) == 0:
                 return None
@@ -261,31 +236,19 @@ class BSpline3D(Graphical3DObject):
             # Process First Point
             return self
         elif method == EClippingMethod.LINE_LIANG_BARSKY:
-            # Clip Using Liang Barsky
-            clipped_points = [data for render_points_lines in render_points if len((data := list(
-                chain.from_iterable(
-                    [
-                        clipped_edge
-                        for (idx, point) in enumerate(render_points_lines[0:-1])
-                        if (
-                            clipped_edge := liang_barsky_clip_line(
-                                point,
-                                render_points_lines[(idx + 1) % len(render_points_lines)]
-                            )
-                        ) is not None
-                    ]
-                )
-            ))) != 0]
-            # print(len(render_points), len(clipped_points))
+            # Clip Using Liang Barsky - Each Visible Run Becomes its Own Line
+            clipped_points = [
+                line_points[start:end]
+                for (line_points, runs) in map(liang_barsky_clip_polyline, self.render_points_2d)
+                for (start, end) in runs.tolist()
+            ]
             # Check if needed to render
             if len(clipped_points) == 0:
                 return None
-             # Update Internal Data
+            # Update Internal Data
             self.render_points_2d = clipped_points
             # Process First Point
             return self
         else:
-            # Update Internal Data
-            self.render_points_2d = render_points
             # Default - Trait as None Clipping
-            return self
\ No newline at end of file
+            return self
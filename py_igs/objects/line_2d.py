@@ -1,28 +1,27 @@
 from __future__ import annotations
 from typing import List, TYPE_CHECKING
+from numpy import float64
+from numpy.typing import NDArray
 from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_line, liang_barsky_clip_line
 from primitives.graphical_object import GraphicalObject
+from primitives.matrix import Vector2, array_into_vec2_list, transform_points, vec2_list_into_array
 from objects.object_type import ObjectType
 if TYPE_CHECKING:
     from cairo import Context
-    from primitives.matrix import Matrix, Vector2
+    from primitives.matrix import Matrix
 
 class Line2D(GraphicalObject):
     # Define Constructor
-    def __init__(self, point_a: Vector2, point_b: Vector2) -> None:
+    def __init__(self, point_a: Vector2 | NDArray[float64], point_b: Vector2 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
-        # Define Attributes
-        self.point_a = point_a
-        self.point_b = point_b
+        # Define Attributes (Stored as a (2, 2) Array)
+        self.points = vec2_list_into_array([point_a, point_b])
         # Define Pipeline Attributes
-        self.pipeline_point_a = point_a
-        self.pipeline_point_b = point_b
+        self.pipeline_points = self.points
     def __str__(self) -> str:
-        if self.in_pipeline:
-            return f"[({self.pipeline_point_a.get_x()}, {self.pipeline_point_a.get_y()}), ({self.pipeline_point_b.get_x()}, {self.pipeline_point_b.get_y()})]"
-        else:
-            return f"[({self.point_a.get_x()}, {self.point_a.get_y()}), ({self.point_b.get_x()}, {self.point_b.get_y()})]"
+        ((x1, y1), (x2, y2)) = self.__get_current_points().tolist()
+        return f"[({x1}, {y1}), ({x2}, {y2})]"
     # Type Definition
     @staticmethod
     def get_type() -> ObjectType:
@@ -30,95 +29,82 @@ class Line2D(GraphicalObject):
     # Define Pipeline Methods
     def pipeline(self):
         # Reset Pipeline Points
-        self.pipeline_point_a = self.point_a
-        self.pipeline_point_b = self.point_b
+        self.pipeline_points = self.points
         # Call Super
         super().pipeline()
     def pipeline_apply(self):
         if self.in_pipeline:
             # Persist Pipeline Points
-            self.point_a = self.pipeline_point_a
-            self.point_b = self.pipeline_point_b
+            self.points = self.pipeline_points
             # Call Super
             super().pipeline_apply()
-    def __get_current_points(self) -> List[Vector2]:
-        return [self.pipeline_point_a, self.pipeline_point_b] if self.in_pipeline else [self.point_a, self.point_b]
+    def __get_current_points(self) -> NDArray[float64]:
+        return self.pipeline_points if self.in_pipeline else self.points
+    def __set_current_points(self, points: NDArray[float64]) -> None:
+        if self.in_pipeline:
+            self.pipeline_points = points
+        else:
+            self.points = points
+    # Define Vector View
+    def get_points(self) -> List[Vector2]:
+        return array_into_vec2_list(self.__get_current_points())
     # Define Methods
     def draw(self, cairo: Context):
         # Get Points
-        point_a = self.pipeline_point_a if self.in_pipeline else self.point_a
-        point_b = self.pipeline_point_b if self.in_pipeline else self.point_b
-        # Cast points into homogeneus space
-        homo2d_point_a = point_a.as_vec3(1)
-        homo2d_point_b = point_b.as_vec3(1)
-        # Cast to Vector2
-        (x1, y1) = homo2d_point_a.try_into_vec2().as_tuple()
-        (x2, y2) = homo2d_point_b.try_into_vec2().as_tuple()
+        ((x1, y1), (x2, y2)) = self.__get_current_points().tolist()
         # Set Color
         cairo.set_source_rgba(*self.color)
         # Draw line in canvas
         cairo.move_to(x1, y1)
         cairo.line_to(x2, y2)
         cairo.stroke()
-    
+
     def transform(self, transformation: Matrix):
         # Transform Points
         if self.in_pipeline:
             # Pipelines
-            self.pipeline_point_a = (self.pipeline_point_a.as_vec3(1) * transformation).try_into_vec2()
-            self.pipeline_point_b = (self.pipeline_point_b.as_vec3(1) * transformation).try_into_vec2()
+            self.pipeline_points = transform_points(self.pipeline_points, transformation)
         else:
-            # Raw Transform
-            self.point_a = (self.point_a.as_vec3(1) * transformation).try_into_vec2()
-            self.point_b = (self.point_b.as_vec3(1) * transformation).try_into_vec2()
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.points = transform_points(self.points, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.points
+
     def get_center_coords(self) -> Vector2:
         # Get Points
-        point_a = self.pipeline_point_a if self.in_pipeline else self.point_a
-        point_b = self.pipeline_point_b if self.in_pipeline else self.point_b
+        (x, y) = self.__get_current_points().mean(axis=0).tolist()
         # Return Center
-        center_coord = (point_a.as_vec3(1) + point_b.as_vec3(1)) * 0.5
-        return center_coord.try_into_vec2()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
         # Switch Method
         if method == EClippingMethod.LINE_COHEN_SUTHERLAND:
             # Get Points
-            points = self.__get_current_points()
+            points = self.get_points()
             clipped_points = cohen_sutherland_clip_line(*points)
-            # If none, simply return none too 
+            # If none, simply return none too
             if clipped_points is None:
                 return None
             # Both Inside - Update Value
-            (clipped_left, clipped_right) = clipped_points
-            if self.in_pipeline:
-                self.pipeline_point_a = clipped_left
-                self.pipeline_point_b = clipped_right
-            else:
-                self.point_a = clipped_left
-                self.point_b = clipped_right
+            self.__set_current_points(vec2_list_into_array(clipped_points))
             # Process First Point
             return self
         elif method == EClippingMethod.LINE_LIANG_BARSKY:
             # Get Points
-            points = self.__get_current_points()
+            points = self.get_points()
             clipped_points = liang_barsky_clip_line(*points)
-            # print(clipped_points)
-            # If none, simply return none too 
+            # If none, simply return none too
             if clipped_points is None:
                 return None
             # Both Inside - Update Value
-            (clipped_left, clipped_right) = clipped_points
-            if self.in_pipeline:
-                self.pipeline_point_a = clipped_left
-                self.pipeline_point_b = clipped_right
-            else:
-                self.point_a = clipped_left
-                self.point_b = clipped_right
+            self.__set_current_points(vec2_list_into_array(clipped_points))
             # Process First Point
             return self
         else:
             # Default - Trait as None Clipping
-            return self
\ No newline at end of file
+            return self
@@ -1,28 +1,27 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
+from numpy import float64
+from numpy.typing import NDArray
+from primitives.clipping_method import clip_lines_to_planes
 from primitives.graphical_object import Graphical3DObject, GraphicalObject
 from objects.object_type import ObjectType
 from objects.line_2d import Line2D
-from primitives.matrix import Vector3
+from primitives.matrix import Vector3, array_into_vec3_list, transform_points, vec3_list_into_array
 if TYPE_CHECKING:
     from primitives.matrix import Matrix
 
 class Line3D(Graphical3DObject):
     # Define Constructor
-    def __init__(self, point_a: Vector3, point_b: Vector3) -> None:
+    def __init__(self, point_a: Vector3 | NDArray[float64], point_b: Vector3 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
-        # Define Attributes
-        self.point_a = point_a
-        self.point_b = point_b
+        # Define Attributes (Stored as a (2, 3) Array)
+        self.points = vec3_list_into_array([point_a, point_b])
         # Define Pipeline Attributes
-        self.pipeline_point_a = point_a
-        self.pipeline_point_b = point_b
+        self.pipeline_points = self.points
     def __str__(self) -> str:
-        if self.in_pipeline:
-            return f"[({self.pipeline_point_a.get_x()}, {self.pipeline_point_a.get_y()}, {self.pipeline_point_a.get_z()}), ({self.pipeline_point_b.get_x()}, {self.pipeline_point_b.get_y()}, {self.pipeline_point_b.get_z()})]"
-        else:
-            return f"[({self.point_a.get_x()}, {self.point_a.get_y()}, {self.point_a.get_z()}), ({self.point_b.get_x()}, {self.point_b.get_y()}, {self.point_b.get_z()})]"
+        ((x1, y1, z1), (x2, y2, z2)) = self.__get_current_points().tolist()
+        return f"[({x1}, {y1}, {z1}), ({x2}, {y2}, {z2})]"
     # Type Definition
     @staticmethod
     def get_type() -> ObjectType:
@@ -30,45 +29,60 @@ class Line3D(Graphical3DObject):
     # Define Pipeline Methods
     def pipeline(self):
         # Reset Pipeline Points
-        self.pipeline_point_a = self.point_a
-        self.pipeline_point_b = self.point_b
+        self.pipeline_points = self.points
         # Call Super
         super().pipeline()
     def pipeline_apply(self):
         if self.in_pipeline:
             # Persist Pipeline Points
-            self.point_a = self.pipeline_point_a
-            self.point_b = self.pipeline_point_b
+            self.points = self.pipeline_points
             # Call Super
             super().pipeline_apply()
+    def __get_current_points(self) -> NDArray[float64]:
+        return self.pipeline_points if self.in_pipeline else self.points
+    # Define Vector View
+    def get_points(self) -> List[Vector3]:
+        return array_into_vec3_list(self.__get_current_points())
     # Define Methods    
     def project(self, projection_matrix: Matrix) -> GraphicalObject:
         # Get Points
-        point_a = self.pipeline_point_a if self.in_pipeline else self.point_a
-        point_b = self.pipeline_point_b if self.in_pipeline else self.point_b
+        points = self.__get_current_points()
         # Transform
-        point_a = (point_a.as_vec4(1) * projection_matrix).try_into_vec3_homo().try_into_vec2()
-        point_b = (point_b.as_vec4(1) * projection_matrix).try_into_vec3_homo().try_into_vec2()
+        (point_a, point_b) = transform_points(points, projection_matrix)[:, :2]
         # Create New Object
         return Line2D(point_a, point_b)
 
+    def clip_depth(self, planes: NDArray[float64]) -> Graphical3DObject | None:
+        # Clip Line Parametrically
+        (clipped, visible) = clip_lines_to_planes(self.__get_current_points()[None], planes)
+        if not visible[0]:
+            return None
+        # Update Points
+        if self.in_pipeline:
+            self.pipeline_points = clipped[0]
+        else:
+            self.invalidate_bounding_box()
+            self.points = clipped[0]
+        return self
+
     def transform(self, transformation: Matrix):
         # Transform Points
         if self.in_pipeline:
             # Pipelines
-            self.pipeline_point_a = (self.pipeline_point_a.as_vec4(1) * transformation).try_into_vec3()
-            self.pipeline_point_b = (self.pipeline_point_b.as_vec4(1) * transformation).try_into_vec3()
+            self.pipeline_points = transform_points(self.pipeline_points, transformation)
         else:
-            # Raw Transform
-            self.point_a = (self.point_a.as_vec4(1) * transformation).try_into_vec3()
-            self.point_b = (self.point_b.as_vec4(1) * transformation).try_into_vec3()
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.points = transform_points(self.points, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.points
+
     def get_center_coords3(self) -> Vector3:
         # Get Points
-        point_a = self.pipeline_point_a if self.in_pipeline else self.point_a
-        point_b = self.pipeline_point_b if self.in_pipeline else self.point_b
+        (x, y, z) = self.__get_current_points().mean(axis=0).tolist()
         # Return Center
-        center_coord = (point_a + point_b) * 0.5
-        return center_coord.try_into_vec3()
\ No newline at end of file
+        return Vector3(x, y, z)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+from typing import List, NamedTuple, TYPE_CHECKING, Tuple
+from numpy import arange, array, empty, float64, int64, nonzero
+from numpy.typing import NDArray
+from objects.object_type import ObjectType
+from objects.wireframe_2d import Wireframe2D
+from primitives.clipping_method import EClippingMethod, cohen_sutherland_clip_lines, region_codes
+from primitives.graphical_object import GraphicalObject
+from primitives.matrix import Matrix, Vector2, transform_points
+from primitives.mesh_topology import ragged_clip_faces, ragged_signed_areas, ragged_take
+if TYPE_CHECKING:
+    from cairo import Context
+
+# Define Mesh Geometry (Shared Vertices, Ragged Faces and Unique Edges Indexing Them)
+class MeshGeometry(NamedTuple):
+    vertices: NDArray[float64]
+    face_indices: NDArray[int64]
+    face_offsets: NDArray[int64]
+    face_colors: NDArray[float64]
+    edges: NDArray[int64] | None
+    edge_colors: NDArray[float64] | None
+
+class Mesh2D(GraphicalObject):
+    # Define Constructor
+    def __init__(self, vertices: NDArray[float64], face_indices: NDArray[int64], face_offsets: NDArray[int64], face_colors: NDArray[float64], filled: bool = False, edges: Tuple[NDArray[int64], NDArray[float64]] | None = None) -> None:
+        # Call Super Constructor
+        super().__init__()
+        # Define Attributes (Unfilled Meshes with Edges are Drawn as Unique Segments)
+        (edge_indices, edge_colors) = (None, None) if edges is None else edges
+        self.geometry = MeshGeometry(vertices, face_indices, face_offsets, face_colors, edge_indices, edge_colors)
+        # Define Pipeline Attributes
+        self.pipeline_geometry = self.geometry
+        # Define Fill Options
+        self.filled = filled
+    def __str__(self) -> str:
+        geometry = self.__get_current_geometry()
+        return f"Mesh2D ({geometry.vertices.shape[0]} vertices, {geometry.face_offsets.shape[0] - 1} faces)\n"
+    # Type Definition
+    @staticmethod
+    def get_type() -> ObjectType:
+        return ObjectType.MESH_2D
+    # Define Pipeline Methods
+    def pipeline(self):
+        # Reset Pipeline Geometry
+        self.pipeline_geometry = self.geometry
+        # Call Super
+        super().pipeline()
+    def pipeline_apply(self):
+        if self.in_pipeline:
+            # Persist Pipeline Geometry
+            self.geometry = self.pipeline_geometry
+            # Call Super
+        super().pipeline_apply()
+
+    def __get_current_geometry(self) -> MeshGeometry:
+        return self.pipeline_geometry if self.in_pipeline else self.geometry
+    def __set_current_geometry(self, geometry: MeshGeometry) -> None:
+        if self.in_pipeline:
+            self.pipeline_geometry = geometry
+        else:
+            self.geometry = geometry
+    def __draws_edges(self) -> bool:
+        return not self.filled and self.__get_current_geometry().edges is not None
+    # Define Face View
+    def get_faces(self) -> List[List[Vector2]]:
+        geometry = self.__get_current_geometry()
+        points = geometry.vertices[geometry.face_indices].tolist()
+        return [
+            [Vector2(x, y) for (x, y) in points[start:end]]
+            for (start, end) in zip(geometry.face_offsets[:-1].tolist(), geometry.face_offsets[1:].tolist())
+        ]
+    # Filled Methods
+    def set_filled(self, fill: bool) -> None:
+        self.filled = fill
+    # Define Back Face Culling
+    def cull_back_faces(self, mirrored: bool) -> None:
+        # Only Filled Faces Hide what is Behind them
+        if not self.filled:
+            return
+        geometry = self.__get_current_geometry()
+        # Front Faces Wind Clockwise in the Projected Window (Counter Clockwise when Mirrored)
+        areas = ragged_signed_areas(geometry.vertices, geometry.face_indices, geometry.face_offsets)
+        (front_faces,) = nonzero(areas > 0 if mirrored else areas < 0)
+        (face_indices, face_offsets) = ragged_take(geometry.face_indices, geometry.face_offsets, front_faces)
+        self.__set_current_geometry(geometry._replace(face_indices=face_indices, face_offsets=face_offsets, face_colors=geometry.face_colors[front_faces]))
+    # Color Methods
+    def set_color(self, color_rgba: Tuple[float, float, float, float]):
+        super().set_color(color_rgba)
+        # Paint Every Face and Edge
+        geometry = self.__get_current_geometry()
+        face_colors = array([color_rgba] * geometry.face_colors.shape[0], dtype=float64).reshape((-1, 4))
+        edge_colors = None if geometry.edge_colors is None else array([color_rgba] * geometry.edge_colors.shape[0], dtype=float64).reshape((-1, 4))
+        self.__set_current_geometry(geometry._replace(face_colors=face_colors, edge_colors=edge_colors))
+    def get_colors(self) -> NDArray[float64]:
+        # One Color per Face
+        return self.geometry.face_colors
+    # Define Methods
+    def draw(self, cairo: Context):
+        if self.__draws_edges():
+            self.__draw_edges(cairo)
+        else:
+            self.__draw_faces(cairo)
+
+    def __draw_faces(self, cairo: Context):
+        geometry = self.__get_current_geometry()
+        # Gather Faces Points Once
+        points = geometry.vertices[geometry.face_indices].tolist()
+        offsets = geometry.face_offsets.tolist()
+        colors = geometry.face_colors.tolist()
+        for face in range(len(offsets) - 1):
+            # Filled Faces are Painted One by One, Stroked Faces Share a Path While the Color Holds
+            starts_path = self.filled or face == 0 or colors[face] != colors[face - 1]
+            if starts_path:
+                cairo.set_source_rgba(*colors[face])
+            # Draw Face Outline
+            (x, y) = points[offsets[face]]
+            cairo.move_to(x, y)
+            for (x, y) in points[offsets[face] + 1:offsets[face + 1]]:
+                cairo.line_to(x, y)
+            cairo.close_path()
+            # Show Result
+            if self.filled:
+                cairo.fill()
+            elif face == len(offsets) - 2 or colors[face] != colors[face + 1]:
+                cairo.stroke()
+
+    def __draw_edges(self, cairo: Context):
+        geometry = self.__get_current_geometry()
+        # Gather Segments Once
+        segments = geometry.vertices[geometry.edges].tolist()
+        colors = geometry.edge_colors.tolist()
+        for (edge, ((xa, ya), (xb, yb))) in enumerate(segments):
+            # Segments Share a Path While the Color Holds
+            if edge == 0 or colors[edge] != colors[edge - 1]:
+                cairo.set_source_rgba(*colors[edge])
+            cairo.move_to(xa, ya)
+            cairo.line_to(xb, yb)
+            # Show Result
+            if edge == len(segments) - 1 or colors[edge] != colors[edge + 1]:
+                cairo.stroke()
+
+    def transform(self, transformation: Matrix):
+        # Transform Shared Vertices (Once per Unique Vertex)
+        geometry = self.__get_current_geometry()
+        if not self.in_pipeline:
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+        self.__set_current_geometry(geometry._replace(vertices=transform_points(geometry.vertices, transformation)))
+        # Return Chain
+        return self
+
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.geometry.vertices
+
+    def get_center_coords(self) -> Vector2:
+        # Get Avg Vertex
+        (x, y) = self.__get_current_geometry().vertices.mean(axis=0).tolist()
+        return Vector2(x, y)
+
+    def clip(self, method: EClippingMethod) -> GraphicalObject | None:
+        # Check Clipping Disabled
+        if method == EClippingMethod.NONE:
+            return self
+        # Unfilled Meshes Clip their Unique Edges as Lines
+        return self.__clip_edges() if self.__draws_edges() else self.__clip_faces(method)
+
+    def __clip_edges(self) -> GraphicalObject | None:
+        geometry = self.__get_current_geometry()
+        # Clip All Segments at Once
+        (segments, visible) = cohen_sutherland_clip_lines(geometry.vertices[geometry.edges])
+        # Check Do Not Render
+        if not visible.any():
+            return None
+        # Clipped Segments Get their Own Vertices (Faces No Longer Match Them)
+        segments = segments[visible]
+        self.__set_current_geometry(MeshGeometry(
+            segments.reshape((-1, 2)),
+            empty((0,), dtype=int64),
+            array([0], dtype=int64),
+            empty((0, 4), dtype=float64),
+            arange(segments.shape[0] * 2, dtype=int64).reshape((-1, 2)),
+            geometry.edge_colors[visible]
+        ))
+        return self
+
+    def __clip_faces(self, method: EClippingMethod) -> GraphicalObject | None:
+        geometry = self.__get_current_geometry()
+        # Classify Faces by their Vertices Region Codes (Computed Once per Unique Vertex)
+        clipped = ragged_clip_faces(
+            geometry.vertices, geometry.face_indices, geometry.face_offsets, region_codes(geometry.vertices),
+            lambda points: None if (face := Wireframe2D(*points).clip(method)) is None else face.get_vertices()
+        )
+        # Check Do Not Render
+        if clipped is None:
+            return None
+        # Edges No Longer Match the Clipped Faces
+        (vertices, face_indices, face_offsets, faces) = clipped
+        self.__set_current_geometry(MeshGeometry(vertices, face_indices, face_offsets, geometry.face_colors[faces], None, None))
+        return self
@@ -0,0 +1,185 @@
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+from numpy import arange, argsort, array, concatenate, float64, int64, ndarray, nonzero
+from numpy.typing import NDArray
+from objects.mesh_2d import Mesh2D
+from objects.object_type import ObjectType
+from primitives.clipping_method import clip_lines_to_planes, clip_poly_to_planes, plane_codes
+from primitives.graphical_object import Graphical3DObject, GraphicalObject
+from primitives.matrix import Matrix, Vector3, array_into_vec3_list, transform_points, vec3_list_into_array
+from primitives.mesh_topology import faces_into_ragged, ragged_clip_faces, ragged_unique_edges
+
+class Mesh3D(Graphical3DObject):
+    # Define Constructor
+    def __init__(self, vertices: NDArray[float64], face_indices: NDArray[int64], face_offsets: NDArray[int64], face_colors: NDArray[float64] | None = None, filled: bool = False) -> None:
+        # Call Super Constructor
+        super().__init__()
+        # Check Faces
+        if face_offsets.shape[0] < 2:
+            raise ValueError("Mesh3D need 1 or more faces to be defined")
+        if (face_offsets[1:] - face_offsets[:-1] < 3).any():
+            raise ValueError("Mesh3D faces need 3 or more points to be defined")
+        # Define Attributes (Shared (V, 3) Vertices and Ragged Faces Indexing Them)
+        self.vertices = vertices
+        self.face_indices = face_indices
+        self.face_offsets = face_offsets
+        self.face_colors = (
+            array([self.color] * (face_offsets.shape[0] - 1), dtype=float64)
+            if face_colors is None
+            else face_colors
+        )
+        # Define Pipeline Attributes (Depth Clipping Replaces the Faces and Edges - None Uses the Persisted Ones)
+        self.pipeline_vertices = self.vertices
+        self.pipeline_faces: Tuple[NDArray[int64], NDArray[int64], NDArray[float64]] | None = None
+        self.pipeline_edges: Tuple[NDArray[int64], NDArray[float64]] | None = None
+        # Define Unique Edges Cache (Topology Only - Built on the First Wireframe Projection)
+        self.edges: Tuple[NDArray[int64], NDArray[float64]] | None = None
+        # Define Fill Options
+        self.filled = filled
+    def __str__(self) -> str:
+        return f"Mesh3D ({self.vertices.shape[0]} vertices, {self.face_offsets.shape[0] - 1} faces)\n"
+    # Define Builder
+    @staticmethod
+    def from_faces(vertices: Sequence[Vector3] | NDArray[float64], faces: List[List[int]], face_colors: List[Tuple[float, float, float, float]] | None = None) -> Mesh3D:
+        # Pack Faces (Lists of Indexes into the Vertices) into the Ragged Arrays
+        (face_indices, face_offsets) = faces_into_ragged(faces)
+        colors = None if face_colors is None else array(face_colors, dtype=float64)
+        points = vertices.astype(float64).reshape((-1, 3)) if isinstance(vertices, ndarray) else vec3_list_into_array(vertices)
+        return Mesh3D(points, face_indices, face_offsets, colors)
+    # Type Definition
+    @staticmethod
+    def get_type() -> ObjectType:
+        return ObjectType.MESH_3D
+    # Define Pipeline Methods
+    def pipeline(self):
+        # Reset Pipeline Vertices
+        self.pipeline_vertices = self.vertices
+        self.pipeline_faces = None
+        self.pipeline_edges = None
+        # Call Super
+        super().pipeline()
+    def pipeline_apply(self):
+        if self.in_pipeline:
+            # Persist Pipeline Vertices
+            self.vertices = self.pipeline_vertices
+            if self.pipeline_faces is not None:
+                (self.face_indices, self.face_offsets, self.face_colors) = self.pipeline_faces
+            if self.pipeline_edges is not None:
+                self.edges = self.pipeline_edges
+            # Call Super
+        super().pipeline_apply()
+    def __get_current_vertices(self) -> NDArray[float64]:
+        return self.pipeline_vertices if self.in_pipeline else self.vertices
+    def __get_current_faces(self) -> Tuple[NDArray[int64], NDArray[int64], NDArray[float64]]:
+        if self.in_pipeline and self.pipeline_faces is not None:
+            return self.pipeline_faces
+        return (self.face_indices, self.face_offsets, self.face_colors)
+    def __get_current_edges(self) -> Tuple[NDArray[int64], NDArray[float64]]:
+        if self.in_pipeline and self.pipeline_edges is not None:
+            return self.pipeline_edges
+        return self.get_edges()
+    # Define Vector View
+    def get_points(self) -> List[Vector3]:
+        return array_into_vec3_list(self.__get_current_vertices())
+    def get_faces(self) -> List[List[int]]:
+        # Faces as Lists of Indexes into get_points()
+        indices = self.face_indices.tolist()
+        return [indices[start:end] for (start, end) in zip(self.face_offsets[:-1].tolist(), self.face_offsets[1:].tolist())]
+    # Filled Methods
+    def set_filled(self, fill: bool) -> None:
+        self.filled = fill
+    # Color Methods
+    def set_color(self, color_rgba: Tuple[float, float, float, float]):
+        super().set_color(color_rgba)
+        # Paint Every Face
+        self.face_colors = array([color_rgba] * self.face_colors.shape[0], dtype=float64)
+        # Edge Colors are Taken from the Faces
+        self.edges = None
+    def get_colors(self) -> NDArray[float64]:
+        # One Color per Face
+        return self.face_colors
+    def get_edges(self) -> Tuple[NDArray[int64], NDArray[float64]]:
+        # Deduplicate the Faces Edges Once (Shared Edges are Stroked a Single Time)
+        if self.edges is None:
+            (edges, edge_faces) = ragged_unique_edges(self.face_indices, self.face_offsets)
+            self.edges = (edges, self.face_colors[edge_faces])
+        return self.edges
+    # Define Methods
+    def project(self, projection_matrix: Matrix) -> GraphicalObject:
+        # Project Each Shared Vertex Once
+        projected_vertices = transform_points(self.__get_current_vertices(), projection_matrix)[:, :2]
+        mesh = Mesh2D(
+            projected_vertices, *self.__get_current_faces(), self.filled,
+            None if self.filled else self.__get_current_edges()
+        )
+        mesh.pipeline()
+        # Return Projected Mesh
+        return mesh
+
+    def clip_depth(self, planes: NDArray[float64]) -> Graphical3DObject | None:
+        vertices = self.__get_current_vertices()
+        # Classify Each Shared Vertex Once
+        codes = plane_codes(vertices, planes)
+        if not codes.any():
+            return self
+        faces = self.__get_current_faces()
+        edges = self.pipeline_edges if self.in_pipeline else self.edges
+        if self.filled:
+            # Clip Faces Crossing the Planes as Polygons
+            (face_indices, face_offsets, face_colors) = faces
+            clipped = ragged_clip_faces(
+                vertices, face_indices, face_offsets, codes,
+                lambda points: None if (face := clip_poly_to_planes(points, planes)).shape[0] < 3 else face
+            )
+            if clipped is None:
+                return None
+            (vertices, face_indices, face_offsets, source_faces) = clipped
+            faces = (face_indices, face_offsets, face_colors[source_faces])
+        else:
+            # Clip Edges Crossing the Planes as Lines
+            (edge_indices, edge_colors) = self.__get_current_edges()
+            edge_codes = codes[edge_indices]
+            (kept_edges,) = nonzero((edge_codes[:, 0] | edge_codes[:, 1]) == 0)
+            (crossing_edges,) = nonzero(((edge_codes[:, 0] | edge_codes[:, 1]) != 0) & ((edge_codes[:, 0] & edge_codes[:, 1]) == 0))
+            (segments, visible) = clip_lines_to_planes(vertices[edge_indices[crossing_edges]], planes)
+            (segments, crossing_edges) = (segments[visible], crossing_edges[visible])
+            if kept_edges.shape[0] == 0 and crossing_edges.shape[0] == 0:
+                return None
+            # Clipped Edges Get their Own Vertices (Original Order is Restored)
+            source_edges = concatenate((kept_edges, crossing_edges))
+            order = argsort(source_edges, kind="stable")
+            edge_indices = concatenate((edge_indices[kept_edges], vertices.shape[0] + arange(segments.shape[0] * 2, dtype=int64).reshape((-1, 2))))
+            vertices = concatenate((vertices, segments.reshape((-1, 3))))
+            edges = (edge_indices[order], edge_colors[source_edges[order]])
+        # Update Geometry
+        if self.in_pipeline:
+            self.pipeline_vertices = vertices
+            self.pipeline_faces = faces
+            self.pipeline_edges = edges
+        else:
+            self.invalidate_bounding_box()
+            self.vertices = vertices
+            (self.face_indices, self.face_offsets, self.face_colors) = faces
+            self.edges = edges
+        return self
+
+    def transform(self, transformation: Matrix):
+        # Transform Shared Vertices
+        if self.in_pipeline:
+            # Pipeline
+            self.pipeline_vertices = transform_points(self.pipeline_vertices, transformation)
+        else:
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.vertices = transform_points(self.vertices, transformation)
+        # Return Chain
+        return self
+
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.vertices
+
+    def get_center_coords3(self) -> Vector3:
+        # Get Avg Vertex
+        (x, y, z) = self.__get_current_vertices().mean(axis=0).tolist()
+        return Vector3(x, y, z)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, cast
+from numpy import float64, stack, vstack
+from numpy.typing import NDArray
 from objects.object_type import ObjectType
 from objects.wireframe_2d import Wireframe2D
 from primitives.clipping_method import EClippingMethod
@@ -32,12 +34,37 @@ class Object2D(GraphicalObject):
     def pipeline(self):
         # Reset Pipeline wireframes
         self.pipeline_wireframes = self.wireframes
+        for wireframe in self.wireframes:
+            wireframe.pipeline()
+        # Call Super
+        super().pipeline()
     def pipeline_apply(self):
-        self.wireframes = self.wireframes
+        if self.in_pipeline:
+            self.wireframes = self.pipeline_wireframes
+        for wireframe in self.wireframes:
+            wireframe.pipeline_apply()
+        # Call Super (Persisted Wireframes Changed)
+        super().pipeline_apply()
+    def pipeline_abort(self):
+        for wireframe in self.wireframes:
+            wireframe.pipeline_abort()
+        # Call Super
+        super().pipeline_abort()
     # Filled Methods
     def set_filled(self, fill: bool) -> None:
         for wireframe in self.__get_wireframes():
             wireframe.set_filled(fill)
+    # Define Back Face Culling
+    def cull_back_faces(self, mirrored: bool) -> None:
+        # Keep Unfilled Wireframes and Filled Front Faces (Clockwise in the Projected Window, Counter Clockwise when Mirrored)
+        wireframes = [wf for wf in self.__get_wireframes() if not wf.filled or Object2D.__is_front_face(wf.get_signed_area(), mirrored)]
+        if self.in_pipeline:
+            self.pipeline_wireframes = wireframes
+        else:
+            self.wireframes = wireframes
+    @staticmethod
+    def __is_front_face(area: float, mirrored: bool) -> bool:
+        return area > 0 if mirrored else area < 0
     # Define Methods
     def draw(self, cairo: Context):
         for wireframe in self.__get_wireframes():
@@ -46,9 +73,30 @@ class Object2D(GraphicalObject):
     def transform(self, transformation: Matrix):
         for wireframe in self.__get_wireframes():
             wireframe.transform(transformation)
+        # Raw Transform Moved the Wireframes (Invalidates Cached Bounds)
+        if not self.in_pipeline:
+            self.invalidate_bounding_box()
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return vstack([wireframe.get_vertices() for wireframe in self.wireframes])
+
+    def get_colors(self) -> NDArray[float64]:
+        # One Color per Wireframe
+        return vstack([wireframe.get_colors() for wireframe in self.wireframes])
+
+    def get_bounding_box(self) -> NDArray[float64] | None:
+        # Merge Wireframes Cached Boxes
+        if self.bounding_box is None:
+            wireframe_boxes = [box for wireframe in self.wireframes if (box := wireframe.get_bounding_box()) is not None]
+            if len(wireframe_boxes) == 0:
+                return None
+            boxes = stack(wireframe_boxes)
+            self.bounding_box = vstack((boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0)))
+        return self.bounding_box
+
     def get_center_coords(self) -> Vector2:
         # Get wireframes
         wireframes_center_coords = [wireframe.get_center_coords() for wireframe in self.__get_wireframes()]
@@ -57,7 +105,7 @@ class Object2D(GraphicalObject):
         return (wireframes_center * (1 / len(wireframes_center_coords))).try_into_vec2()
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
-        points = [cast(Wireframe2D, clipped_wf) for wf in self.wireframes if (clipped_wf := wf.clip(method)) is not None]
+        points = [cast(Wireframe2D, clipped_wf) for wf in self.__get_wireframes() if (clipped_wf := wf.clip(method)) is not None]
         if self.in_pipeline:
             self.pipeline_wireframes = points
         else:
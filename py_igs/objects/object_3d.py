@@ -1,5 +1,7 @@
 # Import Dependencies
 from typing import List, cast
+from numpy import float64, stack, vstack
+from numpy.typing import NDArray
 from objects.object_2d import Object2D
 from objects.object_type import ObjectType
 from objects.wireframe_2d import Wireframe2D
@@ -14,6 +16,8 @@ class Object3D(Graphical3DObject):
         super().__init__()
         # Define Attributes
         self.wireframes = list(wireframes)
+        # Define Pipeline Attributes (Depth Clipping Drops Wireframes)
+        self.pipeline_wireframes = self.wireframes
         # Define Fill Options
         self.filled = False
     def __str__(self) -> str:
@@ -26,16 +30,28 @@ class Object3D(Graphical3DObject):
     def get_type() -> ObjectType:
         return ObjectType.OBJECT_3D
     # Define Pipeline Methods
+    def __get_wireframes(self) -> List[Wireframe3D]:
+        return self.pipeline_wireframes if self.in_pipeline else self.wireframes
+
     def pipeline(self):
         # Reset Pipeline wireframes
+        self.pipeline_wireframes = self.wireframes
         for wireframe in self.wireframes:
             wireframe.pipeline()
+        # Call Super
+        super().pipeline()
     def pipeline_apply(self):
+        if self.in_pipeline:
+            self.wireframes = self.pipeline_wireframes
         for wireframe in self.wireframes:
             wireframe.pipeline_apply()
+        # Call Super (Persisted Wireframes Changed)
+        super().pipeline_apply()
     def pipeline_abort(self):
         for wireframe in self.wireframes:
             wireframe.pipeline_abort()
+        # Call Super
+        super().pipeline_abort()
     # Filled Methods
     def set_filled(self, fill: bool) -> None:
         for wireframe in self.wireframes:
@@ -43,22 +59,55 @@ class Object3D(Graphical3DObject):
     # Define Methods    
     def project(self, projection_matrix: Matrix) -> GraphicalObject:
         # Project Object
-        wireframes = cast(List[Wireframe2D], [wireframe.project(projection_matrix) for wireframe in self.wireframes])
+        wireframes = cast(List[Wireframe2D], [wireframe.project(projection_matrix) for wireframe in self.__get_wireframes()])
         object_2d = Object2D(*wireframes)
         object_2d.pipeline()
         # Return Projected Object
         return object_2d
 
+    def clip_depth(self, planes: NDArray[float64]) -> Graphical3DObject | None:
+        # Keep Wireframes with Something Left in Front of the Planes
+        wireframes = [wireframe for wireframe in self.__get_wireframes() if wireframe.clip_depth(planes) is not None]
+        if len(wireframes) == 0:
+            return None
+        if self.in_pipeline:
+            self.pipeline_wireframes = wireframes
+        else:
+            self.invalidate_bounding_box()
+            self.wireframes = wireframes
+        return self
+
     def transform(self, transformation: Matrix):
         # Transform wireframes
-        for wireframe in self.wireframes:
+        for wireframe in self.__get_wireframes():
             wireframe.transform(transformation)
+        # Raw Transform Moved the Wireframes (Invalidates Cached Bounds)
+        if not self.in_pipeline:
+            self.invalidate_bounding_box()
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return vstack([wireframe.get_vertices() for wireframe in self.wireframes])
+
+    def get_colors(self) -> NDArray[float64]:
+        # One Color per Wireframe
+        return vstack([wireframe.get_colors() for wireframe in self.wireframes])
+
+    def get_bounding_box(self) -> NDArray[float64] | None:
+        # Merge Wireframes Cached Boxes
+        if self.bounding_box is None:
+            wireframe_boxes = [box for wireframe in self.wireframes if (box := wireframe.get_bounding_box()) is not None]
+            if len(wireframe_boxes) == 0:
+                return None
+            boxes = stack(wireframe_boxes)
+            self.bounding_box = vstack((boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0)))
+        return self.bounding_box
+
     def get_center_coords3(self) -> Vector3:
         # Get wireframes
-        wireframes_center_coords = [wireframe.get_center_coords3() for wireframe in self.wireframes]
+        wireframes_center_coords = [wireframe.get_center_coords3() for wireframe in self.__get_wireframes()]
         wireframes_center = sum(wireframes_center_coords, Vector3(0, 0, 0))
         # Compute Average
         return (wireframes_center * (1 / len(wireframes_center_coords))).try_into_vec3()
\ No newline at end of file
@@ -16,6 +16,8 @@ class ObjectType(IntEnum):
     OBJECT_3D = 10
     BEZIER_3D = 11
     BSPLINE_3D = 12
+    MESH_2D = 13
+    MESH_3D = 14
     # Handle Print
     def __str__(self) -> str:
         if self is ObjectType.POINT_2D:
@@ -42,5 +44,9 @@ class ObjectType(IntEnum):
             return "BEZIER_3D"
         elif self is ObjectType.BSPLINE_3D:
             return "BSPLINE_3D"
+        elif self is ObjectType.MESH_2D:
+            return "MESH_2D"
+        elif self is ObjectType.MESH_3D:
+            return "MESH_3D"
         else:
             raise ValueError("Invalid Type")
\ No newline at end of file
@@ -1,21 +1,24 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from numpy import float64
+from numpy.typing import NDArray
 from objects.object_type import ObjectType
 from primitives.clipping_method import EClippingMethod
 from primitives.graphical_object import GraphicalObject
+from primitives.matrix import Vector2, transform_points, vec2_list_into_array
 if TYPE_CHECKING:
     from cairo import Context
-    from primitives.matrix import Matrix, Vector2
+    from primitives.matrix import Matrix
 
 class Point2D(GraphicalObject):
     # Define Constructor
-    def __init__(self, point: Vector2) -> None:
+    def __init__(self, point: Vector2 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
-        # Define Attributes
-        self.point = point
+        # Define Attributes (Stored as a (1, 2) Array)
+        self.point = vec2_list_into_array([point])
         # Define Pipeline Attributes
-        self.pipeline_point = point
+        self.pipeline_point = self.point
     # Type Definition
     @staticmethod
     def get_type() -> ObjectType:
@@ -32,16 +35,16 @@ class Point2D(GraphicalObject):
             self.point = self.pipeline_point
             # Call Super
             super().pipeline_apply()
-    def __get_current_point(self) -> Vector2:
+    def __get_current_point(self) -> NDArray[float64]:
         return self.pipeline_point if self.in_pipeline else self.point
+    # Define Vector View
+    def get_point(self) -> Vector2:
+        (x, y) = self.__get_current_point()[0].tolist()
+        return Vector2(x, y)
     # Define Methods
     def draw(self, cairo: Context):
         # Get Point
-        point = self.pipeline_point if self.in_pipeline else self.point
-        # Cast points into homogeneus space
-        homo2d_point = point.as_vec3(1)
-        # Cast to Vector2
-        (x1, y1) = homo2d_point.try_into_vec2().as_tuple()
+        (x1, y1) = self.__get_current_point()[0].tolist()
         # Get Cairo Line Width
         old_width = cairo.get_line_width()
         new_width = 1
@@ -57,30 +60,36 @@ class Point2D(GraphicalObject):
         cairo.close_path()
         cairo.stroke()
         cairo.set_line_width(old_width)
-    
+
     def transform(self, transformation: Matrix):
         # Transform Point
         if self.in_pipeline:
             # Pipelines
-            self.pipeline_point = (self.pipeline_point.as_vec3(1) * transformation).try_into_vec2()
+            self.pipeline_point = transform_points(self.pipeline_point, transformation)
         else:
-            # Raw Transform
-            self.point = (self.point.as_vec3(1) * transformation).try_into_vec2()
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.point = transform_points(self.point, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.point
+
     def get_center_coords(self) -> Vector2:
-        return self.point        
+        (x, y) = self.point[0].tolist()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
         # Switch Method
         if method == EClippingMethod.POINT_CLIP:
             # Get Current Point
-            point = self.__get_current_point()
+            (x, y) = self.__get_current_point()[0].tolist()
             # Check Point in Window Domain
             if (
-                point.get_x() >= -1 and point.get_x() <= 1 and
-                point.get_y() >= -1 and point.get_y() <= 1 
+                x >= -1 and x <= 1 and
+                y >= -1 and y <= 1
             ):
                 return self
             else:
@@ -1,21 +1,25 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from numpy import float64
+from numpy.typing import NDArray
 from objects.object_type import ObjectType
+from primitives.clipping_method import plane_distances
 from primitives.graphical_object import Graphical3DObject, GraphicalObject
+from primitives.matrix import Vector3, transform_points, vec3_list_into_array
 from objects.point_2d import Point2D
 
 if TYPE_CHECKING:
-    from primitives.matrix import Matrix, Vector3
+    from primitives.matrix import Matrix
 
 class Point3D(Graphical3DObject):
     # Define Constructor
-    def __init__(self, point: Vector3) -> None:
+    def __init__(self, point: Vector3 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
-        # Define Attributes
-        self.point = point
+        # Define Attributes (Stored as a (1, 3) Array)
+        self.point = vec3_list_into_array([point])
         # Define Pipeline Attributes
-        self.pipeline_point = point
+        self.pipeline_point = self.point
     # Type Definition
     @staticmethod
     def get_type() -> ObjectType:
@@ -32,21 +36,37 @@ class Point3D(Graphical3DObject):
             self.point = self.pipeline_point
             # Call Super
             super().pipeline_apply()
+    def __get_current_point(self) -> NDArray[float64]:
+        return self.pipeline_point if self.in_pipeline else self.point
+    # Define Vector View
+    def get_point(self) -> Vector3:
+        (x, y, z) = self.__get_current_point()[0].tolist()
+        return Vector3(x, y, z)
     # Define Methods    
     def project(self, projection_matrix: Matrix) -> GraphicalObject:
-        point = self.pipeline_point if self.in_pipeline else self.point
-        return Point2D((point.as_vec4(1) * projection_matrix).try_into_vec3_homo().try_into_vec2())
+        point = self.__get_current_point()
+        return Point2D(transform_points(point, projection_matrix)[0, :2])
+
+    def clip_depth(self, planes: NDArray[float64]) -> Graphical3DObject | None:
+        # Keep Point Only in Front of Every Plane
+        return self if (plane_distances(self.__get_current_point(), planes) >= 0).all() else None
 
     def transform(self, transformation: Matrix):
         # Transform Point
         if self.in_pipeline:
             # Pipelines
-            self.pipeline_point = (self.pipeline_point.as_vec4(1) * transformation).try_into_vec3()
+            self.pipeline_point = transform_points(self.pipeline_point, transformation)
         else:
-            # Raw Transform
-            self.point = (self.point.as_vec4(1) * transformation).try_into_vec3()
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.point = transform_points(self.point, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.point
+
     def get_center_coords3(self) -> Vector3:
-        return self.point
\ No newline at end of file
+        (x, y, z) = self.point[0].tolist()
+        return Vector3(x, y, z)
@@ -1,30 +1,32 @@
 from __future__ import annotations
 from typing import List, TYPE_CHECKING, Tuple
+from numpy import float64, roll
+from numpy.typing import NDArray
 from objects.object_type import ObjectType
-from primitives.clipping_method import EClippingMethod, weiler_atherton_w_cs_clip_poly, weiler_atherton_w_lb_clip_poly
+from primitives.clipping_method import EClippingMethod, sutherland_hodgman_clip_poly, weiler_atherton_w_cs_clip_poly, weiler_atherton_w_lb_clip_poly
 from primitives.graphical_object import GraphicalObject
-from primitives.matrix import Matrix, Vector2
+from primitives.matrix import Matrix, Vector2, array_into_vec2_list, transform_points, vec2_list_into_array
 if TYPE_CHECKING:
     from cairo import Context
 
 class Wireframe2D(GraphicalObject):
     # Define Constructor
-    def __init__(self, *points: Vector2, filled: bool = False, color: Tuple[float, float, float, float] = (1, 1, 1, 1)) -> None:
+    def __init__(self, *points: Vector2 | NDArray[float64], filled: bool = False, color: Tuple[float, float, float, float] = (1, 1, 1, 1)) -> None:
         # Call Super Constructor
         super().__init__()
         # Check Points Length
         if len(points) < 3:
             raise ValueError("Wireframe2D need 3 or more points to be defined")
-        # Define Attributes
-        self.points = list(points)
+        # Define Attributes (Stored as a (N, 2) Array)
+        self.points = vec2_list_into_array(points)
         # Define Pipeline Attributes
-        self.pipeline_points = list(points)
+        self.pipeline_points = self.points
         # Define Fill Options
         self.filled = filled
         self.color = color
     def __str__(self) -> str:
         desc = "Wireframe2D\n"
-        for point in (self.pipeline_points if self.in_pipeline else self.points):
+        for point in self.get_points():
             desc += "\t" + point.__str__() + "\n"
         return desc
     # Type Definition
@@ -34,42 +36,45 @@ class Wireframe2D(GraphicalObject):
     # Define Pipeline Methods
     def pipeline(self):
         # Reset Pipeline Points
-        self.pipeline_points = list(self.points)
+        self.pipeline_points = self.points
         # Call Super
         super().pipeline()
     def pipeline_apply(self):
         if self.in_pipeline:
             # Persist Pipeline Points
-            self.points = list(self.pipeline_points)
+            self.points = self.pipeline_points
             # Call Super
         super().pipeline_apply()
 
-    def __get_current_points(self) -> List[Vector2]:
+    def __get_current_points(self) -> NDArray[float64]:
         return self.pipeline_points if self.in_pipeline else self.points
+    def __set_current_points(self, points: NDArray[float64]) -> None:
+        if self.in_pipeline:
+            self.pipeline_points = points
+        else:
+            self.points = points
+    # Define Vector View
+    def get_points(self) -> List[Vector2]:
+        return array_into_vec2_list(self.__get_current_points())
     # Filled Methods
     def set_filled(self, fill: bool) -> None:
         self.filled = fill
     # Define Methods
     def draw(self, cairo: Context):
         # Get Points
-        points = self.pipeline_points if self.in_pipeline else self.points
+        xy_points = self.__get_current_points().tolist()
         # Set Color
         cairo.set_source_rgba(*self.color)
-        # Cast points into homogeneus space and match them with screen coords
-        xy_points = [ point.as_tuple() for point in points ]
         xy_points_len = len(xy_points)
         # Draw segments in canvas
-        for (x, y), idx in zip(xy_points, range(xy_points_len)):
-
+        for idx, (x, y) in enumerate(xy_points):
             # Check non starting the drawing
             if idx != 0:
-                 # Draw normal line
+                # Draw normal line
                 cairo.line_to(x, y)
                 # Check ending the drawing
                 if idx == (xy_points_len - 1):
                     # Close drawing
-                    # (x_init, y_init) = xy_points[0]
-                    # cairo.line_to(x_init, y_init)
                     cairo.close_path()
             else:
                 # Move to polygon start
@@ -79,60 +84,62 @@ class Wireframe2D(GraphicalObject):
             cairo.fill()
         else:
             cairo.stroke()
-    
+
     def transform(self, transformation: Matrix):
         # Transform points
         if self.in_pipeline:
             # Pipeline
-            self.pipeline_points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.pipeline_points
-            ]
+            self.pipeline_points = transform_points(self.pipeline_points, transformation)
         else:
-            # Raw Transform
-            self.points = [
-                (point.as_vec3(1) * transformation).try_into_vec2()
-                for point in self.points
-            ]
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.points = transform_points(self.points, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.points
+
+    def get_signed_area(self) -> float:
+        # Shoelace Area (Positive when Counter Clockwise)
+        points = self.__get_current_points()
+        following = roll(points, -1, axis=0)
+        return float(0.5 * ((points[:, 0] * following[:, 1]) - (following[:, 0] * points[:, 1])).sum())
+
     def get_center_coords(self) -> Vector2:
-        # Get Points
-        points = self.pipeline_points if self.in_pipeline else self.points
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector2(0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec2()
+        (x, y) = self.__get_current_points().mean(axis=0).tolist()
+        return Vector2(x, y)
 
     def clip(self, method: EClippingMethod) -> GraphicalObject | None:
         # Switch Method
         if method == EClippingMethod.POLY_WEILER_ATHERTON_WITH_CS:
             # Clip Lines
-            points = weiler_atherton_w_cs_clip_poly(self.__get_current_points())
+            points = weiler_atherton_w_cs_clip_poly(self.get_points())
             if points is None:
                 return None
             # Update Self Points
-            if self.in_pipeline:
-                self.pipeline_points = points
-            else:
-                self.points = points
+            self.__set_current_points(vec2_list_into_array(points))
             return self
         elif method == EClippingMethod.POLY_WEILER_ATHERTON_WITH_LB:
             # Clip Lines
-            points = weiler_atherton_w_lb_clip_poly(self.__get_current_points())
+            points = weiler_atherton_w_lb_clip_poly(self.get_points())
             # Check Do Not Render
             if len(points) == 0:
                 return None
             # Update Points
-            if self.in_pipeline:
-                self.pipeline_points = points
-            else:
-                self.points = points
+            self.__set_current_points(vec2_list_into_array(points))
+            return self
+        elif method == EClippingMethod.POLY_SUTHERLAND_HODGMAN:
+            # Clip Polygon Array
+            clipped_points = sutherland_hodgman_clip_poly(self.__get_current_points())
+            # Check Do Not Render
+            if clipped_points.shape[0] < 3:
+                return None
+            # Update Points
+            self.__set_current_points(clipped_points)
             return self
         else:
             # Default - Trait as None Clipping
-            return self
\ No newline at end of file
+            return self
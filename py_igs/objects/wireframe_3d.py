@@ -1,26 +1,30 @@
 from __future__ import annotations
+from typing import List
+from numpy import float64
+from numpy.typing import NDArray
 from objects.object_type import ObjectType
+from primitives.clipping_method import clip_poly_to_planes
 from primitives.graphical_object import Graphical3DObject, GraphicalObject
-from primitives.matrix import Matrix, Vector3
+from primitives.matrix import Matrix, Vector3, array_into_vec3_list, transform_points, vec3_list_into_array
 from objects.wireframe_2d import Wireframe2D
 
 class Wireframe3D(Graphical3DObject):
     # Define Constructor
-    def __init__(self, *points: Vector3) -> None:
+    def __init__(self, *points: Vector3 | NDArray[float64]) -> None:
         # Call Super Constructor
         super().__init__()
         # Check Points Length
         if len(points) < 3:
             raise ValueError("Wireframe3D need 3 or more points to be defined")
-        # Define Attributes
-        self.points = list(points)
+        # Define Attributes (Stored as a (N, 3) Array)
+        self.points = vec3_list_into_array(points)
         # Define Pipeline Attributes
-        self.pipeline_points = list(points)
+        self.pipeline_points = self.points
         # Define Fill Options
         self.filled = False
     def __str__(self) -> str:
         desc = "Wireframe3D\n"
-        for point in (self.pipeline_points if self.in_pipeline else self.points):
+        for point in self.get_points():
             desc += "\t" + point.__str__() + "\n"
         return desc
     # Type Definition
@@ -30,52 +34,64 @@ class Wireframe3D(Graphical3DObject):
     # Define Pipeline Methods
     def pipeline(self):
         # Reset Pipeline Points
-        self.pipeline_points = list(self.points)
+        self.pipeline_points = self.points
         # Call Super
         super().pipeline()
     def pipeline_apply(self):
         if self.in_pipeline:
             # Persist Pipeline Points
-            self.points = list(self.pipeline_points)
+            self.points = self.pipeline_points
             # Call Super
         super().pipeline_apply()
+    def __get_current_points(self) -> NDArray[float64]:
+        return self.pipeline_points if self.in_pipeline else self.points
+    # Define Vector View
+    def get_points(self) -> List[Vector3]:
+        return array_into_vec3_list(self.__get_current_points())
     # Filled Methods
     def set_filled(self, fill: bool) -> None:
         self.filled = fill
     # Define Methods    
     def project(self, projection_matrix: Matrix) -> GraphicalObject:
         # Get Points
-        points = self.pipeline_points if self.in_pipeline else self.points
+        points = self.__get_current_points()
         # Project Points
-        points = [(point.as_vec4(1) * projection_matrix).try_into_vec3_homo().try_into_vec2() for point in points]
+        projected_points = transform_points(points, projection_matrix)[:, :2]
         # Return new Wireframe
-        wireframe = Wireframe2D(*points, color=self.color, filled=self.filled)
+        wireframe = Wireframe2D(*projected_points, color=self.color, filled=self.filled)
         return wireframe
 
+    def clip_depth(self, planes: NDArray[float64]) -> Graphical3DObject | None:
+        # Clip Polygon Plane by Plane
+        clipped_points = clip_poly_to_planes(self.__get_current_points(), planes)
+        # Check Do Not Render
+        if clipped_points.shape[0] < 3:
+            return None
+        # Update Points
+        if self.in_pipeline:
+            self.pipeline_points = clipped_points
+        else:
+            self.invalidate_bounding_box()
+            self.points = clipped_points
+        return self
+
     def transform(self, transformation: Matrix):
         # Transform points
         if self.in_pipeline:
             # Pipeline
-            self.pipeline_points = [
-                (point.as_vec4(1) * transformation).try_into_vec3()
-                for point in self.pipeline_points
-            ]
+            self.pipeline_points = transform_points(self.pipeline_points, transformation)
         else:
-            # Raw Transform
-            self.points = [
-                (point.as_vec4(1) * transformation).try_into_vec3()
-                for point in self.points
-            ]
+            # Raw Transform (Invalidates Cached Bounds)
+            self.invalidate_bounding_box()
+            self.points = transform_points(self.points, transformation)
         # Return Chain
         return self
 
+    def get_vertices(self) -> NDArray[float64]:
+        # Return Persisted Drawable Points
+        return self.points
+
     def get_center_coords3(self) -> Vector3:
-        # Get Points
-        points = self.pipeline_points if self.in_pipeline else self.points
         # Get Avg Point
-        points_len_mult = 1 / len(points)
-        avg_coords = Vector3(0, 0, 0)
-        for point in points:
-            avg_coords += point
-        avg_coords *= points_len_mult
-        return avg_coords.try_into_vec3()
\ No newline at end of file
+        (x, y, z) = self.__get_current_points().mean(axis=0).tolist()
+        return Vector3(x, y, z)
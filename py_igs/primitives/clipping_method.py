@@ -3,6 +3,9 @@ from __future__ import annotations
 # from typing import TYPE_CHECKING
 from enum import unique, IntEnum, IntFlag
 from typing import Callable, List, Tuple
+from numba import jit #type: ignore
+from numpy import arange, ascontiguousarray, bool_, empty, float64, int64, stack, where, zeros
+from numpy.typing import NDArray
 from primitives.matrix import Vector2
 from itertools import chain
 
@@ -15,6 +18,7 @@ class EClippingMethod(IntEnum):
     LINE_LIANG_BARSKY = 3
     POLY_WEILER_ATHERTON_WITH_CS = 4
     POLY_WEILER_ATHERTON_WITH_LB = 5
+    POLY_SUTHERLAND_HODGMAN = 6
     
 @unique
 class ERegionCode(IntFlag):
@@ -136,6 +140,103 @@ def clip_point_region_code(point: Vector2, inital_point: Vector2, region_code: E
     # Return Clipped Data
     return current_point
 
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __region_code__(x: float, y: float) -> int:
+    # Compute X Axis
+    code = 0b0001 if x < -1 else 0b0010 if x > 1 else 0b0000
+    # Compute Y Axis
+    code |= 0b0100 if y < -1 else 0b1000 if y > 1 else 0b0000
+    return code
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __clip_point_region_code__(x: float, y: float, x0: float, y0: float, region_code: int, angular_coefficient: float) -> Tuple[float, float]:
+    # Same Steps as clip_point_region_code, Intersections Computed from the Initial Point
+    # Clip Left/Right
+    if region_code & 0b0001:
+        (x, y) = (-1.0, y0 + (angular_coefficient * (-1 - x0)))
+    if region_code & 0b0010:
+        (x, y) = (1.0, y0 + (angular_coefficient * (1 - x0)))
+    # Check Done Already
+    if abs(x) <= 1 and abs(y) <= 1:
+        return (x, y)
+    # Clip Up/Down
+    if region_code & 0b1000:
+        (x, y) = (x0 + ((1 - y0) / angular_coefficient), 1.0)
+    if region_code & 0b0100:
+        (x, y) = (x0 + ((-1 - y0) / angular_coefficient), -1.0)
+    return (x, y)
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __cohen_sutherland_clip_lines__(edges: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[bool_]]:
+    # Define Outputs
+    edges_n = edges.shape[0]
+    clipped = edges.copy()
+    visible = zeros(edges_n, dtype=bool_)
+    for idx in range(edges_n):
+        (xl, yl, xr, yr) = (edges[idx, 0, 0], edges[idx, 0, 1], edges[idx, 1, 0], edges[idx, 1, 1])
+        # Compute Region Codes
+        rc_l = __region_code__(xl, yl)
+        rc_r = __region_code__(xr, yr)
+        # Completely Visible
+        if (rc_l | rc_r) == 0:
+            visible[idx] = True
+            continue
+        # Completely Invisible
+        if (rc_l & rc_r) != 0:
+            continue
+        # Partially Visible - Handle Edge Case (Xs are equal)
+        if xl == xr:
+            clipped[idx, 0, 1] = min(max(-1.0, yl), 1.0)
+            clipped[idx, 1, 1] = min(max(-1.0, yr), 1.0)
+            visible[idx] = True
+            continue
+        angular_coefficient = (yr - yl) / (xr - xl)
+        # Clip First Point
+        if rc_l != 0:
+            (cx, cy) = __clip_point_region_code__(xl, yl, xl, yl, rc_l, angular_coefficient)
+            if cx < -1 or cx > 1 or cy < -1 or cy > 1:
+                continue
+            (clipped[idx, 0, 0], clipped[idx, 0, 1]) = (cx, cy)
+        # Clip Second Point
+        if rc_r != 0:
+            (cx, cy) = __clip_point_region_code__(xr, yr, xl, yl, rc_r, angular_coefficient)
+            if cx < -1 or cx > 1 or cy < -1 or cy > 1:
+                continue
+            (clipped[idx, 1, 0], clipped[idx, 1, 1]) = (cx, cy)
+        visible[idx] = True
+    return (clipped, visible)
+
+def cohen_sutherland_clip_lines(edges: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[bool_]]:
+    # Clip (M, 2, 2) Edges at Once - Returns the Clipped Edges and the Visibility Mask
+    return __cohen_sutherland_clip_lines__(ascontiguousarray(edges, dtype=float64))
+
+def region_codes(points: NDArray[float64]) -> NDArray[int64]:
+    # Cohen-Sutherland Region Code of Every (N, 2) Point at Once
+    (x, y) = (points[:, 0], points[:, 1])
+    return (
+        (x < -1).astype(int64) * ERegionCode.LEFT
+        | (x > 1).astype(int64) * ERegionCode.RIGHT
+        | (y < -1).astype(int64) * ERegionCode.BOTTOM
+        | (y > 1).astype(int64) * ERegionCode.UPPER
+    )
+
+def polyline_into_edges(points: NDArray[float64]) -> NDArray[float64]:
+    # Pair Consecutive (N, 2) Points into (N - 1, 2, 2) Edges
+    return stack((points[:-1], points[1:]), axis=1)
+
+def edges_into_breaks(edges: NDArray[float64]) -> NDArray[bool_]:
+    # Flag the Flattened (M, 2, D) Edges Points Starting a New Path (Edges not Joined to the Previous Edge End)
+    breaks = zeros(edges.shape[:2], dtype=bool_)
+    breaks[0:1, 0] = True
+    breaks[1:, 0] = (edges[1:, 0] != edges[:-1, 1]).any(axis=1)
+    return breaks.reshape(-1)
+
+def runs_into_breaks(runs: NDArray[int64], points_n: int) -> NDArray[bool_]:
+    # Flag the Points Starting Each (R, 2) [Start, End) Run of a Clipped Polyline
+    breaks = zeros((points_n,), dtype=bool_)
+    breaks[runs[:, 0]] = True
+    return breaks
+
 def liang_barsky_clip_line(point_a: Vector2, point_b: Vector2) -> Tuple[Vector2, Vector2] | None:
     # Check Heuristic
     # Compute Delta X and Delta Y
@@ -162,6 +263,70 @@ def liang_barsky_clip_line(point_a: Vector2, point_b: Vector2) -> Tuple[Vector2,
     # Return as Tuple
     return (clipped_left, clipped_right)
 
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __liang_barsky_clip_polyline__(points: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[int64]]:
+    # Define Outputs (Each Edge Adds at Most 2 Points and Each Run Needs 1 Edge)
+    edges_n = max(points.shape[0] - 1, 0)
+    clipped = empty((2 * edges_n, 2), dtype=float64)
+    runs = empty((edges_n, 2), dtype=int64)
+    points_n = 0
+    runs_n = 0
+    in_run = False
+    for idx in range(edges_n):
+        (x0, y0) = (points[idx, 0], points[idx, 1])
+        # Compute Delta X and Delta Y
+        delta_x = points[idx + 1, 0] - x0
+        delta_y = points[idx + 1, 1] - y0
+        # Compute Zetas over the P and Q values
+        zeta_one = 0.0
+        zeta_two = 1.0
+        rejected = False
+        for (p_value, q_value) in ((-delta_x, x0 + 1), (delta_x, 1 - x0), (-delta_y, y0 + 1), (delta_y, 1 - y0)):
+            if p_value < 0:
+                zeta_one = max(zeta_one, q_value / p_value)
+            elif p_value > 0:
+                zeta_two = min(zeta_two, q_value / p_value)
+            elif q_value < 0:
+                # Parallel and Outside the Border
+                rejected = True
+        # Check Outside - Close Current Run
+        if rejected or zeta_one > zeta_two:
+            if in_run:
+                runs[runs_n, 1] = points_n
+                runs_n += 1
+                in_run = False
+            continue
+        # Entering the Window Breaks the Current Run
+        if in_run and zeta_one > 0:
+            runs[runs_n, 1] = points_n
+            runs_n += 1
+            in_run = False
+        # Start a New Run
+        if not in_run:
+            runs[runs_n, 0] = points_n
+            clipped[points_n, 0] = x0 + (zeta_one * delta_x)
+            clipped[points_n, 1] = y0 + (zeta_one * delta_y)
+            points_n += 1
+            in_run = True
+        # Add Clipped End Point
+        clipped[points_n, 0] = x0 + (zeta_two * delta_x)
+        clipped[points_n, 1] = y0 + (zeta_two * delta_y)
+        points_n += 1
+        # Leaving the Window Closes the Current Run
+        if zeta_two < 1:
+            runs[runs_n, 1] = points_n
+            runs_n += 1
+            in_run = False
+    # Close Last Run
+    if in_run:
+        runs[runs_n, 1] = points_n
+        runs_n += 1
+    return (clipped[:points_n], runs[:runs_n])
+
+def liang_barsky_clip_polyline(points: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[int64]]:
+    # Clip a (N, 2) Polyline at Once - Returns the Clipped Points and the (R, 2) [Start, End) Runs of each Visible Sub-Polyline
+    return __liang_barsky_clip_polyline__(ascontiguousarray(points, dtype=float64))
+
 @unique
 class EWeilerAthertonDirection(IntEnum):
     INSIDE = 0
@@ -380,4 +545,103 @@ def weiler_atherton_w_lb_clip_poly(poly_points: List[Vector2]) -> List[Vector2]:
         )
     )
     # Return Points
-    return points
\ No newline at end of file
+    return points
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __sutherland_hodgman_clip_poly__(points: NDArray[float64]) -> NDArray[float64]:
+    # Clip Against Each Border (Left, Right, Bottom, Upper) in Sequence
+    current = points.copy()
+    for border in range(4):
+        points_n = current.shape[0]
+        if points_n == 0:
+            break
+        # Border Axis and Side - Inside When (side * value) <= 1
+        axis = border // 2
+        side = -1.0 if border % 2 == 0 else 1.0
+        # Each Edge Adds at Most 2 Points
+        output = empty((2 * points_n, 2), dtype=float64)
+        output_n = 0
+        (prev_x, prev_y) = (current[points_n - 1, 0], current[points_n - 1, 1])
+        prev_inside = side * current[points_n - 1, axis] <= 1
+        for idx in range(points_n):
+            (curr_x, curr_y) = (current[idx, 0], current[idx, 1])
+            curr_inside = side * current[idx, axis] <= 1
+            # Crossing the Border - Add Intersection
+            if curr_inside != prev_inside:
+                prev_value = prev_x if axis == 0 else prev_y
+                curr_value = curr_x if axis == 0 else curr_y
+                zeta = (side - prev_value) / (curr_value - prev_value)
+                output[output_n, 0] = prev_x + (zeta * (curr_x - prev_x))
+                output[output_n, 1] = prev_y + (zeta * (curr_y - prev_y))
+                output_n += 1
+            # Keep Inside Points
+            if curr_inside:
+                output[output_n, 0] = curr_x
+                output[output_n, 1] = curr_y
+                output_n += 1
+            (prev_x, prev_y, prev_inside) = (curr_x, curr_y, curr_inside)
+        current = output[:output_n].copy()
+    return current
+
+def sutherland_hodgman_clip_poly(poly_points: NDArray[float64]) -> NDArray[float64]:
+    # Clip a (N, 2) Polygon Against the Normalized Window in Linear Time
+    return __sutherland_hodgman_clip_poly__(ascontiguousarray(poly_points, dtype=float64))
+
+# Define Homogeneous Planes Clipping - Planes are (P, D + 1) Rows [a, b, (c), d] Keeping (a, b, (c)) . X + d >= 0
+def plane_distances(points: NDArray[float64], planes: NDArray[float64]) -> NDArray[float64]:
+    # Signed Distance of Every (N, D) Point to Every Plane ((N, P) Array)
+    dimension = points.shape[1]
+    return (points @ planes[:, :dimension].T) + planes[:, dimension]
+
+def plane_codes(points: NDArray[float64], planes: NDArray[float64]) -> NDArray[int64]:
+    # Outside Code of Every (N, D) Point (Bit p is Set when Outside Plane p)
+    outside = plane_distances(points, planes) < 0
+    return (outside.astype(int64) << arange(planes.shape[0], dtype=int64)).sum(axis=1)
+
+def clip_lines_to_planes(edges: NDArray[float64], planes: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[bool_]]:
+    # Parametric Clip of (M, 2, D) Edges at Once - Returns the Clipped Edges and the Visibility Mask
+    (distances_a, distances_b) = (plane_distances(edges[:, 0], planes), plane_distances(edges[:, 1], planes))
+    # Crossing Parameter on Each Plane (Only Used when the Endpoints are on Opposite Sides)
+    crossing = (distances_a < 0) != (distances_b < 0)
+    zeta = distances_a / where(crossing, distances_a - distances_b, 1)
+    # Enter Through Planes the First Point is Outside of, Exit Through Planes the Second Point is Outside of
+    zeta_enter = where(crossing & (distances_a < 0), zeta, 0).max(axis=1, initial=0)
+    zeta_exit = where(crossing & (distances_b < 0), zeta, 1).min(axis=1, initial=1)
+    visible = ~((distances_a < 0) & (distances_b < 0)).any(axis=1) & (zeta_enter <= zeta_exit)
+    # Move Endpoints Along the Edges
+    delta = edges[:, 1] - edges[:, 0]
+    clipped = stack((edges[:, 0] + (zeta_enter[:, None] * delta), edges[:, 0] + (zeta_exit[:, None] * delta)), axis=1)
+    return (clipped, visible)
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __clip_poly_to_planes__(points: NDArray[float64], planes: NDArray[float64]) -> NDArray[float64]:
+    # Sutherland-Hodgman Against Each Plane in Sequence
+    dimension = points.shape[1]
+    current = points.copy()
+    for plane in range(planes.shape[0]):
+        points_n = current.shape[0]
+        if points_n == 0:
+            break
+        # Each Edge Adds at Most 2 Points
+        output = empty((2 * points_n, dimension), dtype=float64)
+        output_n = 0
+        prev = current[points_n - 1]
+        prev_distance = planes[plane, dimension] + (prev * planes[plane, :dimension]).sum()
+        for idx in range(points_n):
+            curr = current[idx]
+            curr_distance = planes[plane, dimension] + (curr * planes[plane, :dimension]).sum()
+            # Crossing the Plane - Add Intersection
+            if (curr_distance >= 0) != (prev_distance >= 0):
+                zeta = prev_distance / (prev_distance - curr_distance)
+                output[output_n] = prev + (zeta * (curr - prev))
+                output_n += 1
+            # Keep Inside Points
+            if curr_distance >= 0:
+                output[output_n] = curr
+                output_n += 1
+            (prev, prev_distance) = (curr, curr_distance)
+        current = output[:output_n].copy()
+    return current
+
+def clip_poly_to_planes(poly_points: NDArray[float64], planes: NDArray[float64]) -> NDArray[float64]:
+    # Clip a (N, D) Polygon Against Homogeneous Planes in Linear Time
+    return __clip_poly_to_planes__(ascontiguousarray(poly_points, dtype=float64), ascontiguousarray(planes, dtype=float64))
@@ -0,0 +1,173 @@
+from __future__ import annotations
+from numba import jit #type: ignore
+from typing import List, Tuple
+from numpy import arange, array, ascontiguousarray, bool_, concatenate, empty, float64, int64, repeat
+from numpy.typing import NDArray
+from primitives.clipping_method import cohen_sutherland_clip_lines
+
+# Define Adaptive Subdivision Limit (At Most 2 ** Depth Segments per Curve)
+ADAPTIVE_MAX_DEPTH = 12
+# Define Span Clipping Subdivision Limit (Deeper Spans Still Crossing the Border are Clipped as Lines)
+CLIP_MAX_DEPTH = 8
+
+# Define Uniform Cubic B-Spline Span -> Bezier Control Points Conversion
+BSPLINE_INTO_BEZIER: NDArray[float64] = array([
+    [1/6, 4/6, 1/6,   0],
+    [  0, 4/6, 2/6,   0],
+    [  0, 2/6, 4/6,   0],
+    [  0, 1/6, 4/6, 1/6],
+], dtype=float64)
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __is_flat__(control_points: NDArray[float64], tolerance: float64) -> bool:
+    # Curve Lies in the Control Polygon Hull - Flat if Every Inner Point is Near the Chord
+    n = control_points.shape[0]
+    (x0, y0) = (control_points[0, 0], control_points[0, 1])
+    (dx, dy) = (control_points[n - 1, 0] - x0, control_points[n - 1, 1] - y0)
+    chord = (dx * dx) + (dy * dy)
+    for idx in range(1, n - 1):
+        (px, py) = (control_points[idx, 0] - x0, control_points[idx, 1] - y0)
+        # Distance to the Chord Segment (Clamped to its Endpoints)
+        t = 0.0
+        if chord > 0:
+            t = min(max(((px * dx) + (py * dy)) / chord, 0.0), 1.0)
+        (ex, ey) = (px - (t * dx), py - (t * dy))
+        if (ex * ex) + (ey * ey) > tolerance * tolerance:
+            return False
+    return True
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __adaptive_bezier_flatten__(control_points: NDArray[float64], tolerance: float64, max_depth: int64) -> NDArray[float64]:
+    n = control_points.shape[0]
+    # Define Output (Worst Case is a Full Binary Subdivision)
+    points = empty(((1 << max_depth) + 1, 2), dtype=float64)
+    points[0] = control_points[0]
+    count = 1
+    # Define Depth First Stack of Pending Control Polygons
+    stack = empty((max_depth + 2, n, 2), dtype=float64)
+    depths = empty(max_depth + 2, dtype=int64)
+    stack[0] = control_points
+    depths[0] = 0
+    top = 0
+    # Define de Casteljau Triangle
+    triangle = empty((n, n, 2), dtype=float64)
+    while top >= 0:
+        # Pop Polygon
+        current = stack[top]
+        depth = depths[top]
+        top -= 1
+        if depth >= max_depth or __is_flat__(current, tolerance):
+            # Emit Segment End
+            points[count] = current[n - 1]
+            count += 1
+            continue
+        # Split at the Middle
+        triangle[0] = current
+        for row in range(1, n):
+            for idx in range(n - row):
+                triangle[row, idx, 0] = 0.5 * (triangle[row - 1, idx, 0] + triangle[row - 1, idx + 1, 0])
+                triangle[row, idx, 1] = 0.5 * (triangle[row - 1, idx, 1] + triangle[row - 1, idx + 1, 1])
+        # Push Right Half then Left Half (Left is Emitted First)
+        top += 1
+        for idx in range(n):
+            stack[top, idx] = triangle[n - 1 - idx, idx]
+        depths[top] = depth + 1
+        top += 1
+        for idx in range(n):
+            stack[top, idx] = triangle[idx, 0]
+        depths[top] = depth + 1
+    return points[:count].copy()
+
+def adaptive_bezier_flatten(control_points: NDArray[float64], tolerance: float, max_depth: int = ADAPTIVE_MAX_DEPTH) -> NDArray[float64]:
+    # Subdivide Until Each Segment is Within Tolerance of the Curve
+    return __adaptive_bezier_flatten__(ascontiguousarray(control_points, dtype=float64), float64(tolerance), int64(max_depth))
+
+def bspline_into_bezier_spans(control_points: NDArray[float64]) -> NDArray[float64]:
+    # Convert Every 4 Control Points Window into a Cubic Bezier ((N, 2) -> (N - 3, 4, 2))
+    spans_n = control_points.shape[0] - 3
+    if spans_n <= 0:
+        return empty((0, 4, control_points.shape[1]), dtype=float64)
+    geometry = array([control_points[idx:idx + 4] for idx in range(spans_n)], dtype=float64)
+    return BSPLINE_INTO_BEZIER @ geometry
+
+def adaptive_bspline_flatten(control_points: NDArray[float64], tolerance: float, max_depth: int = ADAPTIVE_MAX_DEPTH) -> Tuple[NDArray[float64], NDArray[int64]]:
+    # Flatten Each Span and Join them (Spans Share their Endpoints)
+    spans = [adaptive_bezier_flatten(span, tolerance, max_depth) for span in bspline_into_bezier_spans(control_points)]
+    if len(spans) == 0:
+        return (empty((0, 2), dtype=float64), empty((0,), dtype=int64))
+    points = concatenate([spans[0]] + [span[1:] for span in spans[1:]])
+    # Shared Endpoints Belong to the Following Span (Each Edge Belongs to the Span of its Start Point)
+    lengths = [span.shape[0] - 1 for span in spans]
+    lengths[-1] += 1
+    return (points, repeat(arange(len(spans)), lengths))
+
+def classify_span_hulls(spans: NDArray[float64]) -> Tuple[NDArray[bool_], NDArray[bool_]]:
+    # Compare (S, K, 2) Control Polygons Boxes with the Normalized Window - Returns the (Inside, Crossing) Masks
+    (low, high) = (spans.min(axis=1), spans.max(axis=1))
+    outside = (high < -1).any(axis=1) | (low > 1).any(axis=1)
+    inside = (low >= -1).all(axis=1) & (high <= 1).all(axis=1)
+    return (inside, ~(inside | outside))
+
+def bezier_into_cubic_spans(control_points: NDArray[float64]) -> NDArray[float64] | None:
+    # Write Curves Up to Degree 3 as a Single Cubic Span ((N, 2) -> (1, 4, 2)) - None for Higher Degrees
+    degree = control_points.shape[0] - 1
+    if degree == 3:
+        return array([control_points], dtype=float64)
+    if degree == 2:
+        # Degree Elevation
+        (point_a, point_b, point_c) = control_points
+        return array([[point_a, point_a + ((2 / 3) * (point_b - point_a)), point_c + ((2 / 3) * (point_b - point_c)), point_c]], dtype=float64)
+    if degree == 1:
+        return line_into_cubic_span(control_points[0], control_points[1])
+    return None
+
+def line_into_cubic_span(point_a: NDArray[float64], point_b: NDArray[float64]) -> NDArray[float64]:
+    # Straight Cubic (Inner Points at Thirds of the Line)
+    delta = point_b - point_a
+    return array([[point_a, point_a + (delta / 3), point_a + ((2 / 3) * delta), point_b]], dtype=float64)
+
+def split_cubic_span(span: NDArray[float64]) -> Tuple[NDArray[float64], NDArray[float64]]:
+    # de Casteljau Split at the Middle
+    (point_a, point_b, point_c, point_d) = span
+    (ab, bc, cd) = ((point_a + point_b) / 2, (point_b + point_c) / 2, (point_c + point_d) / 2)
+    (abc, bcd) = ((ab + bc) / 2, (bc + cd) / 2)
+    middle = (abc + bcd) / 2
+    return (array([point_a, ab, abc, middle]), array([middle, bcd, cd, point_d]))
+
+def clip_cubic_spans(spans: NDArray[float64], max_depth: int = CLIP_MAX_DEPTH) -> Tuple[NDArray[float64], NDArray[bool_]]:
+    # Clip (M, 4, 2) Spans to the Normalized Window by their Control Polygon Hulls
+    # Returns the Visible Spans and a Mask of the Spans Starting a New Sub-Path
+    clipped: List[NDArray[float64]] = []
+    breaks: List[bool] = []
+    connected = False
+    # Depth First Stack (Keeps Spans in Curve Order)
+    pending = [(span, 0) for span in spans[::-1]]
+    while len(pending) > 0:
+        (span, depth) = pending.pop()
+        (low, high) = (span.min(axis=0), span.max(axis=0))
+        if (high < -1).any() or (low > 1).any():
+            # Hull Outside - Drop Span
+            connected = False
+        elif (low >= -1).all() and (high <= 1).all():
+            # Hull Inside - Keep Span
+            clipped.append(span)
+            breaks.append(not connected)
+            connected = True
+        elif depth < max_depth:
+            # Hull Crossing the Border - Subdivide
+            (left, right) = split_cubic_span(span)
+            pending.append((right, depth + 1))
+            pending.append((left, depth + 1))
+        else:
+            # Span is Small Enough - Clip its Chord as a Line
+            (clipped_edges, visible) = cohen_sutherland_clip_lines(array([[span[0], span[3]]], dtype=float64))
+            if not visible[0]:
+                connected = False
+                continue
+            (point_a, point_b) = clipped_edges[0]
+            clipped.append(line_into_cubic_span(point_a, point_b)[0])
+            breaks.append(not connected or (point_a != span[0]).any())
+            connected = not (point_b != span[3]).any()
+    if len(clipped) == 0:
+        return (empty((0, 4, 2), dtype=float64), empty((0,), dtype=bool_))
+    return (array(clipped, dtype=float64), array(breaks, dtype=bool_))
@@ -1,20 +1,229 @@
 from __future__ import annotations
+from itertools import product
 from typing import Dict, List, TYPE_CHECKING, Tuple
+from numpy import array, float64, hstack, ones
+from numpy.typing import NDArray
 # from objects.bezier_2d import Bezier2D
 # from objects.line_3d import Line3D
 from objects.object_3d import Object3D
 from objects.wireframe_3d import Wireframe3D
+from primitives.graphical_object import is_projected
 from primitives.matrix import Matrix, Vector3
+from primitives.packed_geometry import PackedGeometry
 if TYPE_CHECKING:
     from primitives.graphical_object import GraphicalObject
     from objects.object_type import ObjectType
+
+# Define Box Helpers (Boxes are Flat Tuples - (x_min, y_min, [z_min,] x_max, y_max, [z_max]))
+Box = Tuple[float, ...]
+def box_from_array(box: NDArray[float64]) -> Box:
+    return tuple(box.flatten().tolist())
+def box_contains(outer: Box, inner: Box) -> bool:
+    half = len(outer) // 2
+    return all(outer[axis] <= inner[axis] and inner[axis + half] <= outer[axis + half] for axis in range(half))
+def box_intersects(box_a: Box, box_b: Box) -> bool:
+    half = len(box_a) // 2
+    return all(box_a[axis] <= box_b[axis + half] and box_b[axis] <= box_a[axis + half] for axis in range(half))
+def box_union(box_a: Box, box_b: Box) -> Box:
+    half = len(box_a) // 2
+    return (*(min(box_a[axis], box_b[axis]) for axis in range(half)), *(max(box_a[axis + half], box_b[axis + half]) for axis in range(half)))
+def box_surface(box: Box) -> float:
+    # Half Surface Area (Stays Meaningful for Flat Boxes)
+    (dx, dy, dz) = (box[3] - box[0], box[4] - box[1], box[5] - box[2])
+    return (dx * dy) + (dy * dz) + (dz * dx)
+
+# Define Quadtree (2D Objects)
+class QuadTreeNode:
+    def __init__(self, bounds: Box, depth: int) -> None:
+        self.bounds = bounds
+        self.depth = depth
+        self.objects: Dict[str, Box] = {}
+        self.children: List[QuadTreeNode] = []
+
+class QuadTree:
+    # Define Node Limits
+    CAPACITY = 8
+    MAX_DEPTH = 16
+    # Define Constructor
+    def __init__(self) -> None:
+        self.root: QuadTreeNode | None = None
+        self.boxes: Dict[str, Box] = {}
+        self.locations: Dict[str, QuadTreeNode] = {}
+    # Define Private Methods
+    def __rebuild(self) -> None:
+        # Grow Root Around Every Box (With Room to Grow)
+        (x_min, y_min, x_max, y_max) = (
+            min(box[0] for box in self.boxes.values()), min(box[1] for box in self.boxes.values()),
+            max(box[2] for box in self.boxes.values()), max(box[3] for box in self.boxes.values())
+        )
+        size = max(x_max - x_min, y_max - y_min, 1)
+        (center_x, center_y) = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+        self.root = QuadTreeNode((center_x - size, center_y - size, center_x + size, center_y + size), 0)
+        # Reinsert Objects
+        self.locations.clear()
+        for (object_name, box) in self.boxes.items():
+            self.__insert_node(self.root, object_name, box)
+    def __split(self, node: QuadTreeNode) -> None:
+        # Create Quadrants
+        (x_min, y_min, x_max, y_max) = node.bounds
+        (x_mid, y_mid) = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+        node.children = [
+            QuadTreeNode(bounds, node.depth + 1)
+            for bounds in (
+                (x_min, y_min, x_mid, y_mid), (x_mid, y_min, x_max, y_mid),
+                (x_min, y_mid, x_mid, y_max), (x_mid, y_mid, x_max, y_max)
+            )
+        ]
+        # Push Down Objects that Fit a Quadrant
+        for (object_name, box) in list(node.objects.items()):
+            child = next((child for child in node.children if box_contains(child.bounds, box)), None)
+            if child is not None:
+                node.objects.pop(object_name)
+                child.objects[object_name] = box
+                self.locations[object_name] = child
+    def __insert_node(self, node: QuadTreeNode, object_name: str, box: Box) -> None:
+        # Descend Until No Quadrant Fully Contains the Box
+        while True:
+            if len(node.children) == 0 and len(node.objects) >= QuadTree.CAPACITY and node.depth < QuadTree.MAX_DEPTH:
+                self.__split(node)
+            child = next((child for child in node.children if box_contains(child.bounds, box)), None)
+            if child is None:
+                break
+            node = child
+        # Store Object
+        node.objects[object_name] = box
+        self.locations[object_name] = node
+    # Define Methods
+    def insert(self, object_name: str, box: Box) -> None:
+        self.boxes[object_name] = box
+        if self.root is None or not box_contains(self.root.bounds, box):
+            self.__rebuild()
+        else:
+            self.__insert_node(self.root, object_name, box)
+
+    def remove(self, object_name: str) -> None:
+        self.boxes.pop(object_name)
+        self.locations.pop(object_name).objects.pop(object_name)
+
+    def update(self, object_name: str, box: Box) -> None:
+        self.remove(object_name)
+        self.insert(object_name, box)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def query(self, box: Box) -> List[str]:
+        # Collect Objects Intersecting the Box
+        found: List[str] = []
+        nodes = [] if self.root is None else [self.root]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if not box_intersects(node.bounds, box):
+                continue
+            found.extend(object_name for (object_name, object_box) in node.objects.items() if box_intersects(object_box, box))
+            nodes.extend(node.children)
+        return found
+
+# Define Bounding Volume Hierarchy (3D Objects)
+BOX_CORNERS_3D = array(list(product((0, 1), repeat=3)))
+class BoundingVolumeNode:
+    def __init__(self, box: Box, object_name: str | None = None) -> None:
+        self.box = box
+        self.object_name = object_name
+        self.parent: BoundingVolumeNode | None = None
+        self.children: List[BoundingVolumeNode] = []
+
+class BoundingVolumeHierarchy:
+    # Define Constructor
+    def __init__(self) -> None:
+        self.root: BoundingVolumeNode | None = None
+        self.leaves: Dict[str, BoundingVolumeNode] = {}
+    # Define Private Methods
+    def __refit(self, node: BoundingVolumeNode | None) -> None:
+        # Update Boxes Up to the Root
+        while node is not None:
+            (child_a, child_b) = node.children
+            node.box = box_union(child_a.box, child_b.box)
+            node = node.parent
+    def __replace_child(self, parent: BoundingVolumeNode | None, old: BoundingVolumeNode, new: BoundingVolumeNode) -> None:
+        new.parent = parent
+        if parent is None:
+            self.root = new
+        else:
+            parent.children[parent.children.index(old)] = new
+    @staticmethod
+    def __is_culled(box: Box, planes: NDArray[float64]) -> bool:
+        # Get Homogeneous Box Corners
+        corners = hstack((array(box).reshape((2, 3))[BOX_CORNERS_3D, (0, 1, 2)], ones((8, 1))))
+        # Culled When Every Corner is Outside the Same Plane
+        return bool(((corners @ planes.T) < 0).all(axis=0).any())
+    # Define Methods
+    def insert(self, object_name: str, box: Box) -> None:
+        leaf = BoundingVolumeNode(box, object_name)
+        self.leaves[object_name] = leaf
+        if self.root is None:
+            self.root = leaf
+            return
+        # Descend Choosing the Child with the Least Surface Growth
+        sibling = self.root
+        while len(sibling.children) > 0:
+            sibling = min(sibling.children, key=lambda child: box_surface(box_union(child.box, box)) - box_surface(child.box))
+        # Pair Sibling and Leaf Under a New Branch
+        branch = BoundingVolumeNode(box_union(sibling.box, box))
+        self.__replace_child(sibling.parent, sibling, branch)
+        branch.children = [sibling, leaf]
+        sibling.parent = branch
+        leaf.parent = branch
+        self.__refit(branch.parent)
+
+    def remove(self, object_name: str) -> None:
+        leaf = self.leaves.pop(object_name)
+        parent = leaf.parent
+        if parent is None:
+            self.root = None
+            return
+        # Promote Sibling into the Parent Place
+        sibling = next(child for child in parent.children if child is not leaf)
+        self.__replace_child(parent.parent, parent, sibling)
+        self.__refit(sibling.parent)
+
+    def update(self, object_name: str, box: Box) -> None:
+        self.remove(object_name)
+        self.insert(object_name, box)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def query(self, planes: NDArray[float64]) -> List[str]:
+        # Collect Objects not Culled by the (K, 4) Frustum Planes ((p, 1) . plane < 0 is Outside)
+        found: List[str] = []
+        nodes = [] if self.root is None else [self.root]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if BoundingVolumeHierarchy.__is_culled(node.box, planes):
+                continue
+            if node.object_name is not None:
+                found.append(node.object_name)
+            else:
+                nodes.extend(node.children)
+        return found
+
 class DisplayFile:
     # Define Initialization
-    def __init__(self, objects: List[Tuple[str, ObjectType, GraphicalObject]] = []) -> None:
+    def __init__(self, objects: List[Tuple[str, ObjectType, GraphicalObject]] = [], packed: bool = False) -> None:
         # Define Attributes
         self.objects: Dict[str, Tuple[ObjectType, GraphicalObject]] = {}
+        # Define Spatial Indexes and Draw Order
+        self.quadtree = QuadTree()
+        self.bvh = BoundingVolumeHierarchy()
+        self.sequence: Dict[str, int] = {}
+        self.sequence_next = 0
+        # Define Packed Geometry (Optional Whole Scene Buffers - Culled in a Few Array Operations per Frame)
+        self.packed_geometry: PackedGeometry | None = PackedGeometry() if packed else None
         for (object_name, object_type, object_ref) in objects:
-            self.objects[object_name] = (object_type, object_ref)
+            self.__pack_object(object_name, object_ref)
+            self.__index_object(object_name, object_ref)
+            self.__store_object(object_name, object_type, object_ref)
         # self.add_object("test", Wireframe3D(Vector3(0,0,0), Vector3(50, 100,0), Vector3(100, 100,0), Vector3(150, 0,0)))
         # self.add_object("test2", Bezier2D(0.01, Vector2(0,0), Vector2(50, 100), Vector2(100, 100), Vector2(150, 0), Vector2(300, 300)))
         # self.add_object("testl", Line3D(Vector3(0,0, 0), Vector3(100,100, 0)))
@@ -26,6 +235,32 @@ class DisplayFile:
             Wireframe3D(Vector3(0, 100, 0), Vector3(100, 100, 0), Vector3(100, 100, 100), Vector3(0, 100, 100)),
             Wireframe3D(Vector3(0, 0, 0), Vector3(100, 0, 0), Vector3(100, 0, 100), Vector3(0, 0, 100))
         ))
+    # Define Private Methods
+    def __pack_object(self, object_name: str, object_ref: GraphicalObject) -> None:
+        # Append Object Geometry to the Packed Buffers (When Enabled)
+        if self.packed_geometry is not None:
+            self.packed_geometry.add(object_name, object_ref)
+    def __index_object(self, object_name: str, object_ref: GraphicalObject) -> None:
+        # Insert Object Box in the Index of its Dimension (Objects without Geometry are Never Queried)
+        box = object_ref.get_bounding_box()
+        if box is None:
+            return
+        if is_projected(object_ref):
+            self.bvh.insert(object_name, box_from_array(box))
+        else:
+            self.quadtree.insert(object_name, box_from_array(box))
+    def __unindex_object(self, object_name: str, object_ref: GraphicalObject) -> None:
+        # Remove Object Box from the Index of its Dimension (If it Had One)
+        if is_projected(object_ref):
+            if object_name in self.bvh.leaves:
+                self.bvh.remove(object_name)
+        elif object_name in self.quadtree.boxes:
+            self.quadtree.remove(object_name)
+    def __store_object(self, object_name: str, object_type: ObjectType, object_ref: GraphicalObject) -> None:
+        # Store Object at the End of the Draw Order
+        self.objects[object_name] = (object_type, object_ref)
+        self.sequence[object_name] = self.sequence_next
+        self.sequence_next += 1
     # Define Methods
     def get_names(self) -> List[str]:
         # Destructure List
@@ -37,12 +272,21 @@ class DisplayFile:
     def get_drawable_objects(self) -> List[GraphicalObject]:
         # Destructure List
         return [object_ref for (_, object_ref) in self.objects.values()]
+
+    def query_drawable_objects(self, window_box: Box, frustum_planes: NDArray[float64]) -> List[GraphicalObject]:
+        # Query 2D Objects by the Window Footprint and 3D Objects by the Frustum Planes
+        object_names = self.quadtree.query(window_box) + self.bvh.query(frustum_planes)
+        # Keep Insertion Order (Draw Order)
+        object_names.sort(key=self.sequence.__getitem__)
+        return [self.objects[object_name][1] for object_name in object_names]
     
     def add_object(self, object_name: str, object_graphics: GraphicalObject) -> None:
         # Check if already exists
-        if object_name not in self.get_names():
-            # Define Object To Store
-            self.objects[object_name] = (object_graphics.get_type(), object_graphics)
+        if object_name not in self.objects:
+            # Pack and Index Before Storing (A Failed Index Leaves the Display File Untouched)
+            self.__pack_object(object_name, object_graphics)
+            self.__index_object(object_name, object_graphics)
+            self.__store_object(object_name, object_graphics.get_type(), object_graphics)
         else:
             raise ValueError("Name already in display file")
 
@@ -60,11 +304,23 @@ class DisplayFile:
 
     def remove_object(self, object_name: str) -> None:
         # Delete By Name
-        self.objects.pop(object_name)
+        (_, object_ref) = self.objects.pop(object_name)
+        # Sync Spatial Index
+        self.__unindex_object(object_name, object_ref)
+        self.sequence.pop(object_name)
+        # Sync Packed Geometry
+        if self.packed_geometry is not None:
+            self.packed_geometry.remove(object_name)
     
     def clear(self) -> None:
         # Delete All
         self.objects.clear()
+        self.quadtree.clear()
+        self.bvh.clear()
+        self.sequence.clear()
+        # Sync Packed Geometry
+        if self.packed_geometry is not None:
+            self.packed_geometry.clear()
 
     def transform_object_matrix(self, object_name: str, transformation: Matrix):
         # Initialize Pipeline for Object
@@ -73,4 +329,26 @@ class DisplayFile:
         self.get_object_ref(object_name).transform(transformation)
         # Persist Transform
         self.get_object_ref(object_name).pipeline_apply()
-            
\ No newline at end of file
+        # Sync Indexes
+        self.refresh_object(object_name)
+
+    def refresh_object(self, object_name: str) -> None:
+        # Sync Spatial Index (After the Object Geometry Changed)
+        object_ref = self.get_object_ref(object_name)
+        self.__unindex_object(object_name, object_ref)
+        self.__index_object(object_name, object_ref)
+        # Sync Packed Geometry
+        if self.packed_geometry is not None:
+            self.packed_geometry.update(object_name, object_ref)
+
+    def enable_packed_geometry(self) -> PackedGeometry:
+        # Build Packed Geometry from the Current Objects (In Draw Order)
+        if self.packed_geometry is None:
+            self.packed_geometry = PackedGeometry()
+            for (object_name, _, object_ref) in self.get_objects():
+                self.packed_geometry.add(object_name, object_ref)
+        return self.packed_geometry
+
+    def disable_packed_geometry(self) -> None:
+        # Drop Packed Geometry
+        self.packed_geometry = None
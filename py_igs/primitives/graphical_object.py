@@ -1,12 +1,15 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Tuple
 from abc import ABC, abstractmethod
+from numpy import array, float64, vstack
+from numpy.linalg import norm
 from typing_extensions import TypeGuard
 
 from primitives.matrix import Vector3
 if TYPE_CHECKING:
     from primitives.clipping_method import EClippingMethod
     from objects.object_type import ObjectType
+    from numpy.typing import NDArray
     from primitives.matrix import Matrix, Vector2
     from cairo import Context
 
@@ -21,6 +24,10 @@ class GraphicalObject(ABC):
         self.projected: bool = False
         # Define Pipeline Attributes
         self.in_pipeline = False
+        # Define Cached Bounding Box ((2, D) Array of [Min, Max])
+        self.bounding_box: NDArray[float64] | None = None
+        # Define Cached Bounding Sphere ((D,) Center and Radius, Enclosing the Box)
+        self.bounding_sphere: Tuple[NDArray[float64], float] | None = None
     # Define Interface
     @abstractmethod
     def get_type() -> ObjectType:
@@ -34,11 +41,45 @@ class GraphicalObject(ABC):
     @abstractmethod
     def get_center_coords(self) -> Vector2:
         raise NotImplementedError("GraphicalObject is an abstract class.")
+    # Geometry - Persisted Drawable Vertices as a (N, D) Array
+    def get_vertices(self) -> NDArray[float64]:
+        raise NotImplementedError(f"{self.get_type()} does not expose its vertices.")
+    # Bounding Box Methods
+    def get_bounding_box(self) -> NDArray[float64] | None:
+        # Compute Box Only When the Persisted Vertices Changed
+        if self.bounding_box is None:
+            vertices = self.get_vertices()
+            # Empty Geometry (e.g. Curves with Too Few Control Points) Has No Box
+            if vertices.shape[0] == 0:
+                return None
+            self.bounding_box = vstack((vertices.min(axis=0), vertices.max(axis=0)))
+        return self.bounding_box
+    def get_bounding_sphere(self) -> Tuple[NDArray[float64], float] | None:
+        # Derive Sphere from the Cached Box (Invalidated Alongside it)
+        if self.bounding_sphere is None:
+            box = self.get_bounding_box()
+            if box is None:
+                return None
+            (box_min, box_max) = box
+            self.bounding_sphere = ((box_min + box_max) / 2, float(norm(box_max - box_min)) / 2)
+        return self.bounding_sphere
+    def invalidate_bounding_box(self) -> None:
+        self.bounding_box = None
+        self.bounding_sphere = None
+    # Level of Detail - World Space Tolerance for Tessellated Objects (None Uses the Fixed Accuracy)
+    def set_tessellation_tolerance(self, tolerance: float | None) -> None:
+        pass
+    # Back Face Culling - Drop Filled Faces Turned Away from the Viewer (Mirrored Projections Flip the Winding)
+    def cull_back_faces(self, mirrored: bool) -> None:
+        pass
     # Basic Color Implementation
     def set_color(self, color_rgba: Tuple[float, float, float, float]):
         self.color = color_rgba
     def get_color(self) -> Tuple[float, float, float, float]:
         return self.color
+    def get_colors(self) -> NDArray[float64]:
+        # Packed Colors - (K, 4) Array (One Row per Face for Objects Painted per Face)
+        return array([self.get_color()], dtype=float64)
     # Pipeline Methods
     @abstractmethod
     def pipeline(self) -> None:
@@ -48,6 +89,8 @@ class GraphicalObject(ABC):
     def pipeline_apply(self) -> None:
         # Turn off the Pipeline
         self.in_pipeline = False
+        # Persisted Vertices Changed
+        self.invalidate_bounding_box()
     def pipeline_abort(self) -> None:
         # Turn off the Pipeline
         self.in_pipeline = False
@@ -68,6 +111,9 @@ class Graphical3DObject(GraphicalObject):
     @abstractmethod
     def get_center_coords3(self) -> Vector3:
         raise NotImplementedError("Graphical3DObject is an abstract class.")
+    # Depth Clipping - Clip Pipeline Geometry to (P, 4) Homogeneous Planes over World Coordinates Before Projecting
+    def clip_depth(self, planes: NDArray[float64]) -> Graphical3DObject | None:
+        return self
     def get_center_coords(self) -> Vector2:
         return self.get_center_coords3().try_into_vec2()
     # Cannot Render 3D Objects without projecting it
@@ -8,7 +8,7 @@ from math import cos, sin, sqrt
 
 # Use Numpy + Numba to Speed Up Calculations ===================================
 from numba import jit #type: ignore
-from numpy import arccos, float64, array, identity
+from numpy import arccos, empty, float64, array, identity
 from numpy.linalg import inv, multi_dot
 from numpy.typing import NDArray
 
@@ -27,6 +27,24 @@ def __matrix_sum__(matrixA: NDArray[float64], matrixB: NDArray[float64]) -> NDAr
 @jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
 def __matrix_sub__(matrixA: NDArray[float64], matrixB: NDArray[float64]) -> NDArray[float64]:
     return matrixA - matrixB
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True) #type: ignore
+def __transform_points__(points: NDArray[float64], matrix: NDArray[float64]) -> NDArray[float64]:
+    # Points are (N, D) Rows and the Matrix is (D + 1, D + 1)
+    (points_n, dimension) = points.shape
+    transformed = empty((points_n, dimension), dtype=float64)
+    for idx in range(points_n):
+        # Compute Homogeneous Coordinate (Implicit 1 Appended to the Row)
+        w = matrix[dimension, dimension]
+        for k in range(dimension):
+            w += points[idx, k] * matrix[k, dimension]
+        # Compute Coordinates and Apply the Perspective Divide
+        for col in range(dimension):
+            value = matrix[dimension, col]
+            for k in range(dimension):
+                value += points[idx, k] * matrix[k, col]
+            transformed[idx, col] = value / w
+    return transformed
 # ==============================================================================
 # Define Helper Function
 T = TypeVar("T")
@@ -34,6 +52,7 @@ def chunks(iterable: Iterable[T], chunk_size: int, fillValue: T = None) -> List[
     return list(zip_longest(*[iter(iterable)] * chunk_size, fillvalue=fillValue))
 # Define Classes
 class Matrix:
+    __slots__ = ("elements",)
     # Define Matrix Initialization
     def __init__(self, elements: NDArray[float64]) -> None:
         # Force Complete Matrices
@@ -145,8 +164,9 @@ class Matrix:
         # Cast Matrix
         return Vector4(x, y, z, w)
 
-# Define Fixed Size Matrices
+# Define Fixed Size Matrices (Plain Float Slots - Matrix Row is Built Only for Matrix Operations)
 class Vector2(Matrix):
+    __slots__ = ("x", "y")
     # Define Factory
     @staticmethod
     def from_tuple(tuple: Tuple[float, float]) -> Vector2:
@@ -156,135 +176,104 @@ class Vector2(Matrix):
         return Vector2(x, y)
     # Define String
     def __str__(self) -> str:
-        return f"Vector2: [{self.elements[0,0]}, {self.elements[0,1]}]"
+        return f"Vector2: [{self.x}, {self.y}]"
     # Define Constructor
     def __init__(self, x: float, y: float) -> None:
-        # Call Super Constructor
-        elements: NDArray[float64] = array([[x, y]], dtype=float64)
-        super().__init__(elements)
+        # Store Values
+        self.x = float(x)
+        self.y = float(y)
+    # Define Matrix Row
+    @property
+    def elements(self) -> NDArray[float64]:
+        elements: NDArray[float64] = array([[self.x, self.y]], dtype=float64)
+        return elements
     # Getters
     def as_tuple(self) -> Tuple[float, float]:
-        # Destructure Matrix
-        x, y = self.lines()[0]
-        # Return as Tuple
-        return (x, y)
+        return (self.x, self.y)
     def get_x(self) -> float:
-        # Destructure Matrix
-        x = self.lines()[0][0]
-        # Return value
-        return x
+        return self.x
     def get_y(self) -> float:
-        # Destructure Matrix
-        y = self.lines()[0][1]
-        # Return value
-        return y
+        return self.y
     def dot_product(self, other: Vector2) -> float:
-        # Destructure Values
-        (x1, y1) = self.as_tuple()
-        (x2, y2) = other.as_tuple()
         # Make OP
-        return (x1 * x2) + (y1 * y2)
+        return (self.x * other.x) + (self.y * other.y)
     # Conversions
     def as_vec3(self, z: float = 0) -> Vector3:
-        # Destructure Matrix
-        x, y = self.as_tuple()
         # Transform into Vector
-        return Vector3(x, y, z)
+        return Vector3(self.x, self.y, z)
     def as_vec4(self, z: float = 0, w: float = 0) -> Vector4:
-        # Destructure Matrix
-        x, y = self.as_tuple()
         # Transform into Vector
-        return Vector4(x, y, z, w)
+        return Vector4(self.x, self.y, z, w)
     def modulo(self) -> float:
-        return sqrt(sum(el**2 for el in self.lines()[0]))
+        return sqrt((self.x * self.x) + (self.y * self.y))
 
 class Vector3(Matrix):
+    __slots__ = ("x", "y", "z")
     # Define Constructor
     def __init__(self, x: float, y: float, z: float) -> None:
-        # Call Super Constructor
-        elements: NDArray[float64] = array([[x, y, z]], dtype=float64)
-        super().__init__(elements)
+        # Store Values
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
     # Define String
     def __str__(self) -> str:
-        return f"Vector3: [{self.elements[0,0]}, {self.elements[0,1]}, {self.elements[0,2]}]"
+        return f"Vector3: [{self.x}, {self.y}, {self.z}]"
+    # Define Matrix Row
+    @property
+    def elements(self) -> NDArray[float64]:
+        elements: NDArray[float64] = array([[self.x, self.y, self.z]], dtype=float64)
+        return elements
     # Getters
     def as_tuple(self)-> Tuple[float, float, float]:
-        # Destructure Matrix
-        x, y, z = self.lines()[0]
-        # Return as Tuple
-        return (x, y, z)
+        return (self.x, self.y, self.z)
     def get_x(self) -> float:
-        # Destructure Matrix
-        x = self.lines()[0][0]
-        # Return value
-        return x
+        return self.x
     def get_y(self) -> float:
-        # Destructure Matrix
-        y = self.lines()[0][1]
-        # Return value
-        return y
+        return self.y
     def get_z(self) -> float:
-        # Destructure Matrix
-        z = self.lines()[0][2]
-        # Return value
-        return z
+        return self.z
     def dot_product(self, other: Vector3) -> float:
-        # Destructure Values
-        (x1, y1, z1) = self.as_tuple()
-        (x2, y2, z2) = other.as_tuple()
         # Make OP
-        return (x1 * x2) + (y1 * y2) + (z1 * z2)
+        return (self.x * other.x) + (self.y * other.y) + (self.z * other.z)
     def as_vec4(self, w: float = 0) -> Vector4:
-        # Destructure Matrix
-        x, y, z = self.as_tuple()
         # Transform into Vector
-        return Vector4(x, y, z, w)
+        return Vector4(self.x, self.y, self.z, w)
     def modulo(self) -> float:
-        return sqrt(sum(el**2 for el in self.lines()[0]))
+        return sqrt((self.x * self.x) + (self.y * self.y) + (self.z * self.z))
 
 class Vector4(Matrix):
+    __slots__ = ("x", "y", "z", "w")
     # Define Constructor
     def __init__(self, x: float, y: float, z: float, w: float) -> None:
-        # Call Super Constructor
-        elements: NDArray[float64] = array([[x, y, z, w]], dtype=float64)
-        super().__init__(elements)
+        # Store Values
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        self.w = float(w)
     # Define String
     def __str__(self) -> str:
-        return f"Vector4: [{self.elements[0,0]}, {self.elements[0,1]}, {self.elements[0,2]}, {self.elements[0,3]}]"
+        return f"Vector4: [{self.x}, {self.y}, {self.z}, {self.w}]"
+    # Define Matrix Row
+    @property
+    def elements(self) -> NDArray[float64]:
+        elements: NDArray[float64] = array([[self.x, self.y, self.z, self.w]], dtype=float64)
+        return elements
     # Getters
     def as_tuple(self)-> Tuple[float, float, float, float]:
-        # Destructure Matrix
-        x, y, z, w = self.lines()[0]
-        # Return as Tuple
-        return (x, y, z, w)
+        return (self.x, self.y, self.z, self.w)
     def get_x(self) -> float:
-        # Destructure Matrix
-        x = self.lines()[0][0]
-        # Return value
-        return x
+        return self.x
     def get_y(self) -> float:
-        # Destructure Matrix
-        y = self.lines()[0][1]
-        # Return value
-        return y
+        return self.y
     def get_z(self) -> float:
-        # Destructure Matrix
-        z = self.lines()[0][2]
-        # Return value
-        return z
+        return self.z
     def get_w(self) -> float:
-        # Destructure Matrix
-        w = self.lines()[0][2]
-        # Return value
-        return w
+        return self.w
     def dot_product(self, other: Vector4) -> float:
-        # Destructure Values
-        (x1, y1, z1, w1) = self.as_tuple()
-        (x2, y2, z2, w2) = other.as_tuple()
         # Make OP
-        return (x1 * x2) + (y1 * y2) + (z1 * z2) + (w1 * w2)
+        return (self.x * other.x) + (self.y * other.y) + (self.z * other.z) + (self.w * other.w)
     def modulo(self) -> float:
-        return sqrt(sum(el**2 for el in self.lines()[0]))
+        return sqrt((self.x * self.x) + (self.y * self.y) + (self.z * self.z) + (self.w * self.w))
 
 
 # Define Matrices Helpers
@@ -382,4 +371,28 @@ def homo_coords3_matrix_rotate_xyz(theta_x: float, theta_y: float, theta_z: floa
     return Matrix(rotation)
 
 def angle_between_vectors(vector_a: Vector3, vector_b: Vector3) -> float:
-    return arccos(vector_a.dot_product(vector_b) / (vector_a.modulo() * vector_b.modulo()))
\ No newline at end of file
+    return arccos(vector_a.dot_product(vector_b) / (vector_a.modulo() * vector_b.modulo()))
+
+# Define Point Arrays Helpers (Contiguous (N, 2) and (N, 3) Storage)
+def vec2_list_into_array(points: Iterable[Vector2 | NDArray[float64]]) -> NDArray[float64]:
+    # Stack Points as Rows (Accept Vectors or Raw Rows)
+    rows = [point.as_tuple() if isinstance(point, Vector2) else point for point in points]
+    return array(rows, dtype=float64).reshape((-1, 2))
+
+def vec3_list_into_array(points: Iterable[Vector3 | NDArray[float64]]) -> NDArray[float64]:
+    # Stack Points as Rows (Accept Vectors or Raw Rows)
+    rows = [point.as_tuple() if isinstance(point, Vector3) else point for point in points]
+    return array(rows, dtype=float64).reshape((-1, 3))
+
+def transform_points(points: NDArray[float64], matrix: Matrix | NDArray[float64]) -> NDArray[float64]:
+    # Transform (N, D) Points with a (D + 1) Homogeneous Matrix in a Single Call
+    elements = matrix.elements if isinstance(matrix, Matrix) else matrix
+    return __transform_points__(points, elements)
+
+def array_into_vec2_list(points: NDArray[float64]) -> List[Vector2]:
+    # Build Vectors Views over the Rows
+    return [Vector2(x, y) for (x, y, *_) in points.tolist()]
+
+def array_into_vec3_list(points: NDArray[float64]) -> List[Vector3]:
+    # Build Vectors Views over the Rows
+    return [Vector3(x, y, z) for (x, y, z, *_) in points.tolist()]
\ No newline at end of file
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from itertools import chain
+from typing import Callable, List, Tuple
+from numpy import add, arange, argsort, array, bitwise_and, bitwise_or, concatenate, cumsum, diff, empty, float64, fromiter, int64, nonzero, repeat, sort, stack, unique
+from numpy.typing import NDArray
+
+# Ragged Faces are Stored as a Flat (K,) Index Array plus a (F + 1,) Offsets Table
+# Face f Uses the Indexes indices[offsets[f]:offsets[f + 1]]
+
+def faces_into_ragged(faces: List[List[int]]) -> Tuple[NDArray[int64], NDArray[int64]]:
+    # Pack a List of Faces into the (Indices, Offsets) Pair
+    offsets = concatenate(([0], cumsum([len(face) for face in faces], dtype=int64))).astype(int64)
+    indices = fromiter(chain.from_iterable(faces), dtype=int64, count=int(offsets[-1]))
+    return (indices, offsets)
+
+def ragged_sizes(offsets: NDArray[int64]) -> NDArray[int64]:
+    # Number of Indexes of Each Face
+    return diff(offsets)
+
+def ragged_face_ids(offsets: NDArray[int64]) -> NDArray[int64]:
+    # Owner Face of Each Index
+    return repeat(arange(offsets.shape[0] - 1), ragged_sizes(offsets))
+
+def ragged_following(offsets: NDArray[int64]) -> NDArray[int64]:
+    # Position of the Next Index Around Each Closed Face (Last Wraps to the First)
+    following = arange(1, offsets[-1] + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+    return following
+
+def ragged_take(indices: NDArray[int64], offsets: NDArray[int64], faces: NDArray[int64]) -> Tuple[NDArray[int64], NDArray[int64]]:
+    # Gather the Selected Faces (In the Given Order) into a New Ragged Pair
+    sizes = ragged_sizes(offsets)[faces]
+    taken_offsets = concatenate(([0], cumsum(sizes, dtype=int64))).astype(int64)
+    # Shift Each Output Slot Back to the Start of its Source Face
+    gather = repeat(offsets[faces] - taken_offsets[:-1], sizes) + arange(taken_offsets[-1])
+    return (indices[gather], taken_offsets)
+
+def ragged_any_codes(codes: NDArray[int64], offsets: NDArray[int64]) -> NDArray[int64]:
+    # OR of the Per Index Region Codes of Each Face
+    if offsets.shape[0] <= 1:
+        return codes[:0]
+    return bitwise_or.reduceat(codes, offsets[:-1])
+
+def ragged_all_codes(codes: NDArray[int64], offsets: NDArray[int64]) -> NDArray[int64]:
+    # AND of the Per Index Region Codes of Each Face
+    if offsets.shape[0] <= 1:
+        return codes[:0]
+    return bitwise_and.reduceat(codes, offsets[:-1])
+
+def ragged_unique_edges(indices: NDArray[int64], offsets: NDArray[int64]) -> Tuple[NDArray[int64], NDArray[int64]]:
+    # Extract the Undirected (E, 2) Edges of Closed Faces - Returns the Edges and their Owner Faces
+    # Each Edge is Kept Once, Owned by the Last Face Using it (Later Faces Paint Over Earlier Ones)
+    edges = stack((indices, indices[ragged_following(offsets)]), axis=1)
+    edges.sort(axis=1)
+    # Key Edges by their Sorted Pair
+    keys = (edges[:, 0] * (int(indices.max(initial=0)) + 1)) + edges[:, 1]
+    (_, reversed_first) = unique(keys[::-1], return_index=True)
+    last = sort(indices.shape[0] - 1 - reversed_first)
+    return (edges[last], ragged_face_ids(offsets)[last])
+
+def ragged_signed_areas(points: NDArray[float64], indices: NDArray[int64], offsets: NDArray[int64]) -> NDArray[float64]:
+    # Shoelace Signed Area of Every Face over (V, 2) Points (Positive when Counter Clockwise)
+    if offsets.shape[0] <= 1:
+        return empty((0,), dtype=float64)
+    (current, following) = (points[indices], points[indices[ragged_following(offsets)]])
+    cross = (current[:, 0] * following[:, 1]) - (following[:, 0] * current[:, 1])
+    return 0.5 * add.reduceat(cross, offsets[:-1])
+
+def ragged_clip_faces(vertices: NDArray[float64], indices: NDArray[int64], offsets: NDArray[int64], codes: NDArray[int64], clip_face: Callable[[NDArray[float64]], NDArray[float64] | None]) -> Tuple[NDArray[float64], NDArray[int64], NDArray[int64], NDArray[int64]] | None:
+    # Clip Faces by their Vertices Outside Codes - Returns (Vertices, Indices, Offsets, Source Face of Each Face) or None when Nothing is Left
+    face_codes = codes[indices]
+    outside = ragged_all_codes(face_codes, offsets) != 0
+    inside = ragged_any_codes(face_codes, offsets) == 0
+    # Faces Inside Keep their Shared Vertices
+    (kept_faces,) = nonzero(inside)
+    (kept_indices, kept_offsets) = ragged_take(indices, offsets, kept_faces)
+    # Clip Faces Crossing the Border One by One
+    clipped_faces: List[int] = []
+    clipped_points: List[NDArray[float64]] = [vertices]
+    for face in nonzero(~(inside | outside))[0].tolist():
+        clipped = clip_face(vertices[indices[offsets[face]:offsets[face + 1]]])
+        if clipped is None:
+            continue
+        clipped_faces.append(face)
+        clipped_points.append(clipped)
+    # Check Nothing Left
+    if kept_faces.shape[0] == 0 and len(clipped_faces) == 0:
+        return None
+    # Clipped Faces Get their Own Vertices, Appended After the Shared Ones
+    clipped_sizes = array([points.shape[0] for points in clipped_points[1:]], dtype=int64)
+    faces = concatenate((kept_faces, array(clipped_faces, dtype=int64)))
+    indices = concatenate((kept_indices, vertices.shape[0] + arange(clipped_sizes.sum(), dtype=int64)))
+    offsets = concatenate((kept_offsets, kept_offsets[-1] + cumsum(clipped_sizes, dtype=int64)))
+    # Restore the Original Faces Order (Keeps the Painting Order of Filled Meshes)
+    order = argsort(faces, kind="stable")
+    (indices, offsets) = ragged_take(indices, offsets, order)
+    return (concatenate(clipped_points), indices, offsets, faces[order])
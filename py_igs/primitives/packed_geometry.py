@@ -0,0 +1,207 @@
+from __future__ import annotations
+from typing import Dict, List, TYPE_CHECKING, Tuple
+from numpy import arange, argsort, bool_, concatenate, cumsum, empty, float64, int64, maximum, minimum, nonzero, repeat, stack, zeros
+from numpy.typing import DTypeLike, NDArray
+from primitives.graphical_object import is_projected
+if TYPE_CHECKING:
+    from primitives.graphical_object import GraphicalObject
+
+class PackedBuffer:
+    # Define Initial Rows (Capacity Doubles when Full - Appends are Amortized O(1) per Row)
+    INITIAL_CAPACITY = 64
+    # Define Constructor
+    def __init__(self, width: int, dtype: DTypeLike = float64) -> None:
+        # Define Storage (Rows [0, size) are in Use, Released Rows are Garbage until Compacted)
+        self.rows = empty((PackedBuffer.INITIAL_CAPACITY, width), dtype=dtype)
+        self.size = 0
+        self.garbage = 0
+    # Define Private Methods
+    def __reserve(self, count: int) -> None:
+        # Keep One Spare Row (Range Ends Stay Valid reduceat Indexes)
+        required = self.size + count + 1
+        capacity = self.rows.shape[0]
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        grown = empty((capacity, self.rows.shape[1]), dtype=self.rows.dtype)
+        grown[:self.size] = self.rows[:self.size]
+        self.rows = grown
+    # Define Methods
+    def append(self, values: NDArray) -> int:
+        # Write Values at the End - Returns their Offset
+        self.__reserve(values.shape[0])
+        offset = self.size
+        self.rows[offset:offset + values.shape[0]] = values
+        self.size += values.shape[0]
+        return offset
+
+    def write(self, offset: int, length: int, values: NDArray) -> int:
+        # Same Size Ranges are Rewritten In Place, Others Move to the End - Returns the New Offset
+        if values.shape[0] == length:
+            self.rows[offset:offset + length] = values
+            return offset
+        self.release(length)
+        return self.append(values)
+
+    def release(self, length: int) -> None:
+        # Released Rows Stay in Place until the Next Compaction
+        self.garbage += length
+
+    def view(self, offset: int, length: int) -> NDArray:
+        return self.rows[offset:offset + length]
+
+    def needs_compaction(self) -> bool:
+        # Compact Once Garbage Outgrows the Live Rows
+        return self.garbage > max(self.size - self.garbage, PackedBuffer.INITIAL_CAPACITY)
+
+    def compact(self, offsets: NDArray[int64], lengths: NDArray[int64]) -> NDArray[int64]:
+        # Move the Live Ranges to the Front (Keeping their Order) - Returns their New Offsets
+        order = argsort(offsets, kind="stable")
+        ordered_lengths = lengths[order]
+        compacted = concatenate(([0], cumsum(ordered_lengths, dtype=int64)))
+        gather = repeat(offsets[order] - compacted[:-1], ordered_lengths) + arange(compacted[-1])
+        self.rows[:compacted[-1]] = self.rows[gather]
+        (self.size, self.garbage) = (int(compacted[-1]), 0)
+        new_offsets = empty(offsets.shape, dtype=int64)
+        new_offsets[order] = compacted[:-1]
+        return new_offsets
+
+# Define Object Table Columns
+TABLE_DIMENSION = 0
+TABLE_VERTEX_OFFSET = 1
+TABLE_VERTEX_LENGTH = 2
+TABLE_COLOR_OFFSET = 3
+TABLE_COLOR_LENGTH = 4
+TABLE_TYPE = 5
+TABLE_ALIVE = 6
+TABLE_WIDTH = 7
+
+class PackedGeometry:
+    # Define Constructor
+    def __init__(self) -> None:
+        # Define Scene Buffers (One Vertex Buffer per Dimension, Colors Hold One Row per Face or per Object)
+        self.vertices: Dict[int, PackedBuffer] = {2: PackedBuffer(2), 3: PackedBuffer(3)}
+        self.colors = PackedBuffer(4)
+        # Define Object Table (Row Index = Object Index, in Insertion Order)
+        self.table = PackedBuffer(TABLE_WIDTH, int64)
+        self.names: List[str | None] = []
+        self.objects: List[GraphicalObject | None] = []
+        self.indices: Dict[str, int] = {}
+        # Define Cached Bounds per Dimension (None When Stale)
+        self.bounds: Dict[int, Tuple[NDArray[int64], NDArray[float64], NDArray[bool_]] | None] = {2: None, 3: None}
+    # Define Private Methods
+    def __get_rows(self) -> NDArray[int64]:
+        return self.table.rows[:self.table.size]
+    def __invalidate(self, dimension: int) -> None:
+        self.bounds[dimension] = None
+    def __compact(self, dimension: int) -> None:
+        # Compact Buffers that Collected Too Much Garbage (Rewriting the Table Offsets)
+        rows = self.__get_rows()
+        alive = rows[:, TABLE_ALIVE] == 1
+        vertices = self.vertices[dimension]
+        if vertices.needs_compaction():
+            live = alive & (rows[:, TABLE_DIMENSION] == dimension)
+            rows[live, TABLE_VERTEX_OFFSET] = vertices.compact(rows[live, TABLE_VERTEX_OFFSET], rows[live, TABLE_VERTEX_LENGTH])
+        if self.colors.needs_compaction():
+            rows[alive, TABLE_COLOR_OFFSET] = self.colors.compact(rows[alive, TABLE_COLOR_OFFSET], rows[alive, TABLE_COLOR_LENGTH])
+        if self.table.needs_compaction():
+            # Drop Removed Rows and Reindex the Following Objects
+            (kept,) = nonzero(alive)
+            self.table.rows[:kept.shape[0]] = rows[kept]
+            (self.table.size, self.table.garbage) = (kept.shape[0], 0)
+            self.names = [self.names[row] for row in kept.tolist()]
+            self.objects = [self.objects[row] for row in kept.tolist()]
+            self.indices = {name: row for (row, name) in enumerate(self.names) if name is not None}
+            # Cached Bounds Refer to the Old Rows
+            self.bounds = {2: None, 3: None}
+    # Define Methods
+    def add(self, object_name: str, object_ref: GraphicalObject) -> None:
+        # Fetch Geometry
+        dimension = 3 if is_projected(object_ref) else 2
+        vertices = object_ref.get_vertices()
+        colors = object_ref.get_colors()
+        # Append Buffers and Table Row
+        vertex_offset = self.vertices[dimension].append(vertices)
+        color_offset = self.colors.append(colors)
+        self.indices[object_name] = self.table.append(table_row(dimension, vertex_offset, vertices.shape[0], color_offset, colors.shape[0], int(object_ref.get_type())))
+        self.names.append(object_name)
+        self.objects.append(object_ref)
+        self.__invalidate(dimension)
+
+    def remove(self, object_name: str) -> None:
+        # Release Buffers and Mark Row as Removed
+        index = self.indices.pop(object_name)
+        row = self.table.rows[index]
+        dimension = int(row[TABLE_DIMENSION])
+        self.vertices[dimension].release(int(row[TABLE_VERTEX_LENGTH]))
+        self.colors.release(int(row[TABLE_COLOR_LENGTH]))
+        self.table.release(1)
+        row[TABLE_ALIVE] = 0
+        (self.names[index], self.objects[index]) = (None, None)
+        self.__invalidate(dimension)
+        self.__compact(dimension)
+
+    def update(self, object_name: str, object_ref: GraphicalObject) -> None:
+        # Rewrite Buffers (Row Keeps its Place in the Draw Order)
+        row = self.table.rows[self.indices[object_name]]
+        dimension = int(row[TABLE_DIMENSION])
+        vertices = object_ref.get_vertices()
+        colors = object_ref.get_colors()
+        row[TABLE_VERTEX_OFFSET] = self.vertices[dimension].write(int(row[TABLE_VERTEX_OFFSET]), int(row[TABLE_VERTEX_LENGTH]), vertices)
+        row[TABLE_VERTEX_LENGTH] = vertices.shape[0]
+        row[TABLE_COLOR_OFFSET] = self.colors.write(int(row[TABLE_COLOR_OFFSET]), int(row[TABLE_COLOR_LENGTH]), colors)
+        row[TABLE_COLOR_LENGTH] = colors.shape[0]
+        self.__invalidate(dimension)
+        self.__compact(dimension)
+
+    def clear(self) -> None:
+        # Reset to an Empty Scene
+        self.__init__()
+
+    def get_vertices(self, object_name: str) -> NDArray[float64]:
+        # Return a View into the Scene Vertex Buffer
+        row = self.table.rows[self.indices[object_name]]
+        return self.vertices[int(row[TABLE_DIMENSION])].view(int(row[TABLE_VERTEX_OFFSET]), int(row[TABLE_VERTEX_LENGTH]))
+
+    def get_colors(self, object_name: str) -> NDArray[float64]:
+        # Return a View into the Scene Color Buffer
+        row = self.table.rows[self.indices[object_name]]
+        return self.colors.view(int(row[TABLE_COLOR_OFFSET]), int(row[TABLE_COLOR_LENGTH]))
+
+    def get_objects(self) -> List[GraphicalObject | None]:
+        # Objects by Row (Removed Rows are None)
+        return self.objects
+
+    def get_types(self) -> NDArray[int64]:
+        return self.__get_rows()[:, TABLE_TYPE]
+
+    def get_alive(self) -> NDArray[bool_]:
+        # Rows Still Holding an Object
+        return self.__get_rows()[:, TABLE_ALIVE] == 1
+
+    def get_bounds(self, dimension: int) -> Tuple[NDArray[int64], NDArray[float64], NDArray[bool_]]:
+        # Return (Rows, (R, 2, D) [Min, Max] Boxes, Has Box Mask) of the Live Objects in the Dimension Buffer
+        bounds = self.bounds[dimension]
+        if bounds is None:
+            rows = self.__get_rows()
+            (object_rows,) = nonzero((rows[:, TABLE_ALIVE] == 1) & (rows[:, TABLE_DIMENSION] == dimension))
+            (offsets, lengths) = (rows[object_rows, TABLE_VERTEX_OFFSET], rows[object_rows, TABLE_VERTEX_LENGTH])
+            buffer = self.vertices[dimension]
+            boxes = zeros((object_rows.shape[0], 2, dimension), dtype=float64)
+            if object_rows.shape[0] > 0:
+                # Reduce Every [Start, End) Range of the Buffer at Once (Odd Results Span the Gaps and are Dropped)
+                ranges = stack((offsets, offsets + lengths), axis=1).reshape(-1)
+                vertices = buffer.rows[:buffer.size + 1]
+                boxes[:, 0] = minimum.reduceat(vertices, ranges, axis=0)[::2]
+                boxes[:, 1] = maximum.reduceat(vertices, ranges, axis=0)[::2]
+            bounds = (object_rows, boxes, lengths > 0)
+            self.bounds[dimension] = bounds
+        return bounds
+
+def table_row(*values: int) -> NDArray[int64]:
+    # Build a Single Object Table Row (Alive)
+    row = zeros((1, TABLE_WIDTH), dtype=int64)
+    row[0, :len(values)] = values
+    row[0, TABLE_ALIVE] = 1
+    return row
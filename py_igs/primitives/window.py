@@ -1,17 +1,47 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, cast
 
 import cairo
-from numpy import array, float64
+from enum import IntEnum, unique
+from itertools import product
+from math import floor, log2
+from numpy import array, bool_, float64, full, int64, isin, nonzero, vstack, where, zeros
+from numpy.linalg import det, norm
 from objects.object_type import ObjectType
-from primitives.clipping_method import EClippingMethod
+from primitives.clipping_method import EClippingMethod, plane_distances
 from time import perf_counter_ns
 from primitives.graphical_object import is_projected
-from primitives.matrix import Matrix, Vector2, Vector3, Vector4, homo_coords2_matrix_rotate, homo_coords2_matrix_scale, homo_coords2_matrix_translate, homo_coords3_matrix_rotate_x, homo_coords3_matrix_rotate_xyz, homo_coords3_matrix_rotate_y, homo_coords3_matrix_rotate_z, homo_coords3_matrix_translate
+from primitives.matrix import Matrix, Vector2, Vector3, Vector4, transform_points, homo_coords2_matrix_rotate, homo_coords2_matrix_scale, homo_coords2_matrix_translate, homo_coords3_matrix_rotate_x, homo_coords3_matrix_rotate_xyz, homo_coords3_matrix_rotate_y, homo_coords3_matrix_rotate_z, homo_coords3_matrix_translate
 from numpy import float64, array
 from numpy.typing import NDArray
 if TYPE_CHECKING:
     from primitives.display_file import DisplayFile
+    from primitives.graphical_object import GraphicalObject
+    from primitives.packed_geometry import PackedGeometry
+
+# Define Bounding Box Regions
+@unique
+class EBoundingBoxRegion(IntEnum):
+    OUTSIDE = 0
+    PARTIAL = 1
+    INSIDE = 2
+
+# Define Box Corners Selectors ((2 ** D, D) Indexes into a (2, D) [Min, Max] Box)
+BOX_CORNERS_2D = array(list(product((0, 1), repeat=2)))
+BOX_CORNERS_3D = array(list(product((0, 1), repeat=3)))
+# Define Normalized Window Corners
+NORMALIZED_WINDOW_CORNERS = array(list(product((-1.0, 1.0), repeat=2)))
+# Define Default Near Plane (In Units of the Perspective Distance - W = 1 on the Window Plane)
+DEFAULT_NEAR_PLANE = 0.01
+# Define Types Returned by project() (Used to Select the Clipping Method)
+PROJECTED_OBJECT_TYPES = {
+    ObjectType.POINT_3D: ObjectType.POINT_2D,
+    ObjectType.LINE_3D: ObjectType.LINE_2D,
+    ObjectType.WIREFRAME_3D: ObjectType.WIREFRAME_2D,
+    ObjectType.OBJECT_3D: ObjectType.OBJECT_2D,
+    ObjectType.MESH_3D: ObjectType.MESH_2D,
+}
+
 class Window:
     # Initializes the Window
     def __init__(self, x_world_min: float, y_world_min: float, x_world_max: float, y_world_max: float, z_pos: float = 0) -> None:
@@ -25,6 +55,9 @@ class Window:
         self.center_y = y_world_min + (self.height / 2)
         self.center_z = z_pos
         self.perspective_distance = 0
+        # Define Transforms Cache (Entries are Tagged with the Version They Were Built For)
+        self.version = 0
+        self.transforms_cache: Dict[str, Tuple[int, Matrix]] = {}
         # Define Clip Methods
         self.cliping_methods = {
             ObjectType.POINT_2D: EClippingMethod.POINT_CLIP,
@@ -33,11 +66,29 @@ class Window:
             ObjectType.BEZIER_2D: EClippingMethod.LINE_COHEN_SUTHERLAND,
             ObjectType.BSPLINE_2D: EClippingMethod.LINE_COHEN_SUTHERLAND,
             ObjectType.OBJECT_2D: EClippingMethod.POLY_WEILER_ATHERTON_WITH_CS,
+            ObjectType.MESH_2D: EClippingMethod.POLY_WEILER_ATHERTON_WITH_CS,
             ObjectType.BEZIER_3D: EClippingMethod.LINE_COHEN_SUTHERLAND,
             ObjectType.BSPLINE_3D: EClippingMethod.LINE_COHEN_SUTHERLAND,
         }
         # Define Statistics
         self.show_stats = False
+        # Define Adaptive Curves Tolerance (In Device Pixels - None Uses the Fixed Accuracy)
+        self.adaptive_tolerance: float | None = None
+        # Define Back Face Culling of Filled Meshes
+        self.back_face_culling = False
+        # Define Perspective Depth Range (In Units of the Perspective Distance - None Disables the Far Plane)
+        self.near_plane = DEFAULT_NEAR_PLANE
+        self.far_plane: float | None = None
+    # Define Transforms Cache
+    def invalidate(self) -> None:
+        # Any View Change Makes Cached Transforms Stale
+        self.version += 1
+    def __get_cached_transform(self, key: str, build: Callable[[], Matrix]) -> Matrix:
+        cached = self.transforms_cache.get(key)
+        if cached is None or cached[0] != self.version:
+            cached = (self.version, build())
+            self.transforms_cache[key] = cached
+        return cached[1]
     # Define Getters and Setters
     def get_width(self) -> float:
         return self.width
@@ -45,6 +96,7 @@ class Window:
         return 1 / self.get_width()
     def set_width(self, width: float) -> None:
         self.width = width
+        self.invalidate()
     def get_height(self) -> float:
         return self.height
 
@@ -52,6 +104,7 @@ class Window:
         return 1 / self.get_height()
     def set_height(self, height: float) -> None:
         self.height = height
+        self.invalidate()
 
     def get_center(self) -> Vector3:
         # Return as Vector
@@ -61,12 +114,39 @@ class Window:
         self.center_x = center.get_x()
         self.center_y = center.get_y()
         self.center_z = center.get_z()
+        self.invalidate()
+
+    def get_perspective_distance(self) -> float:
+        return self.perspective_distance
+    def set_perspective_distance(self, distance: float) -> None:
+        self.perspective_distance = distance
+        self.invalidate()
+
+    def get_adaptive_tolerance(self) -> float | None:
+        return self.adaptive_tolerance
+    def set_adaptive_tolerance(self, tolerance: float | None) -> None:
+        self.adaptive_tolerance = tolerance
+
+    def get_back_face_culling(self) -> bool:
+        return self.back_face_culling
+    def set_back_face_culling(self, enabled: bool) -> None:
+        self.back_face_culling = enabled
+
+    def get_depth_range(self) -> Tuple[float, float | None]:
+        return (self.near_plane, self.far_plane)
+    def set_depth_range(self, near_plane: float, far_plane: float | None = None) -> None:
+        self.near_plane = near_plane
+        self.far_plane = far_plane
+
+    def get_rotation_transform(self) -> Matrix:
+        # Window Orientation (Shared by Vectors, Pan and Projection Center)
+        return self.__get_cached_transform("rotation", lambda: homo_coords3_matrix_rotate_xyz(self.theta_x, self.theta_y, self.theta_z))
 
     def get_vec_up(self) -> Vector3:
         # Get Initial Vec Up Vector
         vec_up = Vector3(0, self.height / 2, 0)
         # Rotate Vector to Match Standard
-        rotate = homo_coords3_matrix_rotate_xyz(self.theta_x, self.theta_y, self.theta_z)
+        rotate = self.get_rotation_transform()
         # Move to Window Center
         move_center = homo_coords3_matrix_translate(self.center_x, self.center_y, self.center_z)
         return (vec_up.as_vec4(1) * rotate * move_center).try_into_vec3()
@@ -80,7 +160,7 @@ class Window:
             # Get Initial Normal Vector
             vec_normal = Vector3(0, 0, -1)
             # Rotate Vector to Match Standard
-            rotate = homo_coords3_matrix_rotate_xyz(self.theta_x, self.theta_y, self.theta_z)
+            rotate = self.get_rotation_transform()
             # Move to Window Center
             move_center = homo_coords3_matrix_translate(self.center_x, self.center_y, self.center_z)
             return (vec_normal.as_vec4(1) * rotate * move_center).try_into_vec3()
@@ -91,7 +171,7 @@ class Window:
         vec_cop = self.get_center()
         if (self.perspective_distance != 0):
             transform = Vector3(0, 0, -self.perspective_distance).as_vec4(1)
-            transform *= homo_coords3_matrix_rotate_xyz(self.theta_x, self.theta_y, self.theta_z)
+            transform *= self.get_rotation_transform()
             vec_cop = (transform - vec_cop.as_vec4(1)).try_into_vec3()
         return vec_cop
 
@@ -101,42 +181,48 @@ class Window:
         # Compute Delta Vectors
         vector_delta = Vector3(dx, dy, dz).as_vec4(1)
         # Rotate Delta Vector
-        vector_delta *= homo_coords3_matrix_rotate_xyz(self.theta_x, self.theta_y, self.theta_z)
+        vector_delta *= self.get_rotation_transform()
         # Cast as Vector 2
         vector_delta = vector_delta.try_into_vec3()
         # Update Data
         self.center_x += vector_delta.get_x()
         self.center_y += vector_delta.get_y()
         self.center_z += vector_delta.get_z()
+        self.invalidate()
 
     def scale(self, scale_factor_x: float = 1, scale_factor_y: float = 1):
         # Scale Width and Height
         self.width *= scale_factor_x
         self.height *= scale_factor_y
+        self.invalidate()
 
     def rotate(self, theta_in_radians: float = 0):
         # Update Value
         self.theta_z += theta_in_radians
+        self.invalidate()
 
     def move(self, dx: float, dy: float, dz: float):
         # Compute Delta Vectors
         vector_delta = Vector3(dx, dy, dz).as_vec4(1)
         # Rotate Delta Vector
-        vector_delta *= homo_coords3_matrix_rotate_xyz(self.theta_x, self.theta_y, self.theta_z)
+        vector_delta *= self.get_rotation_transform()
         # Cast as Vector 2
         vector_delta = vector_delta.try_into_vec3()
         # Update Data
         self.center_x += vector_delta.get_x()
         self.center_y += vector_delta.get_y()
         self.center_z += vector_delta.get_z()
+        self.invalidate()
     
     def rotate_vertical(self, theta_in_radians: float = 0):
         # Update Value
         self.theta_x += theta_in_radians
+        self.invalidate()
 
     def rotate_horizontal(self,  theta_in_radians: float = 0):
         # Update Value
         self.theta_y += theta_in_radians
+        self.invalidate()
 
     def rotate_x(self, tx: float = 0):
         #  Define Desired Rotation
@@ -155,6 +241,7 @@ class Window:
         self.theta_x += theta_x
         self.theta_y += theta_y
         self.theta_z += theta_z
+        self.invalidate()
 
     # Define Corners
     def get_corner_bottom_left(self) -> Vector2:
@@ -162,8 +249,26 @@ class Window:
         corner_bl = Vector2(self.center_x - (self.width / 2), self.center_y - (self.height / 2))
         return (corner_bl * rotation).try_into_vec2()
 
+    # Define Cached Transforms
+    def as_normalized_coordinates_transform(self) -> Matrix:
+        return self.__get_cached_transform("normalize", self.__build_normalized_coordinates_transform)
+
+    def as_parallel_projection_transform(self) -> Matrix:
+        return self.__get_cached_transform("parallel", self.__build_parallel_projection_transform)
+
+    def as_perspective_projection_transform(self) -> Matrix:
+        return self.__get_cached_transform("perspective", self.__build_perspective_projection_transform)
+
+    def as_projection_transform(self) -> Matrix:
+        # Select Projection by the Perspective Distance
+        return self.as_parallel_projection_transform() if self.perspective_distance == 0 else self.as_perspective_projection_transform()
+
+    def as_world_to_normalized_transform(self) -> Matrix:
+        # Fused 3D World -> Normalized Window Transform (Apply with transform_points and Keep [:, :2])
+        return self.__get_cached_transform("world_to_normalized", self.__build_world_to_normalized_transform)
+
     # Define Normalized World Coordinates System
-    def as_normalized_coordinates_transform(self):
+    def __build_normalized_coordinates_transform(self) -> Matrix:
         # Define World Center
         world_center = self.get_center()
         (center_x, center_y, _) = world_center.as_tuple()
@@ -178,7 +283,7 @@ class Window:
         # Return as Transform
         return translate_origin * rotate_minus_theta * normalize_scale
 
-    def as_parallel_projection_transform(self): 
+    def __build_parallel_projection_transform(self) -> Matrix:
         # Define VRP - View Reference Poin
         vrp_center = self.get_projection_ref_center()
         (center_x, center_y, center_z) = vrp_center.as_tuple()
@@ -192,7 +297,7 @@ class Window:
         # Return as Transform
         return translate_origin * rotate_minus_theta
 
-    def as_perspective_projection_transform(self):
+    def __build_perspective_projection_transform(self) -> Matrix:
         # Define VRP - View Reference Poin
         vrp_center = self.get_projection_ref_center()
         (vrp_center_x, vrp_center_y, vrp_center_z) = vrp_center.as_tuple()
@@ -209,10 +314,150 @@ class Window:
         # Return as Transform
         return translate_origin * rotate_minus_theta * intersection
 
+    def __build_world_to_normalized_transform(self) -> Matrix:
+        # Project then Normalize (Single Perspective Divide)
+        return self.as_projection_transform() * Window.lift_transform(self.as_normalized_coordinates_transform())
+
+    @staticmethod
+    def lift_transform(transformation: Matrix) -> Matrix:
+        # Lift a 2D Transform into the Projected Homogeneous Space ((X, Y, Z, W) -> (x * W, y * W, Z, W))
+        elements = transformation.elements
+        lifted: NDArray[float64] = array([
+            [elements[0, 0], elements[0, 1], 0, 0],
+            [elements[1, 0], elements[1, 1], 0, 0],
+            [0,              0,              1, 0],
+            [elements[2, 0], elements[2, 1], 0, 1]
+        ], dtype=float64)
+        return Matrix(lifted)
+
+    # Define Culling
+    def get_view_footprint(self, normalize: Matrix) -> Tuple[float, float, float, float]:
+        # Map Normalized Window Corners Back into World Coordinates
+        corners = transform_points(NORMALIZED_WINDOW_CORNERS, normalize.as_inverse())
+        ((x_min, y_min), (x_max, y_max)) = (corners.min(axis=0).tolist(), corners.max(axis=0).tolist())
+        return (x_min, y_min, x_max, y_max)
+
+    def get_depth_planes(self, world_to_normalized: Matrix) -> NDArray[float64] | None:
+        # Parallel Projections Keep Every Depth
+        if self.perspective_distance == 0:
+            return None
+        # Write the Depth Range (near <= W <= far) as Homogeneous Planes over World Coordinates
+        homo_w = world_to_normalized.elements[:, 3]
+        unit_w: NDArray[float64] = array([0, 0, 0, 1], dtype=float64)
+        planes = [homo_w - (self.near_plane * unit_w)]
+        if self.far_plane is not None:
+            planes.append((self.far_plane * unit_w) - homo_w)
+        return array(planes, dtype=float64)
+
+    def get_frustum_planes(self, world_to_normalized: Matrix, depth_planes: NDArray[float64] | None) -> NDArray[float64]:
+        # Write Window Borders (side * X <= W) as Planes over World Coordinates
+        fused = world_to_normalized.elements
+        side_planes: NDArray[float64] = array([
+            fused[:, 3] - (side * fused[:, axis])
+            for axis in (0, 1)
+            for side in (-1, 1)
+        ], dtype=float64)
+        # Close the Volume with the Depth Planes (Side Planes First)
+        planes = side_planes if depth_planes is None else vstack((side_planes, depth_planes))
+        # Scale Planes to Unit Normals (Distances in World Units)
+        return planes / norm(planes[:, :3], axis=1, keepdims=True)
+
+    def get_frustum_regions(self, drawable_object: GraphicalObject, frustum_planes: NDArray[float64]) -> NDArray[int64]:
+        # Objects without Geometry are Outside Every Plane
+        sphere = drawable_object.get_bounding_sphere()
+        if sphere is None:
+            return full((frustum_planes.shape[0],), EBoundingBoxRegion.OUTSIDE, dtype=int64)
+        # Classify the Cached Box and Sphere as a Batch of One
+        (center, radius) = sphere
+        box = cast(NDArray[float64], drawable_object.get_bounding_box())
+        return self.get_boxes_frustum_regions(box[None], center[None], array([radius]), frustum_planes)[0]
+
+    def get_boxes_frustum_regions(self, boxes: NDArray[float64], centers: NDArray[float64], radii: NDArray[float64], frustum_planes: NDArray[float64]) -> NDArray[int64]:
+        # Compare the Bounding Sphere of Each (R, 2, 3) Box with Each Plane ((R, P) Regions)
+        distances = plane_distances(centers, frustum_planes)
+        radii = radii[:, None]
+        regions = where(distances >= radii, EBoundingBoxRegion.INSIDE, where(distances < -radii, EBoundingBoxRegion.OUTSIDE, EBoundingBoxRegion.PARTIAL))
+        # Refine Planes Crossing the Spheres with the Box Corners
+        crossing = regions == EBoundingBoxRegion.PARTIAL
+        crossing_rows = crossing.any(axis=1)
+        if crossing_rows.any():
+            corners = boxes[crossing_rows][:, BOX_CORNERS_3D, (0, 1, 2)]
+            outside = (plane_distances(corners.reshape((-1, 3)), frustum_planes) < 0).reshape((corners.shape[0], BOX_CORNERS_3D.shape[0], frustum_planes.shape[0]))
+            refined = where(outside.all(axis=1), EBoundingBoxRegion.OUTSIDE, where(outside.any(axis=1), EBoundingBoxRegion.PARTIAL, EBoundingBoxRegion.INSIDE))
+            regions[crossing_rows] = where(crossing[crossing_rows], refined, regions[crossing_rows])
+        return regions
+
+    def get_bounding_box_region(self, drawable_object: GraphicalObject, normalize: Matrix) -> EBoundingBoxRegion:
+        # Classify the Cached Box as a Batch of One
+        box = drawable_object.get_bounding_box()
+        boxes = zeros((1, 2, 2), dtype=float64) if box is None else box[None]
+        return EBoundingBoxRegion(int(self.get_boxes_regions(boxes, array([box is not None]), normalize)[0]))
+
+    def get_boxes_regions(self, boxes: NDArray[float64], has_box: NDArray[bool_], normalize: Matrix) -> NDArray[int64]:
+        # Normalize the Corners of Each (R, 2, 2) Box at Once
+        corners = transform_points(boxes[:, BOX_CORNERS_2D, (0, 1)].reshape((-1, 2)), normalize).reshape((boxes.shape[0], BOX_CORNERS_2D.shape[0], 2))
+        (corners_min, corners_max) = (corners.min(axis=1), corners.max(axis=1))
+        # Compare with the Normalized Window (Objects without Geometry are Never Drawn)
+        outside = (corners_max < -1).any(axis=1) | (corners_min > 1).any(axis=1) | ~has_box
+        inside = (corners_min >= -1).all(axis=1) & (corners_max <= 1).all(axis=1)
+        return where(outside, EBoundingBoxRegion.OUTSIDE, where(inside, EBoundingBoxRegion.INSIDE, EBoundingBoxRegion.PARTIAL))
+
+    def get_packed_regions(self, packed_geometry: PackedGeometry, normalize: Matrix, frustum_planes: NDArray[float64]) -> Tuple[NDArray[int64], NDArray[int64]]:
+        # Removed Rows Stay Outside
+        count = len(packed_geometry.get_objects())
+        box_regions = full((count,), EBoundingBoxRegion.OUTSIDE, dtype=int64)
+        depth_regions = full((count,), EBoundingBoxRegion.INSIDE, dtype=int64)
+        # Classify Every 2D Object Against the Window in a Single Pass
+        (rows, boxes, has_box) = packed_geometry.get_bounds(2)
+        box_regions[rows] = self.get_boxes_regions(boxes, has_box, normalize)
+        # Classify Every 3D Object Against the Frustum in a Single Pass (Side Planes First)
+        (rows, boxes, has_box) = packed_geometry.get_bounds(3)
+        (centers, radii) = (boxes.mean(axis=1), norm(boxes[:, 1] - boxes[:, 0], axis=1) / 2)
+        plane_regions = self.get_boxes_frustum_regions(boxes, centers, radii, frustum_planes)
+        # Objects without Geometry are Outside Every Plane
+        plane_regions[~has_box] = EBoundingBoxRegion.OUTSIDE
+        box_regions[rows] = plane_regions[:, :4].min(axis=1, initial=EBoundingBoxRegion.INSIDE)
+        depth_regions[rows] = plane_regions[:, 4:].min(axis=1, initial=EBoundingBoxRegion.INSIDE)
+        return (box_regions, depth_regions)
+
+    def get_object_regions(self, drawable_object: GraphicalObject, normalize: Matrix, frustum_planes: NDArray[float64]) -> Tuple[EBoundingBoxRegion, EBoundingBoxRegion]:
+        # Disabled Clipping Draws the Object Whatever its Box
+        object_type = drawable_object.get_type()
+        clipping_method = self.cliping_methods[PROJECTED_OBJECT_TYPES.get(object_type, object_type)]
+        if is_projected(drawable_object):
+            # Test 3D Objects Against the Frustum Before Projecting (Depth Range Applies Even Without 2D Clipping)
+            plane_regions = self.get_frustum_regions(drawable_object, frustum_planes)
+            box_region = (
+                EBoundingBoxRegion.PARTIAL
+                if clipping_method is EClippingMethod.NONE
+                else EBoundingBoxRegion(int(plane_regions[:4].min()))
+            )
+            return (box_region, EBoundingBoxRegion(int(plane_regions[4:].min(initial=EBoundingBoxRegion.INSIDE))))
+        box_region = (
+            EBoundingBoxRegion.PARTIAL
+            if clipping_method is EClippingMethod.NONE
+            else self.get_bounding_box_region(drawable_object, normalize)
+        )
+        return (box_region, EBoundingBoxRegion.INSIDE)
+
+    def get_unclipped_types(self) -> List[int]:
+        # Object Types whose Clipping is Disabled (3D Types Follow their Projected Type)
+        return [int(object_type) for object_type in ObjectType if self.cliping_methods.get(PROJECTED_OBJECT_TYPES.get(object_type, object_type)) is EClippingMethod.NONE]
+
+    # Define Level of Detail
+    def get_tessellation_tolerance(self, world_to_device: Matrix) -> float | None:
+        if self.adaptive_tolerance is None:
+            return None
+        # World Units per Device Pixel (Along the Most Stretched Direction)
+        pixel_size = 1 / norm(world_to_device.elements[:2, :2], 2)
+        # Round Down to a Power of Two (Small Zooms Keep the Cached Tessellations)
+        return self.adaptive_tolerance * (2 ** floor(log2(pixel_size)))
+
     # Define Rendering
     def draw(self, cairo: cairo.Context, display_file: DisplayFile, viewport_transform: Matrix) -> None:
         comp_norm_time = 0
         comp_proj_time = 0
+        cull_time = 0
         proj_time = 0
         norm_time = 0
         clip_time = 0
@@ -223,33 +468,90 @@ class Window:
         comp_norm_time = perf_counter_ns() - time
         # Compute 3D Porjection for the Window
         time = perf_counter_ns()
-        project = self.as_parallel_projection_transform() if self.perspective_distance == 0 else self.as_perspective_projection_transform()
+        world_to_normalized = self.as_world_to_normalized_transform()
         comp_proj_time = perf_counter_ns() - time
+        # Compose Viewport into Both Transforms (Objects Inside the Window Skip Clipping, so Go Straight to the Device)
+        normalized_to_device = normalize * viewport_transform
+        world_to_device = world_to_normalized * Window.lift_transform(viewport_transform)
+        # Compute Perspective Depth Planes (Clipped Before the Perspective Divide)
+        depth_planes = self.get_depth_planes(world_to_normalized)
+        # Compute View Frustum Planes (Window Borders and Depth Range)
+        frustum_planes = self.get_frustum_planes(world_to_normalized, depth_planes)
+        # Compute Curves Tolerance for the Current Zoom
+        tessellation_tolerance = self.get_tessellation_tolerance(normalized_to_device)
+        # Device Windows with a Flipped Axis Reverse the Faces Winding
+        device_mirrored = bool(det(viewport_transform.elements[:2, :2]) < 0)
         # Draw Display File Objects
         render_all = perf_counter_ns()
-        for drawable_object in display_file.get_drawable_objects():
+        time = perf_counter_ns()
+        packed_geometry = display_file.packed_geometry
+        if packed_geometry is not None:
+            # Cull the Whole Scene from the Packed Bounds (Rows Keep the Draw Order)
+            (box_regions, depth_regions) = self.get_packed_regions(packed_geometry, normalize, frustum_planes)
+            box_regions[isin(packed_geometry.get_types(), self.get_unclipped_types())] = EBoundingBoxRegion.PARTIAL
+            (rows,) = nonzero(packed_geometry.get_alive() & (box_regions != EBoundingBoxRegion.OUTSIDE) & (depth_regions != EBoundingBoxRegion.OUTSIDE))
+            packed_objects = packed_geometry.get_objects()
+            culled_objects = [
+                (cast("GraphicalObject", packed_objects[row]), EBoundingBoxRegion(box_region), EBoundingBoxRegion(depth_region))
+                for (row, box_region, depth_region) in zip(rows.tolist(), box_regions[rows].tolist(), depth_regions[rows].tolist())
+            ]
+        else:
+            # Query Objects Around the Window (Disabled Clipping Draws Everything)
+            drawable_objects = (
+                display_file.get_drawable_objects()
+                if any(method is EClippingMethod.NONE for method in self.cliping_methods.values())
+                else display_file.query_drawable_objects(self.get_view_footprint(normalize), frustum_planes)
+            )
+            # Cull Each Object by its Bounding Volume (Unless Clipping is Disabled)
+            culled_objects = [
+                (drawable_object, *self.get_object_regions(drawable_object, normalize, frustum_planes))
+                for drawable_object in drawable_objects
+            ]
+        cull_time += perf_counter_ns() - time
+        for (drawable_object, box_region, depth_region) in culled_objects:
+            if box_region is EBoundingBoxRegion.OUTSIDE or depth_region is EBoundingBoxRegion.OUTSIDE:
+                continue
+            object_type = drawable_object.get_type()
+            clipping_method = self.cliping_methods[PROJECTED_OBJECT_TYPES.get(object_type, object_type)]
+            # Objects Inside the Window are Transformed Straight into the Device Window
+            inside = box_region is EBoundingBoxRegion.INSIDE
             # Draw Object - Start Pipeline
             time = perf_counter_ns()
+            drawable_object.set_tessellation_tolerance(tessellation_tolerance)
             drawable_object.pipeline()
-            # 3D Transform
-            if is_projected(drawable_object): 
-                drawable_object = drawable_object.project(project)
-            proj_time += perf_counter_ns() - time
-            # Normalize - World -> Generic Window
-            time = perf_counter_ns()
-            drawable_object.transform(normalize)
-            norm_time += perf_counter_ns() - time
+            if is_projected(drawable_object):
+                # Clip Objects Crossing the Depth Range in Homogeneous Space
+                if depth_region is EBoundingBoxRegion.PARTIAL and drawable_object.clip_depth(cast(NDArray[float64], depth_planes)) is None:
+                    drawable_object.pipeline_abort()
+                    continue
+                # 3D Transform - Project and Normalize in a Single Pass
+                source_object = drawable_object
+                drawable_object = source_object.project(world_to_device if inside else world_to_normalized)
+                # Projected Copies Leave the 3D Source Behind - Discard its Depth Clipped Pipeline State
+                if drawable_object is not source_object:
+                    source_object.pipeline_abort()
+                # Drop Back Faces Before Clipping
+                if self.back_face_culling:
+                    drawable_object.cull_back_faces(inside and device_mirrored)
+                proj_time += perf_counter_ns() - time
+            else:
+                # Normalize - World -> Generic Window
+                drawable_object.transform(normalized_to_device if inside else normalize)
+                norm_time += perf_counter_ns() - time
             time = perf_counter_ns()
-            # Future Feature - Clipping
-            # print("Line: ", drawable_object)
-            clipping_method = self.cliping_methods[drawable_object.get_type()]
-            clipped_object = drawable_object.clip(clipping_method)
+            # Clip Only Objects Crossing the Window Border
+            clipped_object = (
+                drawable_object
+                if inside
+                else drawable_object.clip(clipping_method)
+            )
             clip_time += perf_counter_ns() - time
             # Check if need render
             if clipped_object is not None:
                 time = perf_counter_ns()
                 # Viewport - Generic Window -> Device Window
-                clipped_object.transform(viewport_transform)
+                if not inside:
+                    clipped_object.transform(viewport_transform)
                 # Draw in Device Window
                 clipped_object.draw(cairo)
                 draw_time += perf_counter_ns() - time
@@ -264,6 +566,7 @@ class Window:
             print("------------------------------")
             print(f"Normal Mat Time:   \t{(comp_norm_time/1000000):07.3f} ms")
             print(f"Project Mat Time:  \t{(comp_proj_time/1000000):07.3f} ms")
+            print(f"Culling Time:      \t{(cull_time/1000000):07.3f} ms")
             print(f"Projection Time:   \t{(proj_time/1000000):07.3f} ms")
             print(f"Normalization Time:\t{(norm_time/1000000):07.3f} ms")
             print(f"Clipping Time:     \t{(clip_time/1000000):07.3f} ms")
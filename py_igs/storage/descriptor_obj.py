@@ -4,16 +4,17 @@ from math import floor, sqrt
 from pathlib import Path
 from typing import Dict, List, Tuple, cast
 from pathlib import Path
+from numpy import array, float64
 from helpers import chunks_non_null
 from objects.bezier_3d import Bezier3D
 from objects.bspline_2d import BSpline2D
 from objects.bezier_2d import Bezier2D
 from objects.bspline_3d import BSpline3D
+from objects.mesh_3d import Mesh3D
 from objects.object_3d import Object3D
 from objects.point_2d import Point2D
 from objects.line_2d import Line2D
 from objects.wireframe_2d import Wireframe2D
-from objects.wireframe_3d import Wireframe3D
 from primitives.display_file import DisplayFile
 from primitives.graphical_object import GraphicalObject
 from primitives.matrix import Vector2, Vector3
@@ -54,6 +55,8 @@ class DescriptorOBJ:
         current_reading_material = "loaded_material"
         current_using_material: str | None = None
         current_curve_type: str = "bspline"
+        # Define Meshes Being Loaded (Placeholder, Vertex Index Map, Vertices, Faces, Face Colors)
+        meshes: Dict[str, Tuple[GraphicalObject, Dict[int, int], List[Tuple[float, float, float]], List[List[int]], List[Tuple[float, float, float, float]]]] = dict()
         # Read File
         with file_path.open() as file:
             # Iterate over Lines
@@ -131,41 +134,40 @@ class DescriptorOBJ:
                     else:
                         objects[current_object] = curve
                 elif line.startswith("f "):
-                    # Face (Triangle)
+                    # Face (Indexed into the Object Mesh)
                     # Get Values List
                     _, *values = [el for el in line.strip("\n").split(" ") if len(el) > 0]
-                    # Parse Triangle Vertices
+                    # Parse Face Vertices
                     vectors = [int(value.split("/")[0]) for value in values]
-                    # Load Vertices
-                    vectors = [vertices_positions[v_idx - 1] for v_idx in vectors]
-                    vectors = [
-                        Vector3(
-                            (vx * (0.5 * window_width if is_normalized else 1)) + window_center.get_x(),
-                            (vy * (0.5 * window_height if is_normalized else 1)) + window_center.get_y(),
-                            (vz * (0.5 * window_height if is_normalized else 1)) + window_center.get_z()
-                        )
-                        for (vx, vy, vz) in vectors
-                    ]
-                    # Define Triangle
-                    triangle = Wireframe3D(*vectors)
-                    # Fill Faces
-                    triangle.set_filled(fill_faces)
+                    # Get Object Mesh (Placeholder Reserves the Object Order Until the Mesh is Built)
+                    mesh_name = "loaded_object" if current_object is None else current_object
+                    mesh = meshes.get(mesh_name)
+                    if mesh is None or objects.get(mesh_name) is not mesh[0]:
+                        mesh = (Object3D(), dict(), [], [], [])
+                        meshes[mesh_name] = mesh
+                        objects[mesh_name] = mesh[0]
+                    (_, mesh_indices, mesh_vertices, mesh_faces, mesh_colors) = mesh
+                    # Load Each Shared Vertex Once
+                    face: List[int] = []
+                    for v_idx in vectors:
+                        if v_idx not in mesh_indices:
+                            (vx, vy, vz) = vertices_positions[v_idx - 1]
+                            mesh_indices[v_idx] = len(mesh_vertices)
+                            mesh_vertices.append((
+                                (vx * (0.5 * window_width if is_normalized else 1)) + window_center.get_x(),
+                                (vy * (0.5 * window_height if is_normalized else 1)) + window_center.get_y(),
+                                (vz * (0.5 * window_height if is_normalized else 1)) + window_center.get_z()
+                            ))
+                        face.append(mesh_indices[v_idx])
+                    # Add Face to the Mesh
+                    mesh_faces.append(face)
                     # Check Color
                     if current_using_material is not None:
-                        # Update Object Material
+                        # Face Material
                         material_kd_rgb = materials[current_using_material]
-                        triangle.set_color((*material_kd_rgb, 1))
-                    # Add Triangle to Objects
-                    if current_object is None:
-                        if "loaded_object" in objects.keys():
-                            cast(Object3D, objects["loaded_object"]).wireframes.append(triangle)
-                        else:
-                            objects["loaded_object"] = Object3D(triangle)
+                        mesh_colors.append((*material_kd_rgb, 1))
                     else:
-                        if current_object in objects.keys() and isinstance(objects[current_object], Object3D):
-                            cast(Object3D, objects[current_object]).wireframes.append(triangle)
-                        else:
-                            objects[current_object] = Object3D(triangle)
+                        mesh_colors.append((1, 1, 1, 1))
                 elif line.startswith("p "):
                     # Point
                     # Get Point Data
@@ -278,6 +280,12 @@ class DescriptorOBJ:
                     # No Behaviour
                     if DISPLAY_UNDEFINED_FIELDS:
                         print(f"Unrecognize Field: {line.strip()}")
+        # Build Meshes Still in Place
+        for (mesh_name, (placeholder, _, mesh_vertices, mesh_faces, mesh_colors)) in meshes.items():
+            if objects.get(mesh_name) is placeholder:
+                mesh = Mesh3D.from_faces(array(mesh_vertices, dtype=float64), mesh_faces, mesh_colors)
+                mesh.set_filled(fill_faces)
+                objects[mesh_name] = mesh
         # Create Class
         return DescriptorOBJ(objects, (window_center, window_width, window_height))
 
@@ -311,7 +319,7 @@ class DescriptorOBJ:
             # Normalized Object
             object_graphics.pipeline()
             if isinstance(object_graphics, Point2D):
-                points = [object_graphics.pipeline_point]
+                points = [object_graphics.get_point()]
                 vertex_idxs: List[int] = []
                 for point in points:
                     vertices.append(point.as_vec3(1))
@@ -331,7 +339,7 @@ class DescriptorOBJ:
                 object_lines.append("\n".join(content))
                 materials.append("\n".join(material_lines))
             elif isinstance(object_graphics, Line2D):
-                points = [object_graphics.pipeline_point_a, object_graphics.pipeline_point_b]
+                points = object_graphics.get_points()
                 vertex_idxs: List[int] = []
                 for point in points:
                     vertices.append(point.as_vec3(1))
@@ -351,7 +359,7 @@ class DescriptorOBJ:
                 object_lines.append("\n".join(content))
                 materials.append("\n".join(material_lines))
             elif isinstance(object_graphics, Bezier2D):
-                points = object_graphics.control_points
+                points = object_graphics.get_control_points()
                 vertex_idxs: List[int] = []
                 for point in points:
                     vertices.append(point.as_vec3(1))
@@ -372,7 +380,7 @@ class DescriptorOBJ:
                 object_lines.append("\n".join(content))
                 materials.append("\n".join(material_lines))
             elif isinstance(object_graphics, BSpline2D):
-                points = object_graphics.control_points
+                points = object_graphics.get_control_points()
                 vertex_idxs: List[int] = []
                 for point in points:
                     vertices.append(point.as_vec3(1))
@@ -393,7 +401,7 @@ class DescriptorOBJ:
                 object_lines.append("\n".join(content))
                 materials.append("\n".join(material_lines))
             elif isinstance(object_graphics, Wireframe2D):
-                points = object_graphics.pipeline_points
+                points = object_graphics.get_points()
                 is_triangle = len(points) == 3
                 vertex_idxs: List[int] = []
                 for point in points:
@@ -414,7 +422,7 @@ class DescriptorOBJ:
                 object_lines.append("\n".join(content))
                 materials.append("\n".join(material_lines))
             elif isinstance(object_graphics, Object3D):
-                wf_points = [wf.pipeline_points for wf in object_graphics.wireframes]
+                wf_points = [wf.get_points() for wf in object_graphics.wireframes]
                 # Declare Objects
                 content: List[str] = []
                 material_lines: List[str] = []
@@ -436,6 +444,33 @@ class DescriptorOBJ:
                 # Save Into List
                 object_lines.append("\n".join(content))
                 materials.append("\n".join(material_lines))
+            elif isinstance(object_graphics, Mesh3D):
+                # Shared Vertices are Written Once
+                vertex_base = len(vertices)
+                vertices.extend(object_graphics.get_points())
+                # Declare Objects
+                content: List[str] = []
+                material_lines: List[str] = []
+                material_names: Dict[Tuple[float, ...], str] = dict()
+                # Stringify Objects
+                content.append(f"o {object_name}")
+                current_material: str | None = None
+                for (face, face_color) in zip(object_graphics.get_faces(), object_graphics.face_colors.tolist()):
+                    # Declare Materials (One per Distinct Face Color)
+                    (kd_r, kd_g, kd_b, *_) = face_color
+                    material_key = (kd_r, kd_g, kd_b)
+                    if material_key not in material_names:
+                        material_names[material_key] = f"mtl_{object_name.strip()}_{len(material_names)}"
+                        material_lines.append(f"newmtl {material_names[material_key]}")
+                        material_lines.append(f"Kd {float(kd_r)} {float(kd_g)} {float(kd_b)}")
+                    # Declare Face
+                    if current_material != material_names[material_key]:
+                        current_material = material_names[material_key]
+                        content.append(f"usemtl {current_material}")
+                    content.append("f " + " ".join(str(vertex_base + idx + 1) for idx in face))
+                # Save Into List
+                object_lines.append("\n".join(content))
+                materials.append("\n".join(material_lines))
         # Serialize Vertices
         vertices_serialized = "\n".join([f"v {vertex.get_x()} {vertex.get_y()} 0" for vertex in vertices])
         object_lines_serialized = "\n".join(object_lines)